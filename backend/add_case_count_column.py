@@ -0,0 +1,47 @@
+"""Migration script to add case_count column to case_sets table."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+async def add_case_count_column():
+    """Add case_count column to case_sets table and backfill it from test_cases."""
+
+    async with engine.begin() as conn:
+        # Check if column already exists
+        result = await conn.execute(text("""
+            SELECT COUNT(*) as count
+            FROM pragma_table_info('case_sets')
+            WHERE name = 'case_count'
+        """))
+        row = result.fetchone()
+
+        if row and row[0] > 0:
+            print("Column 'case_count' already exists in case_sets table.")
+            return
+
+        # Add the column
+        await conn.execute(text("""
+            ALTER TABLE case_sets
+            ADD COLUMN case_count INTEGER NOT NULL DEFAULT 0
+        """))
+
+        # Backfill existing counts
+        await conn.execute(text("""
+            UPDATE case_sets
+            SET case_count = (
+                SELECT COUNT(*) FROM test_cases WHERE test_cases.set_id = case_sets.id
+            )
+        """))
+        print("Added 'case_count' column to case_sets table.")
+
+
+if __name__ == "__main__":
+    asyncio.run(add_case_count_column())
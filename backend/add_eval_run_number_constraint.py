@@ -0,0 +1,41 @@
+"""Add unique (task_id, run_number) index to eval_runs table.
+
+Run this script to add the index to an existing eval_runs table. Run numbers
+are allocated as max(run_number) + 1 per task, and the index both serves that
+lookup and rejects two runs of a task taking the same number.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+async def add_eval_run_number_constraint():
+    """Add uq_eval_run_task_number unique index to eval_runs table."""
+    async with engine.begin() as conn:
+        result = await conn.execute(text(
+            "SELECT task_id, run_number, COUNT(*) FROM eval_runs "
+            "GROUP BY task_id, run_number HAVING COUNT(*) > 1"
+        ))
+        duplicates = result.fetchall()
+        if duplicates:
+            print("Found duplicate run numbers, please clean them up first:")
+            for task_id, run_number, count in duplicates:
+                print(f"  task_id={task_id} run_number={run_number} count={count}")
+            return
+
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_eval_run_task_number "
+            "ON eval_runs (task_id, run_number)"
+        ))
+        print("Successfully ensured unique index 'uq_eval_run_task_number' on eval_runs table.")
+
+
+if __name__ == "__main__":
+    asyncio.run(add_eval_run_number_constraint())
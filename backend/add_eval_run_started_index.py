@@ -0,0 +1,36 @@
+"""Add (task_id, started_at) indexes to eval_runs table.
+
+Run this script to add the indexes to an existing eval_runs table. Together
+they let the SSE stream's reusable-run lookup read only a task's recent and
+in-progress runs instead of scanning its whole run history.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+async def add_eval_run_started_index():
+    """Add ix_eval_runs_task_started and ix_eval_runs_task_active to eval_runs table."""
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_eval_runs_task_started "
+            "ON eval_runs (task_id, started_at)"
+        ))
+        # Partial index: only in-progress runs, so it stays small as history grows
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_eval_runs_task_active "
+            "ON eval_runs (task_id, started_at) "
+            "WHERE status IN ('PENDING', 'RUNNING')"
+        ))
+        print("Successfully ensured indexes 'ix_eval_runs_task_started' and 'ix_eval_runs_task_active' on eval_runs table.")
+
+
+if __name__ == "__main__":
+    asyncio.run(add_eval_run_started_index())
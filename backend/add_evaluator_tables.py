@@ -52,9 +52,14 @@ async def create_task_evaluators_table():
 async def create_indexes():
     """Create indexes for performance."""
     async with engine.begin() as conn:
+        # (task_id, order_index) serves the ordered per-task lookup and
+        # supersedes the old task_id-only index
         await conn.execute(text("""
-            CREATE INDEX IF NOT EXISTS idx_task_evaluators_task_id
-            ON task_evaluators(task_id)
+            DROP INDEX IF EXISTS idx_task_evaluators_task_id
+        """))
+        await conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_task_evaluators_task_order
+            ON task_evaluators(task_id, order_index)
         """))
         await conn.execute(text("""
             CREATE INDEX IF NOT EXISTS idx_task_evaluators_evaluator_id
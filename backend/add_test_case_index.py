@@ -0,0 +1,30 @@
+"""Add composite (set_id, created_at, id) index to test_cases table.
+
+Run this script to add the index to an existing test_cases table. It replaces
+the earlier (set_id, created_at) index, which the new one covers.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+async def add_test_case_index():
+    """Add ix_test_cases_set_created_id index to test_cases table."""
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP INDEX IF EXISTS ix_test_cases_set_created"))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_test_cases_set_created_id "
+            "ON test_cases (set_id, created_at, id)"
+        ))
+        print("Successfully ensured index 'ix_test_cases_set_created_id' on test_cases table.")
+
+
+if __name__ == "__main__":
+    asyncio.run(add_test_case_index())
@@ -0,0 +1,48 @@
+"""Add unique (set_id, case_uid) index to test_cases table.
+
+Run this script to add the index to an existing test_cases table. The index is
+the conflict target for test case upserts, so duplicate case_uids within a case
+set must be cleaned up before it can be created. Blank case_uids are set to
+NULL first.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+async def add_test_case_uid_constraint():
+    """Add uq_test_case_set_uid unique index to test_cases table."""
+    async with engine.begin() as conn:
+        # Blank uids mean "no uid", so they must not count as duplicates
+        await conn.execute(text(
+            "UPDATE test_cases SET case_uid = NULL WHERE TRIM(case_uid) = ''"
+        ))
+
+        result = await conn.execute(text(
+            "SELECT set_id, case_uid, COUNT(*) FROM test_cases "
+            "WHERE case_uid IS NOT NULL "
+            "GROUP BY set_id, case_uid HAVING COUNT(*) > 1"
+        ))
+        duplicates = result.fetchall()
+        if duplicates:
+            print("Found duplicate case_uid values, please clean them up first:")
+            for set_id, case_uid, count in duplicates:
+                print(f"  set_id={set_id} case_uid={case_uid} count={count}")
+            return
+
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_test_case_set_uid "
+            "ON test_cases (set_id, case_uid)"
+        ))
+        print("Successfully ensured unique index 'uq_test_case_set_uid' on test_cases table.")
+
+
+if __name__ == "__main__":
+    asyncio.run(add_test_case_uid_constraint())
@@ -25,20 +25,30 @@ router = APIRouter(prefix="/api/cases", tags=["cases"])
 # Case Set endpoints
 @router.get("/sets", response_model=list[CaseSetResponse])
 async def get_case_sets(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit to return all case sets"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     service: CaseService = Depends(get_case_service),
 ) -> list[CaseSetResponse]:
-    """Get all case sets."""
-    case_sets = await service.get_case_sets()
-    result = []
-    for cs in case_sets:
-        count = await service.get_case_count(cs.id)
-        result.append(CaseSetResponse(
+    """Get all case sets, or one keyset page of them when limit is given."""
+    if limit is None:
+        return await service.get_case_sets_read()
+
+    try:
+        case_sets, next_cursor = await service.get_case_sets_page(limit, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [
+        CaseSetResponse(
             id=cs.id,
             name=cs.name,
             created_at=cs.created_at,
-            case_count=count,
-        ))
-    return result
+            case_count=cs.case_count,
+        )
+        for cs in case_sets
+    ]
 
 
 @router.get("/sets/{case_set_id}", response_model=CaseSetResponse)
@@ -50,12 +60,11 @@ async def get_case_set(
     case_set = await service.get_case_set(case_set_id)
     if case_set is None:
         raise HTTPException(status_code=404, detail="用例集不存在")
-    count = await service.get_case_count(case_set_id)
     return CaseSetResponse(
         id=case_set.id,
         name=case_set.name,
         created_at=case_set.created_at,
-        case_count=count,
+        case_count=case_set.case_count,
     )
 
 
@@ -84,12 +93,11 @@ async def update_case_set(
     case_set = await service.update_case_set(case_set_id, data)
     if case_set is None:
         raise HTTPException(status_code=404, detail="用例集不存在")
-    count = await service.get_case_count(case_set_id)
     return CaseSetResponse(
         id=case_set.id,
         name=case_set.name,
         created_at=case_set.created_at,
-        case_count=count,
+        case_count=case_set.case_count,
     )
 
 
@@ -119,12 +127,11 @@ async def duplicate_case_set(
     duplicated = await service.duplicate_case_set(case_set_id, f"{original.name}复制")
     if duplicated is None:
         raise HTTPException(status_code=404, detail="用例集不存在")
-    count = await service.get_case_count(duplicated.id)
     return CaseSetResponse(
         id=duplicated.id,
         name=duplicated.name,
         created_at=duplicated.created_at,
-        case_count=count,
+        case_count=duplicated.case_count,
     )
 
 
@@ -171,8 +178,7 @@ async def import_excel(
         else:
             # Create new case set
             print(f"[DEBUG] Creating new case set")
-            case_set, test_cases = await service.import_excel(content, file.filename)
-            cases_created = len(test_cases)
+            case_set, cases_created = await service.import_excel(content, file.filename)
             print(f"[DEBUG] Created new set {case_set.id} with {cases_created} cases")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -192,15 +198,26 @@ async def import_excel(
 @router.get("/sets/{case_set_id}/cases", response_model=list[TestCaseResponse])
 async def get_test_cases(
     case_set_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit to return all test cases"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     service: CaseService = Depends(get_case_service),
 ) -> list[TestCaseResponse]:
-    """Get all test cases for a case set."""
+    """Get all test cases for a case set, or one keyset page of them when limit is given."""
     # Verify case set exists
     case_set = await service.get_case_set(case_set_id)
     if case_set is None:
         raise HTTPException(status_code=404, detail="用例集不存在")
 
-    test_cases = await service.get_test_cases(case_set_id)
+    if limit is None:
+        return await service.get_test_cases_read(case_set_id)
+
+    try:
+        test_cases, next_cursor = await service.get_test_cases_page(case_set_id, limit, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
     return [
         TestCaseResponse(
             id=tc.id,
@@ -246,7 +263,10 @@ async def create_test_case(
     if case_set is None:
         raise HTTPException(status_code=404, detail="用例集不存在")
 
-    test_case = await service.create_test_case(data)
+    try:
+        test_case = await service.create_test_case(data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return TestCaseResponse(
         id=test_case.id,
         set_id=test_case.set_id,
@@ -265,7 +285,10 @@ async def update_test_case(
     service: CaseService = Depends(get_case_service),
 ) -> TestCaseResponse:
     """Update a test case."""
-    test_case = await service.update_test_case(case_id, data)
+    try:
+        test_case = await service.update_test_case(case_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if test_case is None:
         raise HTTPException(status_code=404, detail="测试用例不存在")
     return TestCaseResponse(
@@ -1,17 +1,20 @@
 """API routes for evaluation task management."""
 
 import asyncio
-import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, BackgroundTasks
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_eval_service
 from app.api.websocket import manager as ws_manager
 from app.database import get_db
+from app.models.eval_result import EvalResult
+from app.models.test_case import TestCase
 from app.schemas.eval import (
+    EVAL_RESULT_LIST_ADAPTER,
     EvalResultResponse,
     EvalRunResponse,
     EvalTaskCreate,
@@ -25,6 +28,34 @@ from app.services.eval_service import EvalService
 router = APIRouter(prefix="/api/eval", tags=["evaluation"])
 
 
+def _to_result_response(result: EvalResult, case: TestCase) -> EvalResultResponse:
+    """Build the API response for an evaluation result and its test case."""
+    return EvalResultResponse(
+        id=result.id,
+        run_id=result.run_id,
+        task_id=result.task_id,
+        case_id=result.case_id,
+        case_uid=case.case_uid,
+        actual_output=result.actual_output,
+        is_passed=result.is_passed,
+        execution_error=getattr(result, 'execution_error', None),
+        evaluator_logs=result.evaluator_logs_list,
+        execution_duration=getattr(result, 'execution_duration', None),
+        skill_tokens=getattr(result, 'skill_tokens', None),
+        evaluator_tokens=getattr(result, 'evaluator_tokens', None),
+        created_at=result.created_at,
+    )
+
+
+def _result_list_response(results: List[Tuple[EvalResult, TestCase]]) -> Response:
+    """Serialize (result, case) pairs with the cached list serializer."""
+    items = [_to_result_response(result, case) for result, case in results]
+    return Response(
+        content=EVAL_RESULT_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
+
+
 @router.get("/tasks", response_model=List[EvalTaskResponse])
 async def get_eval_tasks(
     set_id: Optional[str] = Query(None),
@@ -238,27 +269,10 @@ async def test_template(
 async def get_eval_results(
     task_id: str,
     service: EvalService = Depends(get_eval_service),
-) -> List[EvalResultResponse]:
+) -> Response:
     """Get evaluation results for a task (latest run results)."""
     results = await service.get_eval_results(task_id)
-    return [
-        EvalResultResponse(
-            id=result.id,
-            run_id=result.run_id,
-            task_id=result.task_id,
-            case_id=result.case_id,
-            case_uid=case.case_uid,
-            actual_output=result.actual_output,
-            is_passed=result.is_passed,
-            execution_error=getattr(result, 'execution_error', None),
-            evaluator_logs=result.evaluator_logs_list,
-            execution_duration=getattr(result, 'execution_duration', None),
-            skill_tokens=getattr(result, 'skill_tokens', None),
-            evaluator_tokens=getattr(result, 'evaluator_tokens', None),
-            created_at=result.created_at,
-        )
-        for result, case in results
-    ]
+    return _result_list_response(results)
 
 
 @router.get("/results/{result_id}", response_model=EvalResultResponse)
@@ -273,21 +287,7 @@ async def get_eval_result(
         raise HTTPException(status_code=404, detail="评测结果不存在")
 
     result, case = result_data
-    return EvalResultResponse(
-        id=result.id,
-        run_id=result.run_id,
-        task_id=result.task_id,
-        case_id=result.case_id,
-        case_uid=case.case_uid,
-        actual_output=result.actual_output,
-        is_passed=result.is_passed,
-        execution_error=getattr(result, 'execution_error', None),
-        evaluator_logs=result.evaluator_logs_list,
-        execution_duration=getattr(result, 'execution_duration', None),
-        skill_tokens=getattr(result, 'skill_tokens', None),
-        evaluator_tokens=getattr(result, 'evaluator_tokens', None),
-        created_at=result.created_at,
-    )
+    return _to_result_response(result, case)
 
 
 @router.get("/tasks/{task_id}/runs", response_model=List[EvalRunResponse])
@@ -308,7 +308,7 @@ async def get_eval_runs(
             task_id=r.task_id,
             run_number=r.run_number,
             status=r.status,
-            summary=json.loads(r.summary) if r.summary else None,
+            summary=orjson.loads(r.summary) if r.summary else None,
             started_at=r.started_at,
             completed_at=r.completed_at,
             error=r.error,
@@ -335,7 +335,7 @@ async def get_eval_run(
         task_id=run.task_id,
         run_number=run.run_number,
         status=run.status,
-        summary=json.loads(run.summary) if run.summary else None,
+        summary=orjson.loads(run.summary) if run.summary else None,
         started_at=run.started_at,
         completed_at=run.completed_at,
         error=run.error,
@@ -489,27 +489,10 @@ async def stream_evaluation(
 async def get_run_results(
     run_id: str,
     service: EvalService = Depends(get_eval_service),
-) -> List[EvalResultResponse]:
+) -> Response:
     """Get evaluation results for a specific run."""
     results = await service.get_run_results(run_id)
-    return [
-        EvalResultResponse(
-            id=result.id,
-            run_id=result.run_id,
-            task_id=result.task_id,
-            case_id=result.case_id,
-            case_uid=case.case_uid,
-            actual_output=result.actual_output,
-            is_passed=result.is_passed,
-            execution_error=getattr(result, 'execution_error', None),
-            evaluator_logs=result.evaluator_logs_list,
-            execution_duration=getattr(result, 'execution_duration', None),
-            skill_tokens=getattr(result, 'skill_tokens', None),
-            evaluator_tokens=getattr(result, 'evaluator_tokens', None),
-            created_at=result.created_at,
-        )
-        for result, case in results
-    ]
+    return _result_list_response(results)
 
 
 @router.get("/runs/{run_id}/export")
@@ -42,7 +42,7 @@ async def list_evaluators(
             name=e.name,
             description=e.description,
             type=e.type,
-            config=e.config_dict,
+            config=e.config,
             is_system=bool(e.is_system),
             created_at=e.created_at,
             updated_at=e.updated_at,
@@ -82,7 +82,7 @@ async def create_evaluator(
         name=evaluator.name,
         description=evaluator.description,
         type=evaluator.type,
-        config=evaluator.config_dict,
+        config=evaluator.config,
         is_system=bool(evaluator.is_system),
         created_at=evaluator.created_at,
         updated_at=evaluator.updated_at,
@@ -119,7 +119,7 @@ async def get_evaluator(
         name=evaluator.name,
         description=evaluator.description,
         type=evaluator.type,
-        config=evaluator.config_dict,
+        config=evaluator.config,
         is_system=bool(evaluator.is_system),
         created_at=evaluator.created_at,
         updated_at=evaluator.updated_at,
@@ -159,7 +159,7 @@ async def update_evaluator(
         name=evaluator.name,
         description=evaluator.description,
         type=evaluator.type,
-        config=evaluator.config_dict,
+        config=evaluator.config,
         is_system=bool(evaluator.is_system),
         created_at=evaluator.created_at,
         updated_at=evaluator.updated_at,
@@ -232,7 +232,7 @@ async def test_evaluator(
         )
 
     try:
-        config = evaluator.config_dict
+        config = evaluator.config
 
         if evaluator.type == "code":
             # Check if it's a system evaluator with built-in implementation
@@ -387,6 +387,8 @@ async def test_evaluator(
                     result="failed",
                     error=f"LLM调用失败: {type(e).__name__}: {str(e)}",
                 )
+            finally:
+                await llm_client.aclose()
 
     except Exception as e:
         import traceback
@@ -437,8 +439,7 @@ async def debug_evaluator(
         "id": evaluator.id,
         "name": evaluator.name,
         "type": evaluator.type,
-        "config": evaluator.config_dict,
-        "config_raw": evaluator.config,
+        "config": evaluator.config,
     }
 
 
@@ -69,7 +69,7 @@ class ConnectionManager:
 
         Args:
             task_id: The task ID
-            event_type: The event type (e.g., 'run_created', 'result', 'complete', 'error')
+            event_type: The event type (e.g., 'run_created', 'result', 'results_batch', 'complete', 'error')
             data: The event data
         """
         message = {
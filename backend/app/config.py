@@ -23,6 +23,9 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./llm_eval.db?check_same_thread=false"
+    BULK_INSERT_CHUNK_SIZE: int = 1000  # Rows per INSERT statement in batch writes
+    DB_POOL_SIZE: int = 15  # Connections kept open in the pool
+    DB_MAX_OVERFLOW: int = 15  # Extra connections allowed under load beyond the pool size
 
     # CORS
     CORS_ORIGINS: list[str] = Field(default=["http://localhost:5173", "http://localhost:3000"])
@@ -4,12 +4,17 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
+import orjson
+from sqlalchemy import DateTime, String, make_url
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
 
 from app.config import settings
 
@@ -17,7 +22,109 @@ from app.config import settings
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    # Load server-generated column values (timestamps) in the flush itself
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Key type for UUID primary/foreign keys: native uuid on PostgreSQL,
+# 36-char string elsewhere. Values are str in Python on every backend.
+UUIDType = String(36).with_variant(postgresql.UUID(as_uuid=False), "postgresql")
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw) -> str:
+    # CURRENT_TIMESTAMP only has second precision on SQLite
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+class gen_uuid(FunctionElement):
+    """Random (version 4) UUID generated by the database."""
+
+    type = UUIDType
+    inherit_cache = True
+
+
+@compiles(gen_uuid)
+def _compile_gen_uuid(element, compiler, **kw) -> str:
+    return "UUID()"
+
+
+@compiles(gen_uuid, "sqlite")
+def _compile_gen_uuid_sqlite(element, compiler, **kw) -> str:
+    return (
+        "LOWER(HEX(RANDOMBLOB(4))) || '-' || LOWER(HEX(RANDOMBLOB(2))) || '-4' || "
+        "SUBSTR(LOWER(HEX(RANDOMBLOB(2))), 2) || '-' || "
+        "SUBSTR('89ab', 1 + (ABS(RANDOM()) % 4), 1) || "
+        "SUBSTR(LOWER(HEX(RANDOMBLOB(2))), 2) || '-' || LOWER(HEX(RANDOMBLOB(6)))"
+    )
+
+
+@compiles(gen_uuid, "postgresql")
+def _compile_gen_uuid_postgresql(element, compiler, **kw) -> str:
+    return "gen_random_uuid()"
+
+
+class hex_pad(FunctionElement):
+    """Non-negative integer as lowercase hex, zero-padded to a width: hex_pad(value, width)."""
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(hex_pad)
+def _compile_hex_pad(element, compiler, **kw) -> str:
+    value, width = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"LPAD(LOWER(HEX({value})), {width}, '0')"
+
+
+@compiles(hex_pad, "sqlite")
+def _compile_hex_pad_sqlite(element, compiler, **kw) -> str:
+    value, width = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"PRINTF('%0*x', {width}, {value})"
+
+
+@compiles(hex_pad, "postgresql")
+def _compile_hex_pad_postgresql(element, compiler, **kw) -> str:
+    value, width = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"LPAD(TO_HEX({value}), {width}, '0')"
+
+
+def _pool_options(database_url: str) -> dict:
+    """Get connection pool sizing for the configured database.
+
+    Args:
+        database_url: Database URL
+
+    Returns:
+        Engine keyword arguments for the pool
+    """
+    url = make_url(database_url)
+    # In-memory SQLite shares one connection through a StaticPool, which takes no sizing
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    # Every evaluation holds a connection while its cases run, so size the
+    # pool above the default 5 + 10 to leave room for concurrent requests
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
 
 
 # Create async engine
@@ -25,6 +132,9 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    json_serializer=lambda obj: orjson.dumps(obj).decode("utf-8"),
+    json_deserializer=orjson.loads,
+    **_pool_options(settings.DATABASE_URL),
 )
 
 # Create async session factory
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvaluationResult:
     """Result of an evaluation."""
 
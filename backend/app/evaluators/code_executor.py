@@ -3,12 +3,20 @@
 import asyncio
 import json
 import subprocess
-import tempfile
 import os
 from typing import Optional, Tuple
 
 from app.evaluators.base import BaseEvaluator
 
+# Fixed child-process entry point; the user code is passed in via EVAL_CODE
+_BOOTSTRAP = (
+    "import json, os, sys\n"
+    "ns = {'__name__': '__eval__'}\n"
+    "exec(os.environ['EVAL_CODE'], ns)\n"
+    "result = ns['evaluate'](sys.argv[1], sys.argv[2])\n"
+    "print(json.dumps(result, ensure_ascii=False))\n"
+)
+
 
 class CodeEvaluator(BaseEvaluator):
     """Evaluator that executes Python code in a sandboxed environment."""
@@ -57,62 +65,44 @@ import json
 def evaluate(expected: str, actual: str) -> dict:
     """User-provided evaluation function."""
 {self.code}
-
-if __name__ == "__main__":
-    import sys
-    expected_val = sys.argv[1]
-    actual_val = sys.argv[2]
-    result = evaluate(expected_val, actual_val)
-    print(json.dumps(result, ensure_ascii=False))
 '''
 
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            script_path = f.name
-            f.write(script)
+        # Run in subprocess with timeout, passing the script through the environment
+        process = await asyncio.create_subprocess_exec(
+            'python',
+            '-c',
+            _BOOTSTRAP,
+            expected,
+            actual,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, 'EVAL_CODE': script},
+        )
 
         try:
-            # Run in subprocess with timeout
-            process = await asyncio.create_subprocess_exec(
-                'python',
-                script_path,
-                expected,
-                actual,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(),
+                timeout=10.0,
             )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return False, "代码执行超时（10秒限制）"
 
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=10.0,
-                )
-            except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                return False, "代码执行超时（10秒限制）"
-
-            if process.returncode != 0:
-                error_msg = stderr.decode('utf-8', errors='replace')
-                return False, f"代码执行失败: {error_msg}"
-
-            # Parse output
-            output = stdout.decode('utf-8', errors='replace').strip()
-            try:
-                result = json.loads(output)
-                result_value = result.get("result", "failed").lower()
-                reason = result.get("reason", "")
-
-                if result_value == "passed":
-                    return True, reason
-                else:
-                    return False, reason or "评估未通过"
-            except json.JSONDecodeError:
-                return False, f"代码输出无效JSON: {output[:200]}"
-
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(script_path)
-            except OSError:
-                pass
+        if process.returncode != 0:
+            error_msg = stderr.decode('utf-8', errors='replace')
+            return False, f"代码执行失败: {error_msg}"
+
+        # Parse output
+        output = stdout.decode('utf-8', errors='replace').strip()
+        try:
+            result = json.loads(output)
+            result_value = result.get("result", "failed").lower()
+            reason = result.get("reason", "")
+
+            if result_value == "passed":
+                return True, reason
+            else:
+                return False, reason or "评估未通过"
+        except json.JSONDecodeError:
+            return False, f"代码输出无效JSON: {output[:200]}"
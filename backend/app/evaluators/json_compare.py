@@ -3,6 +3,8 @@
 import json
 from typing import Any, List, Tuple, Optional
 
+import orjson
+
 from app.evaluators.base import BaseEvaluator
 from app.utils.json_repair import JsonRepair
 
@@ -15,22 +17,42 @@ class JsonCompareEvaluator(BaseEvaluator):
         """Get evaluator name."""
         return "json_compare"
 
-    def _parse_json(self, text: str) -> Tuple[Optional[Any], Optional[str]]:
+    @staticmethod
+    def _loads(text: str) -> Tuple[Any, bool]:
+        """Parse JSON text, noting whether it is strict JSON.
+
+        Args:
+            text: Text to parse
+
+        Returns:
+            Tuple of (parsed_json, is_strict). is_strict is False when only the
+            lenient json module accepts the text, e.g. for NaN or Infinity
+
+        Raises:
+            json.JSONDecodeError: If the text is not JSON
+        """
+        try:
+            return orjson.loads(text), True
+        except orjson.JSONDecodeError:
+            return json.loads(text), False
+
+    def _parse_json(self, text: str) -> Tuple[Optional[Any], Optional[str], bool]:
         """Try to parse JSON from text, with repair attempts.
 
         Args:
             text: Text to parse
 
         Returns:
-            Tuple of (parsed_json, repaired_json_string)
+            Tuple of (parsed_json, repaired_json_string, is_strict)
         """
         text = text.strip()
         if not text:
-            return None, None
+            return None, None, False
 
         # Try direct JSON parse
         try:
-            return json.loads(text), text
+            obj, is_strict = self._loads(text)
+            return obj, text, is_strict
         except json.JSONDecodeError:
             pass
 
@@ -38,11 +60,12 @@ class JsonCompareEvaluator(BaseEvaluator):
         repaired = JsonRepair.repair(text)
         if repaired:
             try:
-                return json.loads(repaired), repaired
+                obj, is_strict = self._loads(repaired)
+                return obj, repaired, is_strict
             except json.JSONDecodeError:
                 pass
 
-        return None, None
+        return None, None, False
 
     def _deep_compare(self, expected: Any, actual: Any, path: str = "") -> List[str]:
         """Deep compare two values.
@@ -62,22 +85,22 @@ class JsonCompareEvaluator(BaseEvaluator):
             return differences
 
         if isinstance(expected, dict):
-            expected_keys = set(expected.keys())
-            actual_keys = set(actual.keys())
-
-            # Check for missing keys
-            for key in expected_keys - actual_keys:
-                differences.append(f"{path}.{key}: Missing key")
-
-            # Check for extra keys
-            for key in actual_keys - expected_keys:
-                differences.append(f"{path}.{key}: Extra key")
-
-            # Compare common keys
-            for key in expected_keys & actual_keys:
-                differences.extend(
-                    self._deep_compare(expected[key], actual[key], f"{path}.{key}" if path else key)
-                )
+            # Single pass over expected: recurse into common keys, record missing ones
+            common = 0
+            for key, value in expected.items():
+                if key in actual:
+                    common += 1
+                    differences.extend(
+                        self._deep_compare(value, actual[key], f"{path}.{key}" if path else key)
+                    )
+                else:
+                    differences.append(f"{path}.{key}: Missing key")
+
+            # Only scan actual for extra keys when it has keys beyond the common ones
+            if len(actual) > common:
+                for key in actual:
+                    if key not in expected:
+                        differences.append(f"{path}.{key}: Extra key")
 
         elif isinstance(expected, list):
             if len(expected) != len(actual):
@@ -92,6 +115,21 @@ class JsonCompareEvaluator(BaseEvaluator):
 
         return differences
 
+    @staticmethod
+    def _canonical_bytes(obj: Any) -> Optional[bytes]:
+        """Serialize a parsed JSON value with sorted keys for cheap equality checks.
+
+        Args:
+            obj: Parsed JSON value
+
+        Returns:
+            Canonical JSON bytes, or None if the value cannot be serialized
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            return None
+
     def evaluate(self, expected: str, actual: str) -> Tuple[bool, Optional[str]]:
         """Evaluate JSON structure comparison.
 
@@ -108,12 +146,16 @@ class JsonCompareEvaluator(BaseEvaluator):
 
         # Parse expected JSON
         try:
-            expected_obj = json.loads(expected)
+            expected_obj, expected_strict = self._loads(expected)
         except json.JSONDecodeError:
             return True, "Expected output is not valid JSON, skipping JSON comparison"
 
+        # Identical text parses to an identical structure
+        if expected.strip() == actual.strip():
+            return True, "JSON structures match"
+
         # Parse actual JSON with repair
-        actual_obj, repaired_actual = self._parse_json(actual)
+        actual_obj, repaired_actual, actual_strict = self._parse_json(actual)
 
         if actual_obj is None:
             return False, "Actual output is not valid JSON (repair failed)"
@@ -123,6 +165,13 @@ class JsonCompareEvaluator(BaseEvaluator):
         if repaired_actual and repaired_actual != actual:
             repair_note = " (JSON was repaired)"
 
+        # Equal canonical forms mean equal structures; skip the tree walk. Only
+        # strict JSON qualifies, since orjson writes NaN and Infinity as null
+        if expected_strict and actual_strict:
+            expected_bytes = self._canonical_bytes(expected_obj)
+            if expected_bytes is not None and expected_bytes == self._canonical_bytes(actual_obj):
+                return True, f"JSON structures match{repair_note}"
+
         differences = self._deep_compare(expected_obj, actual_obj)
 
         if not differences:
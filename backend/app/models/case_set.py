@@ -1,12 +1,16 @@
 """CaseSet model - represents a collection of test cases."""
 
-import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING, List
 
 from sqlalchemy import String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, UUIDType, utcnow
+from app.utils.ids import new_id
+
+if TYPE_CHECKING:
+    from app.models.test_case import TestCase
 
 
 class CaseSet(Base):
@@ -15,21 +19,33 @@ class CaseSet(Base):
     Attributes:
         id: UUID primary key
         name: Name of the case set
+        case_count: Number of test cases in the set, maintained by CaseService
         created_at: Timestamp when the case set was created
     """
 
     __tablename__ = "case_sets"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=new_id,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
+    case_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
         nullable=False,
     )
 
+    # Relationships
+    cases: Mapped[List["TestCase"]] = relationship(
+        "TestCase",
+        back_populates="case_set",
+        lazy="raise",
+        passive_deletes=True,
+        order_by="[TestCase.created_at, TestCase.id]",
+    )
+
     def __repr__(self) -> str:
         return f"<CaseSet(id={self.id}, name={self.name})>"
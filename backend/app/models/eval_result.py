@@ -1,14 +1,15 @@
 """EvalResult model - represents evaluation result for a single test case."""
 
-import json
-import uuid
 from typing import Any, List, Dict, Optional
 
 from datetime import datetime
-from sqlalchemy import Boolean, ForeignKey, String, Text
+
+import orjson
+from sqlalchemy import Boolean, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDType, utcnow
+from app.utils.ids import new_id
 
 
 class EvalResult(Base):
@@ -32,22 +33,22 @@ class EvalResult(Base):
     __tablename__ = "eval_results"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=new_id,
     )
     run_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("eval_runs.id", ondelete="CASCADE"),
         nullable=False,
     )
     task_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("eval_tasks.id", ondelete="CASCADE"),
         nullable=False,
     )
     case_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("test_cases.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -68,19 +69,20 @@ class EvalResult(Base):
         nullable=True,
     )
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
         nullable=False,
     )
 
     @property
     def evaluator_logs_list(self) -> List[Dict[str, Any]]:
         """Parse evaluator_logs JSON string to list."""
-        return json.loads(self.evaluator_logs)
+        return orjson.loads(self.evaluator_logs)
 
     @evaluator_logs_list.setter
     def evaluator_logs_list(self, value: List[Dict[str, Any]]) -> None:
         """Set evaluator_logs from list."""
-        self.evaluator_logs = json.dumps(value)
+        self.evaluator_logs = orjson.dumps(value).decode()
 
     def __repr__(self) -> str:
         return f"<EvalResult(id={self.id}, is_passed={self.is_passed})>"
@@ -1,14 +1,17 @@
 """EvalRun model - tracks each execution run of an evaluation task."""
 
-import uuid
-import json
 from datetime import datetime
-from typing import Optional, Any, Dict
+from typing import TYPE_CHECKING, Optional, Any, Dict
 
-from sqlalchemy import ForeignKey, String, Text, Integer
-from sqlalchemy.orm import Mapped, mapped_column
+import orjson
+from sqlalchemy import ForeignKey, Index, String, Text, Integer, UniqueConstraint, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, UUIDType, utcnow
+from app.utils.ids import new_id
+
+if TYPE_CHECKING:
+    from app.models.eval_task import EvalTask
 
 
 class EvalRun(Base):
@@ -29,14 +32,28 @@ class EvalRun(Base):
     """
 
     __tablename__ = "eval_runs"
+    __table_args__ = (
+        # One number per run of a task; also serves max(run_number) lookups
+        UniqueConstraint("task_id", "run_number", name="uq_eval_run_task_number"),
+        # Together these serve the reusable-run lookup of SSE streams: recent runs
+        # of a task, and its in-progress runs however old (a partial index)
+        Index("ix_eval_runs_task_started", "task_id", "started_at"),
+        Index(
+            "ix_eval_runs_task_active",
+            "task_id",
+            "started_at",
+            sqlite_where=text("status IN ('PENDING', 'RUNNING')"),
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=new_id,
     )
     task_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("eval_tasks.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -79,12 +96,18 @@ class EvalRun(Base):
         """Parse summary JSON string to dict."""
         if not self.summary:
             return {}
-        return json.loads(self.summary)
+        return orjson.loads(self.summary)
 
     @summary_dict.setter
     def summary_dict(self, value: Dict[str, Any]) -> None:
         """Set summary from dict."""
-        self.summary = json.dumps(value)
+        self.summary = orjson.dumps(value).decode()
+
+    # Relationships
+    task: Mapped["EvalTask"] = relationship(
+        "EvalTask",
+        lazy="raise",
+    )
 
     def __repr__(self) -> str:
         return f"<EvalRun(id={self.id}, task_id={self.task_id}, run_number={self.run_number})>"
@@ -1,14 +1,19 @@
 """EvalTask model - represents an evaluation task."""
 
-import json
-import uuid
 from datetime import datetime
-from typing import Any, Optional, Dict, List
+from typing import TYPE_CHECKING, Any, Optional, Dict, List
 
+import orjson
 from sqlalchemy import ForeignKey, String, Text, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, UUIDType, utcnow
+from app.utils.ids import new_id
+
+if TYPE_CHECKING:
+    from app.models.case_set import CaseSet
+    from app.models.model import Model
+    from app.models.task_evaluator import TaskEvaluator
 
 
 class EvalTask(Base):
@@ -28,21 +33,21 @@ class EvalTask(Base):
     __tablename__ = "eval_tasks"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=new_id,
     )
     name: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
     )
     set_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("case_sets.id", ondelete="CASCADE"),
         nullable=False,
     )
     model_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("models.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -60,38 +65,48 @@ class EvalTask(Base):
     )
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
     @property
     def request_template_dict(self) -> Dict[str, Any]:
         """Parse request_template JSON string to dict."""
-        return json.loads(self.request_template)
+        return orjson.loads(self.request_template)
 
     @request_template_dict.setter
     def request_template_dict(self, value: Dict[str, Any]) -> None:
         """Set request_template from dict."""
-        self.request_template = json.dumps(value)
+        self.request_template = orjson.dumps(value).decode()
 
     @property
     def summary_dict(self) -> Optional[Dict[str, Any]]:
         """Parse summary JSON string to dict."""
         if self.summary is None:
             return None
-        return json.loads(self.summary)
+        return orjson.loads(self.summary)
 
     @summary_dict.setter
     def summary_dict(self, value: Optional[Dict[str, Any]]) -> None:
         """Set summary from dict."""
-        self.summary = json.dumps(value) if value else None
+        self.summary = orjson.dumps(value).decode() if value else None
 
     # Relationships
+    case_set: Mapped["CaseSet"] = relationship(
+        "CaseSet",
+        lazy="raise",
+    )
+    model: Mapped["Model"] = relationship(
+        "Model",
+        lazy="raise",
+    )
     task_evaluators: Mapped[List["TaskEvaluator"]] = relationship(
         "TaskEvaluator",
         back_populates="task",
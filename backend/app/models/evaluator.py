@@ -1,14 +1,14 @@
 """Evaluator model - represents an evaluator configuration."""
 
-import json
-import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional, TYPE_CHECKING, List
 
-from sqlalchemy import String, Text, Integer
+from sqlalchemy import JSON, String, Text, Integer
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, UUIDType, utcnow
+from app.utils.ids import new_id
 
 if TYPE_CHECKING:
     from app.models.task_evaluator import TaskEvaluator
@@ -31,9 +31,9 @@ class Evaluator(Base):
     __tablename__ = "evaluators"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=new_id,
     )
     name: Mapped[str] = mapped_column(
         String(100),
@@ -45,10 +45,10 @@ class Evaluator(Base):
         String(20),
         nullable=False,
     )
-    config: Mapped[str] = mapped_column(
-        Text,
+    config: Mapped[Dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
         nullable=False,
-        default="{}",
+        default=dict,
     )
     is_system: Mapped[int] = mapped_column(
         Integer,
@@ -56,33 +56,24 @@ class Evaluator(Base):
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
-    @property
-    def config_dict(self) -> Dict[str, Any]:
-        """Parse config JSON string to dict."""
-        try:
-            return json.loads(self.config)
-        except json.JSONDecodeError:
-            return {}
-
-    @config_dict.setter
-    def config_dict(self, value: Dict[str, Any]) -> None:
-        """Set config from dict."""
-        self.config = json.dumps(value, ensure_ascii=False)
-
     # Relationships
     task_evaluators: Mapped[List["TaskEvaluator"]] = relationship(
         "TaskEvaluator",
         back_populates="evaluator",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -1,12 +1,15 @@
 """Model model - represents an LLM model available from a provider."""
 
-import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import ForeignKey, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, UUIDType, gen_uuid, utcnow
+
+if TYPE_CHECKING:
+    from app.models.model_provider import ModelProvider
 
 
 class Model(Base):
@@ -24,17 +27,18 @@ class Model(Base):
     __tablename__ = "models"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=gen_uuid(),
+        server_default=gen_uuid(),
     )
     provider_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("model_providers.id", ondelete="CASCADE"),
         nullable=False,
     )
     model_code: Mapped[str] = mapped_column(
-        String(200),
+        String(100),
         nullable=False,
     )
     display_name: Mapped[str] = mapped_column(
@@ -48,14 +52,22 @@ class Model(Base):
         comment="API endpoint path, empty for default /chat/completions",
     )
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
+    # Relationships
+    provider: Mapped["ModelProvider"] = relationship(
+        "ModelProvider",
+        lazy="raise",
+    )
+
     def __repr__(self) -> str:
         return f"<Model(id={self.id}, model_code={self.model_code}, display_name={self.display_name}, endpoint={self.endpoint})>"
@@ -1,13 +1,12 @@
 """ModelProvider model - represents an LLM API provider."""
 
-import uuid
 from datetime import datetime
 from typing import Any, Dict, List, TYPE_CHECKING
 
 from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, UUIDType, gen_uuid, utcnow
 
 if TYPE_CHECKING:
     from app.models.model import Model
@@ -28,9 +27,10 @@ class ModelProvider(Base):
     __tablename__ = "model_providers"
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=gen_uuid(),
+        server_default=gen_uuid(),
     )
     name: Mapped[str] = mapped_column(
         String(100),
@@ -38,7 +38,7 @@ class ModelProvider(Base):
         unique=True,
     )
     base_url: Mapped[str] = mapped_column(
-        String(500),
+        String(255),
         nullable=False,
     )
     api_key: Mapped[str] = mapped_column(
@@ -46,12 +46,14 @@ class ModelProvider(Base):
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
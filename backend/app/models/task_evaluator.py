@@ -1,13 +1,12 @@
 """TaskEvaluator model - association between tasks and evaluators."""
 
-import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Integer
+from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, UUIDType, gen_uuid
 
 if TYPE_CHECKING:
     from app.models.eval_task import EvalTask
@@ -25,19 +24,25 @@ class TaskEvaluator(Base):
     """
 
     __tablename__ = "task_evaluators"
+    __table_args__ = (
+        UniqueConstraint("task_id", "evaluator_id", name="uq_task_evaluator"),
+        Index("idx_task_evaluators_task_order", "task_id", "order_index"),
+        Index("idx_task_evaluators_evaluator_id", "evaluator_id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=gen_uuid(),
+        server_default=gen_uuid(),
     )
     task_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("eval_tasks.id", ondelete="CASCADE"),
         nullable=False,
     )
     evaluator_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("evaluators.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -51,9 +56,12 @@ class TaskEvaluator(Base):
     task: Mapped["EvalTask"] = relationship(
         "EvalTask",
         back_populates="task_evaluators",
+        lazy="raise",
     )
     evaluator: Mapped["Evaluator"] = relationship(
         "Evaluator",
+        back_populates="task_evaluators",
+        lazy="joined",
     )
 
     def __repr__(self) -> str:
@@ -1,13 +1,16 @@
 """TestCase model - represents a single test case."""
 
-import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, UUIDType, utcnow
+from app.utils.ids import new_id
+
+if TYPE_CHECKING:
+    from app.models.case_set import CaseSet
 
 
 class TestCase(Base):
@@ -24,14 +27,20 @@ class TestCase(Base):
     """
 
     __tablename__ = "test_cases"
+    __table_args__ = (
+        # Serves get_test_cases and keyset pages (filter by set, order by creation, id)
+        Index("ix_test_cases_set_created_id", "set_id", "created_at", "id"),
+        # Conflict target for upserts by case_uid; NULL uids never collide
+        UniqueConstraint("set_id", "case_uid", name="uq_test_case_set_uid"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=new_id,
     )
     set_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDType,
         ForeignKey("case_sets.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -40,9 +49,17 @@ class TestCase(Base):
     user_input: Mapped[str] = mapped_column(Text, nullable=False)
     expected_output: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
+        default=utcnow(),
+        server_default=utcnow(),
         nullable=False,
     )
 
+    # Relationships
+    case_set: Mapped["CaseSet"] = relationship(
+        "CaseSet",
+        back_populates="cases",
+        lazy="raise",
+    )
+
     def __repr__(self) -> str:
         return f"<TestCase(id={self.id}, case_uid={self.case_uid})>"
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CaseSetBase(BaseModel):
@@ -32,7 +32,7 @@ class CaseSetResponse(BaseModel):
     created_at: datetime
     case_count: int = 0
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TestCaseBase(BaseModel):
@@ -43,6 +43,14 @@ class TestCaseBase(BaseModel):
     user_input: str = Field(..., min_length=1, description="用户输入")
     expected_output: Optional[str] = Field(None, description="预期输出")
 
+    @field_validator("case_uid", mode="before")
+    @classmethod
+    def blank_case_uid_to_none(cls, v: Any) -> Any:
+        # Forms send a blank uid as ""; it must not take part in uniqueness checks
+        if isinstance(v, str) and not v.strip():
+            return None
+        return v
+
 
 class TestCaseCreate(TestCaseBase):
     """Schema for creating a TestCase."""
@@ -63,7 +71,7 @@ class TestCaseResponse(TestCaseBase):
     set_id: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ExcelImportResponse(BaseModel):
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Optional, Dict, List
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 class RequestTemplate(BaseModel):
@@ -63,7 +63,7 @@ class EvalTaskResponse(BaseModel):
 class EvalResultResponse(BaseModel):
     """Schema for evaluation result response."""
 
-    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+    model_config = ConfigDict(from_attributes=True, frozen=True, protected_namespaces=())
 
     id: str
     run_id: str
@@ -80,10 +80,14 @@ class EvalResultResponse(BaseModel):
     created_at: datetime
 
 
+# Serializer for result lists, built once for the fixed shape and reused per request
+EVAL_RESULT_LIST_ADAPTER = TypeAdapter(List[EvalResultResponse])
+
+
 class EvalRunResponse(BaseModel):
     """Schema for evaluation run response."""
 
-    model_config = ConfigDict(from_attributes=True, protected_namespaces=())
+    model_config = ConfigDict(from_attributes=True, frozen=True, protected_namespaces=())
 
     id: str
     task_id: str
@@ -12,7 +12,7 @@ class ModelProviderCreate(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
 
     name: str = Field(..., min_length=1, max_length=100)
-    base_url: str = Field(..., min_length=1, max_length=500)
+    base_url: str = Field(..., min_length=1, max_length=255)
     api_key: str = Field(..., min_length=1, max_length=500)
 
 
@@ -22,7 +22,7 @@ class ModelProviderUpdate(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
 
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    base_url: Optional[str] = Field(None, min_length=1, max_length=500)
+    base_url: Optional[str] = Field(None, min_length=1, max_length=255)
     api_key: Optional[str] = Field(None, min_length=1, max_length=500)
 
 
@@ -46,7 +46,7 @@ class ModelCreate(BaseModel):
     model_config = ConfigDict(protected_namespaces=())
 
     provider_id: str
-    model_code: str = Field(..., min_length=1, max_length=200)
+    model_code: str = Field(..., min_length=1, max_length=100)
     display_name: str = Field(..., min_length=1, max_length=200)
 
 
@@ -55,7 +55,7 @@ class ModelUpdate(BaseModel):
 
     model_config = ConfigDict(protected_namespaces=())
 
-    model_code: Optional[str] = Field(None, min_length=1, max_length=200)
+    model_code: Optional[str] = Field(None, min_length=1, max_length=100)
     display_name: Optional[str] = Field(None, min_length=1, max_length=200)
 
 
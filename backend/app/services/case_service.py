@@ -1,22 +1,82 @@
 """Service for case set and test case management."""
 
+import base64
+from collections import Counter
 from collections.abc import AsyncIterator
-from typing import Optional, List
-try:
-    from typing import Self
-except ImportError:
-    from typing_extensions import Self
-
-from sqlalchemy import delete, func, select
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, List, Tuple
+
+from sqlalchemy import (
+    ColumnElement, DateTime, String, and_, cast, delete, func, insert, literal, select, tuple_, update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
+from app.config import settings
+from app.database import UUIDType, hex_pad, utcnow
 from app.models.case_set import CaseSet
 from app.models.test_case import TestCase
-from app.schemas.cases import CaseSetCreate, CaseSetUpdate, TestCaseCreate, TestCaseUpdate
+from app.schemas.cases import (
+    CaseSetCreate,
+    CaseSetResponse,
+    CaseSetUpdate,
+    TestCaseCreate,
+    TestCaseResponse,
+    TestCaseUpdate,
+)
+from app.utils.ids import new_id, new_ids
+
+# Fields refreshed when an upserted case_uid already exists
+_UPSERT_FIELDS = ("description", "user_input", "expected_output")
+
+# Rows fetched per round-trip when streaming test cases
+_STREAM_BATCH_SIZE = 500
+
+# Rows per statement in batch writes; bounds statement size and buffered RETURNING rows
+_BATCH_CHUNK = settings.BULK_INSERT_CHUNK_SIZE
+
+
+def _encode_cursor(created_at: str, row_id: str) -> str:
+    """Encode the (created_at, id) sort key of a page's last row as an opaque cursor.
+
+    Args:
+        created_at: The row's created_at as text, as read from the database
+        row_id: The row's ID
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(f"{created_at}|{row_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor made by _encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (created_at text, row ID)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        datetime.fromisoformat(created_at)
+    except ValueError:
+        raise ValueError(f"无效的分页游标: {cursor}") from None
+    return created_at, row_id
 
 
 class CaseService:
-    """Service for managing case sets and test cases."""
+    """Service for managing case sets and test cases.
+
+    Methods never commit. All statements run in the session's transaction,
+    which get_db commits once per request (or rolls back on error).
+    """
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize service with database session.
@@ -25,28 +85,102 @@ class CaseService:
             session: Database session
         """
         self.session = session
+        # Per-request primary key lookup cache, keyed by (model, id); None memoizes a miss
+        self._pk_cache: Dict[Tuple[type, str], Any] = {}
 
-    @classmethod
-    async def create(cls, session: AsyncSession) -> Self:
-        """Create a new service instance.
+    async def get_case_sets(self) -> List[CaseSet]:
+        """Get all case sets.
 
-        Args:
-            session: Database session
+        Returns:
+            List of case sets
+        """
+        result = await self.session.execute(
+            select(CaseSet)
+            .options(raiseload("*"))
+            .order_by(CaseSet.created_at.desc(), CaseSet.id.desc())
+        )
+        return list(result.scalars().all())
+
+    async def get_case_sets_read(self) -> List[CaseSetResponse]:
+        """Get all case sets as response rows without hydrating ORM objects.
 
         Returns:
-            CaseService instance
+            List of case set responses
         """
-        return cls(session)
+        result = await self.session.execute(
+            select(CaseSet.id, CaseSet.name, CaseSet.created_at, CaseSet.case_count)
+            .order_by(CaseSet.created_at.desc(), CaseSet.id.desc())
+        )
+        return [CaseSetResponse.model_validate(row) for row in result]
 
-    async def get_case_sets(self) -> List[CaseSet]:
-        """Get all case sets.
+    async def get_case_sets_with_cases(self) -> List[CaseSet]:
+        """Get all case sets with their test cases loaded.
+
+        Test cases are batch-loaded with selectinload, so this issues two
+        SELECTs regardless of the number of case sets.
 
         Returns:
-            List of case sets
+            List of case sets with the cases relationship populated
         """
-        result = await self.session.execute(select(CaseSet).order_by(CaseSet.created_at.desc()))
+        result = await self.session.execute(
+            select(CaseSet)
+            .options(selectinload(CaseSet.cases), raiseload("*"))
+            .order_by(CaseSet.created_at.desc(), CaseSet.id.desc())
+        )
         return list(result.scalars().all())
 
+    async def get_case_sets_page(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Tuple[List[CaseSet], Optional[str]]:
+        """Get one page of case sets, newest first, using keyset pagination.
+
+        Args:
+            limit: Maximum number of case sets to return
+            after: Cursor from the previous page
+
+        Returns:
+            Tuple of (case sets, cursor for the next page or None if this is the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = (
+            select(CaseSet, cast(CaseSet.created_at, String).label("created_at_text"))
+            .options(raiseload("*"))
+            .order_by(CaseSet.created_at.desc(), CaseSet.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            query = query.where(tuple_(CaseSet.created_at, CaseSet.id) < self._cursor_key(after))
+        rows = (await self.session.execute(query)).all()
+        case_sets = [case_set for case_set, _ in rows]
+        if len(rows) > limit:
+            last, last_created_at = rows[limit - 1]
+            return case_sets[:limit], _encode_cursor(last_created_at, last.id)
+        return case_sets, None
+
+    def _cursor_key(self, cursor: str) -> ColumnElement[Any]:
+        """Build the (created_at, id) key of a page cursor for keyset comparisons.
+
+        Args:
+            cursor: Cursor from the previous page
+
+        Returns:
+            Tuple expression to compare (created_at, id) against
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        created_at, row_id = _decode_cursor(cursor)
+        if self.session.get_bind().dialect.name == "sqlite":
+            # SQLite compares the stored timestamp text, so bind the text as it was read
+            created_at_value = literal(created_at, String)
+        else:
+            created_at_value = literal(datetime.fromisoformat(created_at), DateTime)
+        return tuple_(created_at_value, literal(row_id, UUIDType))
+
     async def get_case_set(self, case_set_id: str) -> Optional[CaseSet]:
         """Get a case set by ID.
 
@@ -56,8 +190,14 @@ class CaseService:
         Returns:
             Case set or None if not found
         """
-        result = await self.session.execute(select(CaseSet).where(CaseSet.id == case_set_id))
-        return result.scalar_one_or_none()
+        key = (CaseSet, case_set_id)
+        if key in self._pk_cache:
+            return self._pk_cache[key]
+
+        # Identity map hits skip the SELECT entirely
+        case_set = await self.session.get(CaseSet, case_set_id, options=[raiseload("*")])
+        self._pk_cache[key] = case_set
+        return case_set
 
     async def create_case_set(self, data: CaseSetCreate) -> CaseSet:
         """Create a new case set.
@@ -72,8 +212,8 @@ class CaseService:
             name=data.name,
         )
         self.session.add(case_set)
+        # eager_defaults fetches server-generated columns during the flush
         await self.session.flush()
-        await self.session.refresh(case_set)
         return case_set
 
     async def update_case_set(self, case_set_id: str, data: CaseSetUpdate) -> Optional[CaseSet]:
@@ -86,16 +226,20 @@ class CaseService:
         Returns:
             Updated case set or None if not found
         """
-        case_set = await self.get_case_set(case_set_id)
-        if case_set is None:
-            return None
+        values = data.model_dump(exclude_none=True)
+        if not values:
+            return await self.get_case_set(case_set_id)
 
-        if data.name is not None:
-            case_set.name = data.name
-
-        await self.session.flush()
-        await self.session.refresh(case_set)
-        return case_set
+        # One UPDATE ... RETURNING; an empty result means the set does not exist
+        self._pk_cache.pop((CaseSet, case_set_id), None)
+        result = await self.session.execute(
+            update(CaseSet)
+            .where(CaseSet.id == case_set_id)
+            .values(**values)
+            .returning(CaseSet)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
 
     async def delete_case_set(self, case_set_id: str) -> bool:
         """Delete a case set and all its test cases.
@@ -106,15 +250,23 @@ class CaseService:
         Returns:
             True if deleted, False if not found
         """
-        case_set = await self.get_case_set(case_set_id)
-        if case_set is None:
+        result = await self.session.execute(
+            delete(CaseSet).where(CaseSet.id == case_set_id).returning(CaseSet.id)
+        )
+        if result.scalar() is None:
             return False
 
-        # Delete associated test cases
-        await self.session.execute(delete(TestCase).where(TestCase.set_id == case_set_id))
-
-        # Delete case set
-        await self.session.execute(delete(CaseSet).where(CaseSet.id == case_set_id))
+        # The test_cases foreign key cascades server-side; SQLite only enforces it
+        # with PRAGMA foreign_keys, which is off here, so clear children explicitly
+        if self.session.get_bind().dialect.name == "sqlite":
+            await self.session.execute(delete(TestCase).where(TestCase.set_id == case_set_id))
+
+        self._pk_cache.pop((CaseSet, case_set_id), None)
+        for key in [
+            k for k, v in self._pk_cache.items()
+            if k[0] is TestCase and v is not None and v.set_id == case_set_id
+        ]:
+            del self._pk_cache[key]
         return True
 
     async def get_test_cases(self, set_id: str) -> List[TestCase]:
@@ -128,11 +280,129 @@ class CaseService:
         """
         result = await self.session.execute(
             select(TestCase)
+            .options(raiseload("*"))
+            .where(TestCase.set_id == set_id)
+            .order_by(TestCase.created_at.asc(), TestCase.id.asc())
+        )
+        return list(result.scalars().all())
+
+    async def get_test_cases_read(self, set_id: str) -> List[TestCaseResponse]:
+        """Get all test cases for a case set as response rows without hydrating ORM objects.
+
+        Args:
+            set_id: Case set ID
+
+        Returns:
+            List of test case responses
+        """
+        result = await self.session.execute(
+            select(
+                TestCase.id,
+                TestCase.set_id,
+                TestCase.case_uid,
+                TestCase.description,
+                TestCase.user_input,
+                TestCase.expected_output,
+                TestCase.created_at,
+            )
+            .where(TestCase.set_id == set_id)
+            .order_by(TestCase.created_at.asc(), TestCase.id.asc())
+        )
+        return [TestCaseResponse.model_validate(row) for row in result]
+
+    async def get_test_cases_summary(self, set_id: str) -> List[TestCase]:
+        """Get test cases for a case set without their large text columns.
+
+        Only id, set_id, case_uid, description and created_at are loaded;
+        accessing user_input or expected_output on the results raises.
+
+        Args:
+            set_id: Case set ID
+
+        Returns:
+            List of partially loaded test cases
+        """
+        result = await self.session.execute(
+            select(TestCase)
+            .options(
+                load_only(
+                    TestCase.set_id,
+                    TestCase.case_uid,
+                    TestCase.description,
+                    TestCase.created_at,
+                    raiseload=True,
+                ),
+                raiseload("*"),
+            )
             .where(TestCase.set_id == set_id)
-            .order_by(TestCase.created_at.asc())
+            .order_by(TestCase.created_at.asc(), TestCase.id.asc())
         )
         return list(result.scalars().all())
 
+    async def get_test_cases_page(
+        self,
+        set_id: str,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Tuple[List[TestCase], Optional[str]]:
+        """Get one page of test cases for a case set using keyset pagination.
+
+        The cursor carries the (created_at, id) key of the previous page's last
+        row, so each page is an index range scan on (set_id, created_at, id)
+        regardless of how deep it is, and paging continues if that row is deleted.
+
+        Args:
+            set_id: Case set ID
+            limit: Maximum number of test cases to return
+            after: Cursor from the previous page
+
+        Returns:
+            Tuple of (test cases, cursor for the next page or None if this is the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = (
+            select(TestCase, cast(TestCase.created_at, String).label("created_at_text"))
+            .options(raiseload("*"))
+            .where(TestCase.set_id == set_id)
+            .order_by(TestCase.created_at.asc(), TestCase.id.asc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            query = query.where(tuple_(TestCase.created_at, TestCase.id) > self._cursor_key(after))
+        rows = (await self.session.execute(query)).all()
+        test_cases = [test_case for test_case, _ in rows]
+        if len(rows) > limit:
+            last, last_created_at = rows[limit - 1]
+            return test_cases[:limit], _encode_cursor(last_created_at, last.id)
+        return test_cases, None
+
+    async def iter_test_cases(self, set_id: str) -> AsyncIterator[TestCase]:
+        """Stream test cases for a case set without materializing the full list.
+
+        Rows are fetched in batches of _STREAM_BATCH_SIZE, so memory stays bounded
+        for large sets. Prefer get_test_cases for small, UI-sized queries.
+
+        Args:
+            set_id: Case set ID
+
+        Yields:
+            Test cases in creation order
+        """
+        result = await self.session.stream_scalars(
+            select(TestCase)
+            .options(raiseload("*"))
+            .where(TestCase.set_id == set_id)
+            .order_by(TestCase.created_at.asc(), TestCase.id.asc())
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        try:
+            async for test_case in result:
+                yield test_case
+        finally:
+            await result.close()
+
     async def get_test_case(self, case_id: str) -> Optional[TestCase]:
         """Get a test case by ID.
 
@@ -142,8 +412,13 @@ class CaseService:
         Returns:
             Test case or None if not found
         """
-        result = await self.session.execute(select(TestCase).where(TestCase.id == case_id))
-        return result.scalar_one_or_none()
+        key = (TestCase, case_id)
+        if key in self._pk_cache:
+            return self._pk_cache[key]
+
+        test_case = await self.session.get(TestCase, case_id, options=[raiseload("*")])
+        self._pk_cache[key] = test_case
+        return test_case
 
     async def create_test_case(self, data: TestCaseCreate) -> TestCase:
         """Create a new test case.
@@ -153,7 +428,14 @@ class CaseService:
 
         Returns:
             Created test case
+
+        Raises:
+            ValueError: If the case_uid is already used in the case set
         """
+        if data.case_uid is not None:
+            await self._ensure_case_uid_free(
+                TestCase.set_id == data.set_id, data.case_uid,
+            )
         test_case = TestCase(
             set_id=data.set_id,
             case_uid=data.case_uid,
@@ -163,7 +445,7 @@ class CaseService:
         )
         self.session.add(test_case)
         await self.session.flush()
-        await self.session.refresh(test_case)
+        await self._adjust_case_counts({data.set_id: 1})
         return test_case
 
     async def create_test_cases_batch(self, cases_data: List[TestCaseCreate]) -> List[TestCase]:
@@ -174,23 +456,113 @@ class CaseService:
 
         Returns:
             List of created test cases
+
+        Raises:
+            ValueError: If a case_uid repeats in the batch or is already used in its set
         """
-        test_cases = [
-            TestCase(
-                set_id=data.set_id,
-                case_uid=data.case_uid,
-                description=data.description,
-                user_input=data.user_input,
-                expected_output=data.expected_output,
-            )
-            for data in cases_data
+        if not cases_data:
+            return []
+        await self._ensure_batch_case_uids_free(cases_data)
+
+        # TestCaseCreate fields map one-to-one onto test_cases columns
+        rows = [
+            {"id": case_id, **data.model_dump()}
+            for case_id, data in zip(new_ids(len(cases_data)), cases_data)
         ]
-        self.session.add_all(test_cases)
-        await self.session.flush()
-        for tc in test_cases:
-            await self.session.refresh(tc)
+        # Multi-row INSERTs per chunk; RETURNING yields the ORM objects in input order
+        stmt = insert(TestCase).returning(TestCase, sort_by_parameter_order=True)
+        test_cases: List[TestCase] = []
+        for start in range(0, len(rows), _BATCH_CHUNK):
+            result = await self.session.scalars(stmt, rows[start:start + _BATCH_CHUNK])
+            test_cases.extend(result.all())
+        await self._adjust_case_counts(Counter(data.set_id for data in cases_data))
         return test_cases
 
+    async def bulk_load_test_cases(self, set_id: str, cases_data: List[TestCaseCreate]) -> int:
+        """Load a large number of new test cases into a case set as fast as possible.
+
+        On PostgreSQL with asyncpg this uses COPY; otherwise it falls back to chunked
+        executemany INSERTs without RETURNING. The load bypasses the ORM, so no
+        objects are returned and the caller must already have ensured case_uids do
+        not collide with existing cases. The case_count counter is updated here.
+
+        Args:
+            set_id: Case set ID to load into
+            cases_data: List of test case creation data
+
+        Returns:
+            Number of test cases loaded
+        """
+        if not cases_data:
+            return 0
+
+        records = [
+            (case_id, set_id, data.case_uid, data.description, data.user_input, data.expected_output)
+            for case_id, data in zip(new_ids(len(cases_data)), cases_data)
+        ]
+        columns = ("id", "set_id", "case_uid", "description", "user_input", "expected_output")
+
+        bind = self.session.get_bind()
+        if bind.dialect.name == "postgresql" and bind.dialect.driver == "asyncpg":
+            # Pending ORM changes must reach the connection before the raw COPY
+            await self.session.flush()
+            # COPY bypasses the inline utcnow() of ORM inserts, and tables created
+            # before it have no column default, so send the database time explicitly
+            created_at = await self.session.scalar(select(utcnow()))
+            conn = await self.session.connection()
+            raw_conn = await conn.get_raw_connection()
+            await raw_conn.driver_connection.copy_records_to_table(
+                TestCase.__tablename__,
+                records=[record + (created_at,) for record in records],
+                columns=columns + ("created_at",),
+            )
+        else:
+            rows = [dict(zip(columns, record)) for record in records]
+            for start in range(0, len(rows), _BATCH_CHUNK):
+                await self.session.execute(insert(TestCase), rows[start:start + _BATCH_CHUNK])
+
+        await self._adjust_case_counts({set_id: len(records)})
+        return len(records)
+
+    async def _ensure_case_uid_free(self, scope: ColumnElement[bool], case_uid: str) -> None:
+        """Check that no test case in scope already uses a case_uid.
+
+        Args:
+            scope: Filter selecting the test cases that share the uid namespace
+            case_uid: Case UID about to be written
+
+        Raises:
+            ValueError: If the case_uid is already taken
+        """
+        taken = await self.session.scalar(
+            select(TestCase.id).where(scope, TestCase.case_uid == case_uid).limit(1)
+        )
+        if taken is not None:
+            raise ValueError(f"用例编号已存在: {case_uid}")
+
+    async def _ensure_batch_case_uids_free(self, cases_data: List[TestCaseCreate]) -> None:
+        """Check that the case_uids of a batch are distinct and not yet used in their sets.
+
+        Args:
+            cases_data: Test cases about to be inserted
+
+        Raises:
+            ValueError: If a case_uid repeats in the batch or is already taken
+        """
+        keys = [(data.set_id, data.case_uid) for data in cases_data if data.case_uid is not None]
+        repeated = next((key for key, count in Counter(keys).items() if count > 1), None)
+        if repeated is not None:
+            raise ValueError(f"用例编号重复: {repeated[1]}")
+
+        for start in range(0, len(keys), _BATCH_CHUNK):
+            taken = await self.session.scalar(
+                select(TestCase.case_uid)
+                .where(tuple_(TestCase.set_id, TestCase.case_uid).in_(keys[start:start + _BATCH_CHUNK]))
+                .limit(1)
+            )
+            if taken is not None:
+                raise ValueError(f"用例编号已存在: {taken}")
+
     async def update_test_case(self, case_id: str, data: TestCaseUpdate) -> Optional[TestCase]:
         """Update a test case.
 
@@ -200,23 +572,28 @@ class CaseService:
 
         Returns:
             Updated test case or None if not found
-        """
-        test_case = await self.get_test_case(case_id)
-        if test_case is None:
-            return None
 
-        if data.case_uid is not None:
-            test_case.case_uid = data.case_uid
-        if data.description is not None:
-            test_case.description = data.description
-        if data.user_input is not None:
-            test_case.user_input = data.user_input
-        if data.expected_output is not None:
-            test_case.expected_output = data.expected_output
+        Raises:
+            ValueError: If the new case_uid is already used in the case's set
+        """
+        values = data.model_dump(exclude_none=True)
+        if not values:
+            return await self.get_test_case(case_id)
+        if "case_uid" in values:
+            case_set_id = select(TestCase.set_id).where(TestCase.id == case_id).scalar_subquery()
+            await self._ensure_case_uid_free(
+                and_(TestCase.set_id == case_set_id, TestCase.id != case_id), values["case_uid"],
+            )
 
-        await self.session.flush()
-        await self.session.refresh(test_case)
-        return test_case
+        self._pk_cache.pop((TestCase, case_id), None)
+        result = await self.session.execute(
+            update(TestCase)
+            .where(TestCase.id == case_id)
+            .values(**values)
+            .returning(TestCase)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
 
     async def delete_test_case(self, case_id: str) -> bool:
         """Delete a test case.
@@ -227,11 +604,14 @@ class CaseService:
         Returns:
             True if deleted, False if not found
         """
-        test_case = await self.get_test_case(case_id)
-        if test_case is None:
+        result = await self.session.execute(
+            delete(TestCase).where(TestCase.id == case_id).returning(TestCase.set_id)
+        )
+        self._pk_cache.pop((TestCase, case_id), None)
+        set_id = result.scalar()
+        if set_id is None:
             return False
-
-        await self.session.execute(delete(TestCase).where(TestCase.id == case_id))
+        await self._adjust_case_counts({set_id: -1})
         return True
 
     async def get_case_count(self, set_id: str) -> int:
@@ -244,10 +624,31 @@ class CaseService:
             Count of test cases
         """
         result = await self.session.execute(
-            select(func.count(TestCase.id)).where(TestCase.set_id == set_id)
+            select(CaseSet.case_count).where(CaseSet.id == set_id)
         )
         return result.scalar() or 0
 
+    async def get_case_counts(self, set_ids: Optional[List[str]] = None) -> Dict[str, int]:
+        """Get test case counts for many case sets in one query.
+
+        Args:
+            set_ids: Case set IDs to count, or None for all case sets
+
+        Returns:
+            Dict of set ID to count. Requested IDs without cases map to 0; when
+            counting all sets, sets without cases are omitted
+        """
+        query = select(TestCase.set_id, func.count(TestCase.id)).group_by(TestCase.set_id)
+        counts: Dict[str, int] = {}
+        if set_ids is not None:
+            if not set_ids:
+                return counts
+            query = query.where(TestCase.set_id.in_(set_ids))
+            counts = dict.fromkeys(set_ids, 0)
+        result = await self.session.execute(query)
+        counts.update(result.tuples().all())
+        return counts
+
     async def get_test_case_by_uid(self, set_id: str, case_uid: str) -> Optional[TestCase]:
         """Get a test case by case_uid within a case set.
 
@@ -258,8 +659,10 @@ class CaseService:
         Returns:
             Test case or None if not found
         """
+        # Served by the uq_test_case_set_uid unique index
         result = await self.session.execute(
             select(TestCase)
+            .options(raiseload("*"))
             .where(TestCase.set_id == set_id)
             .where(TestCase.case_uid == case_uid)
         )
@@ -269,7 +672,8 @@ class CaseService:
         """Create or update multiple test cases in batch.
 
         For each case, if a case with the same case_uid exists in the set, it will be updated.
-        Otherwise, a new case will be created.
+        Otherwise, a new case will be created. Cases with a case_uid are merged in a single
+        INSERT ... ON CONFLICT statement; cases without one are bulk inserted.
 
         Args:
             cases_data: List of test case creation data
@@ -277,39 +681,88 @@ class CaseService:
         Returns:
             List of created/updated test cases
         """
-        result_cases = []
+        if not cases_data:
+            return []
+
+        # Collapse repeated uids within the batch: a single ON CONFLICT statement
+        # cannot touch the same row twice, so later rows overlay earlier ones here
+        keyed_rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        plain_cases: List[TestCaseCreate] = []
         for data in cases_data:
-            # Check if a case with the same case_uid exists
-            existing_case = None
-            if data.case_uid:
-                existing_case = await self.get_test_case_by_uid(data.set_id, data.case_uid)
-
-            if existing_case:
-                # Update existing case
-                if data.description is not None:
-                    existing_case.description = data.description
-                if data.user_input is not None:
-                    existing_case.user_input = data.user_input
-                if data.expected_output is not None:
-                    existing_case.expected_output = data.expected_output
-                await self.session.flush()
-                await self.session.refresh(existing_case)
-                result_cases.append(existing_case)
+            if not data.case_uid:
+                plain_cases.append(data)
+                continue
+            key = (data.set_id, data.case_uid)
+            row = keyed_rows.get(key)
+            if row is None:
+                keyed_rows[key] = {
+                    "set_id": data.set_id,
+                    "case_uid": data.case_uid,
+                    **{field: getattr(data, field) for field in _UPSERT_FIELDS},
+                }
             else:
-                # Create new case
-                new_case = TestCase(
-                    set_id=data.set_id,
-                    case_uid=data.case_uid,
-                    description=data.description,
-                    user_input=data.user_input,
-                    expected_output=data.expected_output,
+                for field in _UPSERT_FIELDS:
+                    value = getattr(data, field)
+                    if value is not None:
+                        row[field] = value
+
+        by_uid: Dict[Tuple[str, str], TestCase] = {}
+        if keyed_rows:
+            rows = list(keyed_rows.values())
+            for case_id, row in zip(new_ids(len(rows)), rows):
+                row["id"] = case_id
+
+            stmt = self._dialect_insert()(TestCase)
+            # Only overwrite a field when the incoming value is not None
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["set_id", "case_uid"],
+                set_={
+                    field: func.coalesce(stmt.excluded[field], getattr(TestCase, field))
+                    for field in _UPSERT_FIELDS
+                },
+            )
+            stmt = stmt.returning(TestCase).execution_options(populate_existing=True)
+            for start in range(0, len(rows), _BATCH_CHUNK):
+                result = await self.session.scalars(stmt, rows[start:start + _BATCH_CHUNK])
+                by_uid.update(((tc.set_id, tc.case_uid), tc) for tc in result.all())
+            for tc in by_uid.values():
+                self._pk_cache.pop((TestCase, tc.id), None)
+
+            # Conflicting rows keep their existing id, so fresh ids mark inserts
+            inserted_ids = {row["id"] for row in rows}
+            await self._adjust_case_counts(
+                Counter(tc.set_id for tc in by_uid.values() if tc.id in inserted_ids)
+            )
+
+        created = iter(await self.create_test_cases_batch(plain_cases))
+        return [
+            by_uid[(data.set_id, data.case_uid)] if data.case_uid else next(created)
+            for data in cases_data
+        ]
+
+    async def _adjust_case_counts(self, deltas: Dict[str, int]) -> None:
+        """Apply test case count changes to the case_count column of case sets.
+
+        Args:
+            deltas: Mapping of case set ID to count change
+        """
+        for set_id, delta in deltas.items():
+            if delta:
+                await self.session.execute(
+                    update(CaseSet)
+                    .where(CaseSet.id == set_id)
+                    .values(case_count=CaseSet.case_count + delta)
                 )
-                self.session.add(new_case)
-                await self.session.flush()
-                await self.session.refresh(new_case)
-                result_cases.append(new_case)
 
-        return result_cases
+    def _dialect_insert(self) -> Callable[..., Any]:
+        """Get the INSERT construct supporting ON CONFLICT for the bound dialect.
+
+        Returns:
+            PostgreSQL or SQLite insert function
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            return pg_insert
+        return sqlite_insert
 
     async def duplicate_case_set(self, case_set_id: str, new_name: str) -> Optional[CaseSet]:
         """Duplicate a case set and all its test cases.
@@ -326,27 +779,31 @@ class CaseService:
         if source_set is None:
             return None
 
-        # Get source test cases
-        source_cases = await self.get_test_cases(case_set_id)
-
         # Create new case set
         new_set = CaseSet(name=new_name)
         self.session.add(new_set)
         await self.session.flush()
-        await self.session.refresh(new_set)
-
-        # Duplicate all test cases
-        for source_case in source_cases:
-            new_case = TestCase(
-                set_id=new_set.id,
-                case_uid=source_case.case_uid,
-                description=source_case.description,
-                user_input=source_case.user_input,
-                expected_output=source_case.expected_output,
-            )
-            self.session.add(new_case)
 
-        await self.session.flush()
-        await self.session.refresh(new_set)
+        # Copy the test cases in one INSERT ... SELECT. Each copy gets a fresh
+        # UUIDv7: a new timestamp and random prefix, then a counter in the low
+        # bits numbering the rows in source (created_at, id) order, so the
+        # copies keep that order and never reuse a source key
+        id_prefix = new_id()[:28]
+        row_number = func.row_number().over(order_by=(TestCase.created_at, TestCase.id))
+        result = await self.session.execute(
+            insert(TestCase).from_select(
+                ["id", "set_id", "case_uid", "description", "user_input", "expected_output", "created_at"],
+                select(
+                    cast(literal(id_prefix) + hex_pad(row_number, 8), UUIDType),
+                    literal(new_set.id, UUIDType),
+                    TestCase.case_uid,
+                    TestCase.description,
+                    TestCase.user_input,
+                    TestCase.expected_output,
+                    TestCase.created_at,
+                ).where(TestCase.set_id == case_set_id),
+            )
+        )
+        await self._adjust_case_counts({new_set.id: result.rowcount})
 
         return new_set
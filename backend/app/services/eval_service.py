@@ -2,17 +2,20 @@
 
 import asyncio
 import json
-from typing import Any, Optional, List, Tuple, Dict, Callable
+import logging
+from typing import Any, Iterable, Optional, List, Tuple, Dict, Callable
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import datetime, timedelta
 try:
     from typing import Self
 except ImportError:
     from typing_extensions import Self
 
-from sqlalchemy import delete, func, select
+import orjson
+from sqlalchemy import and_, bindparam, case as sql_case, delete, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.models.case_set import CaseSet
 from app.models.eval_result import EvalResult
@@ -24,15 +27,84 @@ from app.models.model_provider import ModelProvider
 from app.models.evaluator import Evaluator
 from app.models.task_evaluator import TaskEvaluator
 from app.schemas.eval import EvalSummary, EvalTaskCreate, RequestTemplate
+from app.services.case_service import CaseService
 from app.evaluators.base import BaseEvaluator
 from app.evaluators.exact_match import ExactMatchEvaluator
 from app.evaluators.json_compare import JsonCompareEvaluator
 from app.evaluators.llm_judge import LlmJudgeEvaluator
 from app.evaluators.code_executor import CodeEvaluator
+from app.utils.json_repair import JsonRepair
 from app.utils.llm_client import LlmClient
+from app.utils.ids import new_id
 from app.utils.templater import TemplateRenderer
 from app.database import async_session_factory
 
+logger = logging.getLogger(__name__)
+
+# Stateless evaluator shared by every run; used when a task has no evaluators configured
+_DEFAULT_EVALUATOR = ExactMatchEvaluator()
+
+# Built-in evaluators by name. Instances are shared by every service and run,
+# so they must stay stateless (evaluate() depends only on its arguments)
+_SYSTEM_EVALUATORS: Dict[str, BaseEvaluator] = {
+    "exact_match": _DEFAULT_EVALUATOR,
+    "json_compare": JsonCompareEvaluator(),
+}
+
+# Number of evaluation result rows sent per bulk INSERT
+_RESULT_INSERT_BATCH_SIZE = 50
+
+# Eager loads for the case set, model and provider a task's request context needs;
+# any other relationship raises on access instead of issuing a hidden SELECT
+_TASK_CONTEXT_LOADS = (
+    joinedload(EvalTask.case_set).raiseload("*"),
+    joinedload(EvalTask.model).joinedload(Model.provider).raiseload("*"),
+    raiseload("*"),
+)
+
+# Run statuses that mean an evaluation is still in progress. Rendered inline
+# rather than bound, so SQLite can match the ix_eval_runs_task_active partial index.
+_ACTIVE_RUN = EvalRun.status.in_(
+    bindparam("active_statuses", ["PENDING", "RUNNING"], expanding=True, literal_execute=True)
+)
+
+# Run an SSE stream can reuse: running runs sort first, then any run started
+# after the cutoff. Only the columns needed to route the stream are selected.
+# The task filter is repeated in each branch so each can use its own index
+# (ix_eval_runs_task_active / ix_eval_runs_task_started) instead of scanning
+# the task's whole run history.
+_REUSABLE_RUN = (
+    select(EvalRun.id, EvalRun.run_number, EvalRun.status, EvalRun.summary)
+    .where(
+        or_(
+            and_(EvalRun.task_id == bindparam("task_id"), _ACTIVE_RUN),
+            and_(EvalRun.task_id == bindparam("task_id"), EvalRun.started_at >= bindparam("cutoff")),
+        )
+    )
+    .order_by(sql_case((_ACTIVE_RUN, 0), else_=1), EvalRun.started_at.desc())
+    .limit(1)
+)
+
+
+def _sse(event: Dict[str, Any]) -> str:
+    """Frame an event as a Server-Sent Events data line."""
+    return "data: " + orjson.dumps(event).decode() + "\n\n"
+
+
+def format_json_if_valid(json_str: str) -> str:
+    """Format JSON string with indent=4 if valid, otherwise return original."""
+    if not json_str or not json_str.strip():
+        return json_str
+    json_str = json_str.strip()
+    # Check if it looks like JSON (starts with { or [)
+    if not (json_str.startswith('{') or json_str.startswith('[')):
+        return json_str
+    try:
+        parsed = json.loads(json_str)
+        return json.dumps(parsed, ensure_ascii=False, indent=4)
+    except (json.JSONDecodeError, ValueError):
+        return json_str
+
 
 class EvalService:
     """Service for managing evaluation tasks."""
@@ -44,10 +116,7 @@ class EvalService:
             session: Database session
         """
         self.session = session
-        self.evaluators: Dict[str, type[BaseEvaluator]] = {
-            "exact_match": ExactMatchEvaluator,
-            "json_compare": JsonCompareEvaluator,
-        }
+        self.evaluators: Dict[str, BaseEvaluator] = _SYSTEM_EVALUATORS
 
     @classmethod
     async def create(cls, session: AsyncSession) -> Self:
@@ -62,7 +131,7 @@ class EvalService:
         return cls(session)
 
     def _get_evaluator(self, evaluator_type: str) -> BaseEvaluator:
-        """Get an evaluator instance by type.
+        """Get the shared evaluator instance for a type.
 
         Args:
             evaluator_type: Type of evaluator
@@ -73,10 +142,10 @@ class EvalService:
         Raises:
             ValueError: If evaluator type is not found
         """
-        evaluator_class = self.evaluators.get(evaluator_type)
-        if evaluator_class is None:
+        evaluator = self.evaluators.get(evaluator_type)
+        if evaluator is None:
             raise ValueError(f"未知的评估器类型: {evaluator_type}")
-        return evaluator_class()
+        return evaluator
 
     async def _get_task_evaluators_with_clients(
         self,
@@ -93,29 +162,45 @@ class EvalService:
             - llm_client: LLM client for LLM evaluators, None for others
             - display_name: User-defined name from database
         """
-        print(f"[DEBUG] _get_task_evaluators_with_clients called with task_id={task_id}")
+        logger.debug("_get_task_evaluators_with_clients called with task_id=%s", task_id)
         # Get task evaluators from database
         result = await self.session.execute(
-            select(TaskEvaluator, Evaluator)
-            .join(Evaluator, TaskEvaluator.evaluator_id == Evaluator.id)
+            select(TaskEvaluator)
+            .options(joinedload(TaskEvaluator.evaluator))
             .where(TaskEvaluator.task_id == task_id)
             .order_by(TaskEvaluator.order_index)
         )
-        all_rows = result.all()
-        print(f"[DEBUG] Found {len(all_rows)} task evaluators in database")
+        all_rows = result.scalars().all()
+        logger.debug("Found %s task evaluators in database", len(all_rows))
+
+        # Load the models of all LLM judges in one query instead of one per judge
+        judge_model_ids = {
+            task_eval.evaluator.config.get("model_id")
+            for task_eval in all_rows
+            if task_eval.evaluator.type == "llm_judge"
+        }
+        judge_model_ids.discard(None)
+        judge_models: Dict[str, Tuple[Model, ModelProvider]] = {}
+        if judge_model_ids:
+            model_result = await self.session.execute(
+                select(Model, ModelProvider)
+                .join(ModelProvider, Model.provider_id == ModelProvider.id)
+                .where(Model.id.in_(judge_model_ids))
+            )
+            judge_models = {model.id: (model, provider) for model, provider in model_result.all()}
+        judge_clients: Dict[str, LlmClient] = {}
 
         evaluators = []
-        for task_eval, evaluator in all_rows:
-            config = evaluator.config_dict
+        for task_eval in all_rows:
+            evaluator = task_eval.evaluator
+            config = evaluator.config
             display_name = evaluator.name  # User-defined name from database
-            print(f"[DEBUG] Task evaluator: id={evaluator.id}, name={display_name}, type={evaluator.type}")
+            logger.debug("Task evaluator: id=%s, name=%s, type=%s", evaluator.id, display_name, evaluator.type)
 
             if evaluator.type == "code":
                 # Check if it's a system evaluator
-                if evaluator.name == "exact_match":
-                    evaluators.append((ExactMatchEvaluator(), None, display_name))
-                elif evaluator.name == "json_compare":
-                    evaluators.append((JsonCompareEvaluator(), None, display_name))
+                if evaluator.name in self.evaluators:
+                    evaluators.append((self.evaluators[evaluator.name], None, display_name))
                 else:
                     # Custom code evaluator
                     code = config.get("code", "")
@@ -126,29 +211,28 @@ class EvalService:
                 model_id = config.get("model_id")
                 if model_id:
                     # Get the configured model
-                    model_result = await self.session.execute(
-                        select(Model, ModelProvider)
-                        .join(ModelProvider, Model.provider_id == ModelProvider.id)
-                        .where(Model.id == model_id)
-                    )
-                    model_row = model_result.first()
+                    model_row = judge_models.get(model_id)
                     if model_row:
                         model, provider = model_row
-                        llm_client = LlmClient(
-                            base_url=provider.base_url,
-                            api_key=provider.api_key,
-                            endpoint=model.endpoint,
-                        )
-                        llm_client.model_code = model.model_code
+                        # Judges on the same model share one client and its connection pool
+                        llm_client = judge_clients.get(model_id)
+                        if llm_client is None:
+                            llm_client = LlmClient(
+                                base_url=provider.base_url,
+                                api_key=provider.api_key,
+                                endpoint=model.endpoint,
+                            )
+                            llm_client.model_code = model.model_code
+                            judge_clients[model_id] = llm_client
                         evaluators.append((LlmJudgeEvaluator(config, llm_client), llm_client, display_name))
                     else:
                         # Model not found, skip this evaluator
-                        print(f"[WARNING] LLM evaluator {display_name} configured model {model_id} not found, skipping")
+                        logger.warning("LLM evaluator %s configured model %s not found, skipping", display_name, model_id)
                 else:
                     # No model configured, skip this evaluator
-                    print(f"[WARNING] LLM evaluator {display_name} has no model_id configured, skipping")
+                    logger.warning("LLM evaluator %s has no model_id configured, skipping", display_name)
 
-        print(f"[DEBUG] Returning {len(evaluators)} evaluators")
+        logger.debug("Returning %s evaluators", len(evaluators))
         return evaluators
 
     async def get_eval_tasks(self, set_id: Optional[str] = None) -> List[EvalTask]:
@@ -222,7 +306,7 @@ class EvalService:
             name=data.name,
             set_id=data.set_id,
             model_id=data.model_id,
-            request_template=json.dumps(request_template),
+            request_template=orjson.dumps(request_template).decode(),
             system_prompt=data.system_prompt,
             status="PENDING",
         )
@@ -300,18 +384,19 @@ class EvalService:
         Returns:
             True if deleted, False if not found
         """
-        task = await self.get_eval_task(task_id)
-        if task is None:
+        result = await self.session.execute(
+            delete(EvalTask).where(EvalTask.id == task_id).returning(EvalTask.id)
+        )
+        if result.scalar() is None:
             return False
 
-        # Delete results (cascade will delete runs)
-        await self.session.execute(delete(EvalResult).where(EvalResult.task_id == task_id))
-
-        # Delete runs
-        await self.session.execute(delete(EvalRun).where(EvalRun.task_id == task_id))
-
-        # Delete task
-        await self.session.execute(delete(EvalTask).where(EvalTask.id == task_id))
+        # Runs, results and evaluator links cascade server-side; SQLite only
+        # enforces it with PRAGMA foreign_keys, which is off here, so clear
+        # children explicitly
+        if self.session.get_bind().dialect.name == "sqlite":
+            await self.session.execute(delete(EvalResult).where(EvalResult.task_id == task_id))
+            await self.session.execute(delete(EvalRun).where(EvalRun.task_id == task_id))
+            await self.session.execute(delete(TaskEvaluator).where(TaskEvaluator.task_id == task_id))
         return True
 
     async def get_eval_results(self, task_id: str) -> List[Tuple[EvalResult, TestCase]]:
@@ -327,7 +412,7 @@ class EvalService:
             select(EvalResult, TestCase)
             .join(TestCase, EvalResult.case_id == TestCase.id)
             .where(EvalResult.task_id == task_id)
-            .order_by(TestCase.created_at.asc())
+            .order_by(TestCase.created_at.asc(), TestCase.id.asc())
         )
         return list(result.all())
 
@@ -389,7 +474,7 @@ class EvalService:
             select(EvalResult, TestCase)
             .join(TestCase, EvalResult.case_id == TestCase.id)
             .where(EvalResult.run_id == run_id)
-            .order_by(TestCase.created_at.asc())
+            .order_by(TestCase.created_at.asc(), TestCase.id.asc())
         )
         return list(result.all())
 
@@ -402,24 +487,124 @@ class EvalService:
         Returns:
             Created run
         """
-        # Get existing runs to determine next run number
-        existing_result = await self.session.execute(
-            select(func.count(EvalRun.id)).where(EvalRun.task_id == task_id)
-        )
-        run_count = existing_result.scalar() or 0
-        next_run_number = run_count + 1
+        # max() is answered from the (task_id, run_number) index; the unique
+        # constraint catches a concurrent run taking the same number, in which
+        # case the number is read again once
+        for attempt in range(2):
+            last_run_number = await self.session.scalar(
+                select(func.coalesce(func.max(EvalRun.run_number), 0))
+                .where(EvalRun.task_id == task_id)
+            )
+            run = EvalRun(
+                task_id=task_id,
+                run_number=last_run_number + 1,
+                status="PENDING",
+            )
+            try:
+                async with self.session.begin_nested():
+                    self.session.add(run)
+            except IntegrityError:
+                if attempt:
+                    raise
+                continue
+            break
 
-        # Create run
-        run = EvalRun(
-            task_id=task_id,
-            run_number=next_run_number,
-            status="PENDING",
-        )
-        self.session.add(run)
-        await self.session.flush()
         await self.session.refresh(run)
         return run
 
+    async def _get_run_with_task(self, run_id: str) -> Optional[EvalRun]:
+        """Get a run with its task, case set, model and provider eagerly loaded.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Run or None if not found
+        """
+        result = await self.session.execute(
+            select(EvalRun)
+            .options(joinedload(EvalRun.task).options(*_TASK_CONTEXT_LOADS), raiseload("*"))
+            .where(EvalRun.id == run_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _task_context_row(
+        task: Optional[EvalTask],
+    ) -> Optional[Tuple[EvalTask, CaseSet, Model, ModelProvider]]:
+        """Unpack an eagerly loaded task into (task, case_set, model, provider).
+
+        Args:
+            task: Task loaded with _TASK_CONTEXT_LOADS
+
+        Returns:
+            Tuple of related rows, or None if the task or any related row is missing
+        """
+        if task is None or task.case_set is None or task.model is None or task.model.provider is None:
+            return None
+        return task, task.case_set, task.model, task.model.provider
+
+    @staticmethod
+    def _base_context(
+        task: EvalTask,
+        case_set: CaseSet,
+        model: Model,
+        provider: ModelProvider,
+    ) -> Dict[str, Any]:
+        """Build the template context fields shared by every case of a task.
+
+        Args:
+            task: Evaluation task
+            case_set: Task's case set
+            model: Task's model
+            provider: Model's provider
+
+        Returns:
+            Context without the per-case "case" entry
+        """
+        return {
+            "model_name": model.model_code,
+            "system_prompt": task.system_prompt or "",
+            "task_config": {
+                "base_url": provider.base_url,
+                "api_key": provider.api_key,
+                "model_code": model.model_code,
+            },
+            "case_set": {"name": case_set.name or ""},
+        }
+
+    @staticmethod
+    async def _cancel_pending(tasks: Iterable[asyncio.Task]) -> None:
+        """Cancel a run's unfinished case tasks and wait for them to exit.
+
+        Called before the run's LLM clients are closed, so no case keeps
+        calling the LLM after an error cut the run short.
+
+        Args:
+            tasks: Case evaluation tasks of the run
+        """
+        tasks = list(tasks)
+        for pending in tasks:
+            pending.cancel()
+        # Also retrieves the exceptions of tasks that failed on their own
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _close_llm_clients(
+        llm_client: LlmClient,
+        task_evaluators: List[Tuple[BaseEvaluator, Optional[LlmClient], str]],
+    ) -> None:
+        """Close the pooled connections of a run's LLM clients.
+
+        Args:
+            llm_client: Client used for the task's model
+            task_evaluators: Evaluators with their optional LLM clients
+        """
+        await llm_client.aclose()
+        for _, eval_llm_client, _ in task_evaluators:
+            if eval_llm_client is not None:
+                await eval_llm_client.aclose()
+
     async def get_run_number(self, run_id: str) -> int:
         """Get the run number for a run ID.
 
@@ -451,26 +636,14 @@ class EvalService:
         Returns:
             Summary dictionary
         """
-        print(f"[DEBUG] run_evaluation_with_ws started: run_id={run_id}, task_id={task_id}")
-        from app.models.case_set import CaseSet
+        logger.debug("run_evaluation_with_ws started: run_id=%s, task_id=%s", run_id, task_id)
 
-        # Get run with task
-        run_result = await self.session.execute(
-            select(EvalRun).where(EvalRun.id == run_id)
-        )
-        run = run_result.scalar_one_or_none()
+        # Get run with task and related data in one query
+        run = await self._get_run_with_task(run_id)
         if run is None:
             return {"total": 0, "passed": 0, "failed": 0, "pass_rate": 0.0}
 
-        # Get task with related data
-        task_result = await self.session.execute(
-            select(EvalTask, CaseSet, Model, ModelProvider)
-            .join(CaseSet, EvalTask.set_id == CaseSet.id)
-            .join(Model, EvalTask.model_id == Model.id)
-            .join(ModelProvider, Model.provider_id == ModelProvider.id)
-            .where(EvalTask.id == task_id)
-        )
-        row = task_result.first()
+        row = self._task_context_row(run.task)
         if row is None:
             run.status = "FAILED"
             run.error = "任务不存在"
@@ -479,22 +652,20 @@ class EvalService:
 
         task, case_set, model, provider = row
 
-        # Get all test cases
-        cases_result = await self.session.execute(
-            select(TestCase).where(TestCase.set_id == case_set.id)
+        # Count cases up front; the rows themselves are streamed below
+        total = await self.session.scalar(
+            select(func.count(TestCase.id)).where(TestCase.set_id == case_set.id)
         )
-        cases = list(cases_result.scalars().all())
 
-        if not cases:
+        if not total:
             run.status = "COMPLETED"
             run.completed_at = datetime.utcnow()
             summary = {"total": 0, "passed": 0, "failed": 0, "pass_rate": 0.0}
-            run.summary = json.dumps(summary)
+            run.summary = orjson.dumps(summary).decode()
             await self.session.commit()
             return summary
 
         # Initialize counters
-        total = len(cases)
         passed = 0
         failed = 0
 
@@ -502,61 +673,41 @@ class EvalService:
         concurrency = getattr(task, 'concurrency', 1) or 1
         # Ensure concurrency is at least 1 and at most total
         concurrency = max(1, min(concurrency, total))
-        print(f"[DEBUG] Evaluation setup: total={total}, concurrency={concurrency}")
+        logger.debug("Evaluation setup: total=%s, concurrency=%s", total, concurrency)
 
         # Create semaphore to control concurrency
         semaphore = asyncio.Semaphore(concurrency)
-        print(f"[DEBUG] Semaphore created with concurrency={concurrency}")
+        logger.debug("Semaphore created with concurrency=%s", concurrency)
 
-        # Create LLM client and template renderer
+        # Create LLM client and template renderer; the connection pool is
+        # sized to the concurrency so every in-flight case reuses a connection
         llm_client = LlmClient(
             base_url=provider.base_url,
             api_key=provider.api_key,
+            max_connections=concurrency,
         )
         renderer = TemplateRenderer()
+        # Parse and compile the request template once for all cases
+        render_request = renderer.compile_request_template(task.request_template_dict)
+        base_context = self._base_context(task, case_set, model, provider)
 
         # Pre-fetch task evaluators (cache for all cases to avoid repeated queries)
         task_evaluators = await self._get_task_evaluators_with_clients(task_id)
         # If no evaluators configured, use default exact match
         if not task_evaluators:
-            task_evaluators = [(ExactMatchEvaluator(), None, "精确匹配")]
-
-        # Queue to maintain result order
-        result_queue: asyncio.Queue[Tuple[int, Dict]] = asyncio.Queue()
-
-        def format_json_if_valid(json_str: str) -> str:
-            """Format JSON string with indent=4 if valid, otherwise return original."""
-            if not json_str or not json_str.strip():
-                return json_str
-            json_str = json_str.strip()
-            # Check if it looks like JSON (starts with { or [)
-            if not (json_str.startswith('{') or json_str.startswith('[')):
-                return json_str
-            try:
-                import json
-                parsed = json.loads(json_str)
-                return json.dumps(parsed, ensure_ascii=False, indent=4)
-            except (json.JSONDecodeError, ValueError):
-                return json_str
-
-        async def evaluate_single_case(index: int, case: TestCase) -> None:
-            """Evaluate a single test case and put result in queue."""
+            task_evaluators = [(_DEFAULT_EVALUATOR, None, "精确匹配")]
+
+        async def evaluate_single_case(index: int, case: TestCase) -> Tuple[int, Dict[str, Any]]:
+            """Evaluate a single test case and return its index with the result."""
             case_start_time = asyncio.get_event_loop().time()
-            print(f"[DEBUG] Case {index} ({case.case_uid}) started at {case_start_time:.3f}")
+            logger.debug("Case %s (%s) started at %.3f", index, case.case_uid, case_start_time)
             async with semaphore:
                 semaphore_acquire_time = asyncio.get_event_loop().time()
                 wait_time = semaphore_acquire_time - case_start_time
-                print(f"[DEBUG] Case {index} ({case.case_uid}) acquired semaphore after {wait_time*1000:.1f}ms wait")
-                # Prepare context
+                logger.debug("Case %s (%s) acquired semaphore after %.1fms wait", index, case.case_uid, wait_time*1000)
+                # Prepare context (only the case entry differs between cases)
                 context = {
-                    "model_name": model.model_code,
-                    "system_prompt": task.system_prompt or "",
-                    "task_config": {
-                        "base_url": provider.base_url,
-                        "api_key": provider.api_key,
-                        "model_code": model.model_code,
-                    },
-                    "case_set": {"name": case_set.name or ""},
+                    **base_context,
                     "case": {
                         "user_input": case.user_input,
                         "case_uid": case.case_uid,
@@ -565,10 +716,7 @@ class EvalService:
                 }
 
                 # Render request template
-                rendered_request = renderer.render_request_template(
-                    task.request_template_dict,
-                    context,
-                )
+                rendered_request = render_request(context)
 
                 # Call LLM and track statistics
                 actual_output = None
@@ -641,14 +789,11 @@ class EvalService:
                                     else:
                                         response = None
 
-                                    import json
-                                    import sys
-                                    from app.utils.json_repair import JsonRepair
                                     try:
                                         if response is None:
                                             eval_passed = False
                                             eval_log = "LLM 调用失败：未收到响应"
-                                            print(f"[ERROR] LLM评估器调用失败: 未收到响应", file=sys.stderr)
+                                            logger.error("LLM评估器调用失败: 未收到响应")
                                         else:
                                             result_data = json.loads(response)
                                             result_value = result_data.get("result", "failed").lower()
@@ -657,8 +802,8 @@ class EvalService:
                                     except json.JSONDecodeError as json_err:
                                         # Try to repair JSON
                                         try:
-                                            print(f"[ERROR] LLM评估器返回无效JSON: {json_err}", file=sys.stderr)
-                                            print(f"[ERROR] 原始响应: {response[:500]}", file=sys.stderr)
+                                            logger.error("LLM评估器返回无效JSON: %s", json_err)
+                                            logger.error("原始响应: %s", response[:500])
                                             repaired = JsonRepair.repair(response)
                                             result_data = json.loads(repaired)
                                             result_value = result_data.get("result", "failed").lower()
@@ -668,13 +813,12 @@ class EvalService:
                                         except Exception as repair_err:
                                             eval_passed = False
                                             eval_log = f"LLM返回无效JSON，修复失败: {response[:200]}"
-                                            print(f"[ERROR] JSON修复失败: {repair_err}", file=sys.stderr)
-                                            print(f"[ERROR] 原始响应: {response[:500]}", file=sys.stderr)
+                                            logger.error("JSON修复失败: %s", repair_err)
+                                            logger.error("原始响应: %s", response[:500])
                                 except Exception as e:
                                     eval_passed = False
                                     eval_log = f"LLM调用失败: {str(e)}"
-                                    import sys
-                                    print(f"[ERROR] LLM评估器异常: {type(e).__name__}: {e}", file=sys.stderr)
+                                    logger.error("LLM评估器异常: %s: %s", type(e).__name__, e)
                         else:
                             # Sync evaluator
                             eval_passed, eval_log = evaluator.evaluate(
@@ -687,7 +831,7 @@ class EvalService:
                             "passed": eval_passed,
                             "reason": eval_log,
                         })
-                        print(f"[DEBUG] Evaluator log: evaluator={display_name}, passed={eval_passed}")
+                        logger.debug("Evaluator log: evaluator=%s, passed=%s", display_name, eval_passed)
 
                         # Any evaluator failing means overall failure
                         if not eval_passed:
@@ -703,11 +847,11 @@ class EvalService:
                     # If we already have skill LLM duration, use total instead
                     execution_duration = total_duration_ms
 
-                # Put result in queue (use formatted outputs)
+                # Return result (use formatted outputs)
                 case_end_time = asyncio.get_event_loop().time()
                 total_case_time = (case_end_time - case_start_time) * 1000
-                print(f"[DEBUG] Case {index} ({case.case_uid}) completed at {case_end_time:.3f}, total time: {total_case_time:.1f}ms")
-                await result_queue.put((index, {
+                logger.debug("Case %s (%s) completed at %.3f, total time: %.1fms", index, case.case_uid, case_end_time, total_case_time)
+                return index, {
                     "case": case,
                     "actual_output": formatted_actual,
                     "is_passed": is_passed,
@@ -716,95 +860,110 @@ class EvalService:
                     "execution_duration": execution_duration,
                     "skill_tokens": skill_tokens,
                     "evaluator_tokens": evaluator_tokens,
-                }))
-
-        # Create a consumer coroutine to process results in order
-        async def result_consumer():
-            nonlocal passed, failed
-            completed = 0
-            next_expected_index = 1  # Start from 1 since enumerate starts at 1
-            results_buffer: Dict[int, Dict] = {}
-
-            while completed < total:
-                # Wait for any result
-                index, result_data = await result_queue.get()
-                results_buffer[index] = result_data
-                completed += 1
-
-                # Process results in order - process consecutive available indices
-                while next_expected_index in results_buffer:
-                    next_result = results_buffer.pop(next_expected_index)
-
-                    case = next_result["case"]
-
-                    # Create result record
-                    result = EvalResult(
-                        run_id=run_id,
-                        task_id=task_id,
-                        case_id=case.id,
-                        actual_output=next_result["actual_output"],
-                        is_passed=next_result["is_passed"],
-                        execution_error=next_result["execution_error"],
-                        evaluator_logs=json.dumps(next_result["evaluator_logs"]),
-                        execution_duration=next_result.get("execution_duration"),
-                        skill_tokens=next_result.get("skill_tokens"),
-                        evaluator_tokens=next_result.get("evaluator_tokens"),
-                    )
-                    self.session.add(result)
-                    await self.session.flush()
-
-                    # Broadcast result via WebSocket
-                    await ws_manager.broadcast_event(
-                        task_id,
-                        "result",
-                        {
-                            "run_id": run_id,
-                            "index": next_expected_index,
-                            "total": total,
-                            "case_id": case.id,
-                            "case_uid": case.case_uid,
-                            "is_passed": next_result["is_passed"],
-                            "actual_output": next_result["actual_output"],
-                            "execution_error": next_result["execution_error"],
-                            "evaluator_logs": next_result["evaluator_logs"],
-                            "execution_duration": next_result.get("execution_duration"),
-                            "skill_tokens": next_result.get("skill_tokens"),
-                            "evaluator_tokens": next_result.get("evaluator_tokens"),
-                        },
-                    )
-
-                    # Update counters
-                    if next_result["is_passed"]:
-                        passed += 1
-                    else:
-                        failed += 1
+                }
+
+        # Results waiting to be inserted and broadcast, in completion order
+        pending_rows: List[Dict[str, Any]] = []
+        completed = 0
+        total_skill_tokens = 0
+        total_evaluator_tokens = 0
+
+        async def process_result(index: int, result_data: Dict[str, Any]) -> Dict[str, Any]:
+            """Buffer a finished case's result row and build its broadcast payload.
+
+            Results are processed in completion order; each payload carries
+            its index, so clients do not need them in order.
+
+            Returns:
+                Result payload for the WebSocket broadcast
+            """
+            nonlocal completed, passed, failed, total_skill_tokens, total_evaluator_tokens
+            completed += 1
+            total_skill_tokens += result_data.get("skill_tokens") or 0
+            total_evaluator_tokens += result_data.get("evaluator_tokens") or 0
+            case = result_data["case"]
+
+            # Buffer result rows for a bulk insert; the broadcast payload
+            # does not need result ids
+            pending_rows.append({
+                "run_id": run_id,
+                "task_id": task_id,
+                "case_id": case.id,
+                "actual_output": result_data["actual_output"],
+                "is_passed": result_data["is_passed"],
+                "execution_error": result_data["execution_error"],
+                "evaluator_logs": orjson.dumps(result_data["evaluator_logs"]).decode(),
+                "execution_duration": result_data.get("execution_duration"),
+                "skill_tokens": result_data.get("skill_tokens"),
+                "evaluator_tokens": result_data.get("evaluator_tokens"),
+            })
+            if len(pending_rows) >= _RESULT_INSERT_BATCH_SIZE:
+                await self.session.execute(insert(EvalResult), pending_rows)
+                pending_rows.clear()
+
+            # Update counters
+            if result_data["is_passed"]:
+                passed += 1
+            else:
+                failed += 1
 
-                    # Move to next expected index
-                    next_expected_index += 1
+            return {
+                "run_id": run_id,
+                "index": index,
+                "completed": completed,
+                "total": total,
+                "case_id": case.id,
+                "case_uid": case.case_uid,
+                "is_passed": result_data["is_passed"],
+                "actual_output": result_data["actual_output"],
+                "execution_error": result_data["execution_error"],
+                "evaluator_logs": result_data["evaluator_logs"],
+                "execution_duration": result_data.get("execution_duration"),
+                "skill_tokens": result_data.get("skill_tokens"),
+                "evaluator_tokens": result_data.get("evaluator_tokens"),
+            }
 
-        # Start all evaluation tasks and consumer task
-        # Important: create all tasks first to ensure they start immediately and run concurrently
-        evaluation_tasks = [asyncio.create_task(evaluate_single_case(index, case))
-                            for index, case in enumerate(cases, start=1)]
-        consumer_task = asyncio.create_task(result_consumer())
+        # At most this many cases are started but not yet processed, so a slow
+        # insert or broadcast holds back new cases instead of piling up results
+        max_in_flight = concurrency * 2
+        in_flight: set[asyncio.Task] = set()
+
+        async def process_next_done() -> None:
+            """Wait for at least one in-flight case and process what finished."""
+            nonlocal in_flight
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            payloads = [await process_result(*finished.result()) for finished in done]
+
+            # Cases that finished together go out as one frame instead of one
+            # send per result to every connected client
+            if len(payloads) == 1:
+                await ws_manager.broadcast_event(task_id, "result", payloads[0])
+            else:
+                await ws_manager.broadcast_event(task_id, "results_batch", {"items": payloads})
 
-        print(f"[DEBUG] Started {len(evaluation_tasks)} evaluation tasks with concurrency={concurrency}")
+        try:
+            # Start each evaluation task as its case arrives from the stream,
+            # so the first cases run while later batches are still being fetched
+            index = 0
+            async for case in CaseService(self.session).iter_test_cases(case_set.id):
+                index += 1
+                in_flight.add(asyncio.create_task(evaluate_single_case(index, case)))
+                if len(in_flight) >= max_in_flight:
+                    await process_next_done()
 
-        # Wait for all evaluation tasks to complete
-        await asyncio.gather(*evaluation_tasks)
+            # The set may have changed since it was counted
+            total = index
 
-        # Wait for consumer to finish processing all results
-        await consumer_task
+            logger.debug("Started %s evaluation tasks with concurrency=%s", total, concurrency)
 
-        # Calculate statistics from results
-        # Get all results for this run to calculate token totals
-        results_query = await self.session.execute(
-            select(EvalResult).where(EvalResult.run_id == run_id)
-        )
-        all_results = results_query.scalars().all()
+            while in_flight:
+                await process_next_done()
 
-        total_skill_tokens = sum(r.skill_tokens or 0 for r in all_results)
-        total_evaluator_tokens = sum(r.evaluator_tokens or 0 for r in all_results)
+            if pending_rows:
+                await self.session.execute(insert(EvalResult), pending_rows)
+        finally:
+            await self._cancel_pending(in_flight)
+            await self._close_llm_clients(llm_client, task_evaluators)
 
         # Update run status
         run.status = "COMPLETED"
@@ -831,7 +990,7 @@ class EvalService:
             "total_skill_tokens": total_skill_tokens,
             "total_evaluator_tokens": total_evaluator_tokens,
         }
-        run.summary = json.dumps(summary)
+        run.summary = orjson.dumps(summary).decode()
 
         # Update task summary
         task.summary_dict = summary
@@ -887,15 +1046,11 @@ class EvalService:
         Returns:
             Tuple of (rendered_request, actual_response, error)
         """
-        # Get task with model and provider
+        # Get task with case set, model and provider
         task_result = await self.session.execute(
-            select(EvalTask, CaseSet, Model, ModelProvider)
-            .join(CaseSet, EvalTask.set_id == CaseSet.id)
-            .join(Model, EvalTask.model_id == Model.id)
-            .join(ModelProvider, Model.provider_id == ModelProvider.id)
-            .where(EvalTask.id == task_id)
+            select(EvalTask).options(*_TASK_CONTEXT_LOADS).where(EvalTask.id == task_id)
         )
-        row = task_result.first()
+        row = self._task_context_row(task_result.scalar_one_or_none())
         if row is None:
             raise ValueError(f"任务不存在: {task_id}")
 
@@ -914,10 +1069,11 @@ class EvalService:
         # Use system_prompt from task
         system_prompt = task.system_prompt or ""
 
-        # Debug: print context
-        print(f"[DEBUG] test_template context:")
-        print(f"[DEBUG]   task.system_prompt = {repr(task.system_prompt[:50] if task.system_prompt else None)}...")
-        print(f"[DEBUG]   resolved system_prompt = {repr(system_prompt[:50] if system_prompt else 'EMPTY')}...")
+        # Debug: log context
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("test_template context:")
+            logger.debug("  task.system_prompt = %r...", task.system_prompt[:50] if task.system_prompt else None)
+            logger.debug("  resolved system_prompt = %r...", system_prompt[:50] if system_prompt else 'EMPTY')
 
         context = {
             "model_name": model.model_code,
@@ -944,21 +1100,22 @@ class EvalService:
             context,
         )
 
-        # Debug: print rendered result
-        print(f"[DEBUG] Rendered request:")
-        print(f"[DEBUG]   system_prompt in messages: {rendered_request.get('messages', [{}])[0].get('content', 'NO_CONTENT')[:100] if rendered_request.get('messages') else 'NO_MESSAGES'}...")
-        print(f"[DEBUG]   Full rendered: {json.dumps(rendered_request, ensure_ascii=False)[:200]}...")
+        # Debug: log rendered result; the JSON dump is skipped unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Rendered request:")
+            logger.debug("  system_prompt in messages: %s...", rendered_request.get('messages', [{}])[0].get('content', 'NO_CONTENT')[:100] if rendered_request.get('messages') else 'NO_MESSAGES')
+            logger.debug("  Full rendered: %s...", json.dumps(rendered_request, ensure_ascii=False)[:200])
 
         # Try to send actual request
         actual_response = None
         error = None
         try:
-            llm_client = LlmClient(
+            async with LlmClient(
                 base_url=provider.base_url,
                 api_key=provider.api_key,
                 endpoint="",  # 测试不需要特定 endpoint
-            )
-            actual_response = await llm_client.call_llm(rendered_request)
+            ) as llm_client:
+                actual_response = await llm_client.call_llm(rendered_request)
         except Exception as e:
             error = str(e)
 
@@ -975,27 +1132,14 @@ class EvalService:
             run_id: Run ID
             progress_callback: Optional callback for progress updates
         """
-        from app.models.case_set import CaseSet
-
-        # Get run with task
-        run_result = await self.session.execute(
-            select(EvalRun).where(EvalRun.id == run_id)
-        )
-        run = run_result.scalar_one_or_none()
+        # Get run with task and related data in one query
+        run = await self._get_run_with_task(run_id)
         if run is None:
             return
 
         task_id = run.task_id
 
-        # Get task with related data
-        task_result = await self.session.execute(
-            select(EvalTask, CaseSet, Model, ModelProvider)
-            .join(CaseSet, EvalTask.set_id == CaseSet.id)
-            .join(Model, EvalTask.model_id == Model.id)
-            .join(ModelProvider, Model.provider_id == ModelProvider.id)
-            .where(EvalTask.id == task_id)
-        )
-        row = task_result.first()
+        row = self._task_context_row(run.task)
         if row is None:
             run.status = "FAILED"
             run.error = "任务不存在"
@@ -1004,224 +1148,247 @@ class EvalService:
 
         task, case_set, model, provider = row
 
-        # Get all test cases for the case set
-        cases_result = await self.session.execute(
-            select(TestCase).where(TestCase.set_id == case_set.id)
+        # Count cases up front; the rows themselves are streamed below
+        total = await self.session.scalar(
+            select(func.count(TestCase.id)).where(TestCase.set_id == case_set.id)
         )
-        cases = list(cases_result.scalars().all())
 
-        if not cases:
+        if not total:
             run.status = "COMPLETED"
             run.completed_at = datetime.utcnow()
-            run.summary = json.dumps({"total": 0, "passed": 0, "failed": 0, "pass_rate": 0.0})
+            run.summary = orjson.dumps({"total": 0, "passed": 0, "failed": 0, "pass_rate": 0.0}).decode()
+            task.status = "COMPLETED"
             await self.session.commit()
             return
 
         # Initialize counters
-        total = len(cases)
         passed = 0
         failed = 0
 
-        # Create LLM client
+        # Get concurrency from task, at least 1 and at most total
+        concurrency = max(1, min(getattr(task, "concurrency", 1) or 1, total))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Create LLM client with a connection pool sized to the concurrency
         llm_client = LlmClient(
             base_url=provider.base_url,
             api_key=provider.api_key,
+            max_connections=concurrency,
         )
 
-        # Create template renderer
+        # Create template renderer and compile the request template once
         renderer = TemplateRenderer()
+        render_request = renderer.compile_request_template(task.request_template_dict)
+        base_context = self._base_context(task, case_set, model, provider)
 
-        # Evaluate each case
-        for index, case in enumerate(cases, start=1):
-            # Prepare context
-            request_template = task.request_template_dict or {}
-            # Use system_prompt from task
-            system_prompt = task.system_prompt or ""
-
-            context = {
-                "model_name": model.model_code,
-                "system_prompt": system_prompt,
-                "task_config": {
-                    "base_url": provider.base_url,
-                    "api_key": provider.api_key,
-                    "model_code": model.model_code,
-                },
-                "case_set": {
-                    "name": case_set.name or "",
-                },
-                "case": {
-                    "user_input": case.user_input,
-                    "case_uid": case.case_uid,
-                    "description": case.description,
-                },
-            }
+        # Get task evaluators with their LLM clients once for all cases
+        task_evaluators = await self._get_task_evaluators_with_clients(task_id)
 
-            # Render request template
-            rendered_request = renderer.render_request_template(
-                task.request_template_dict,
-                context,
-            )
+        # If no evaluators configured, use default exact match
+        if not task_evaluators:
+            task_evaluators = [(_DEFAULT_EVALUATOR, None, "精确匹配")]
 
-            # Call LLM
-            actual_output = None
-            execution_error = None
-            try:
-                actual_output = await llm_client.call_llm(rendered_request)
-            except Exception as e:
-                execution_error = str(e)
+        async def _eval_one(
+            index: int,
+            case: TestCase,
+        ) -> Tuple[int, TestCase, Optional[str], bool, Optional[str], List[Dict[str, Any]]]:
+            """Evaluate a single test case.
 
-            # Evaluate result
-            evaluator_logs = []
-            is_passed = False
+            Returns:
+                Tuple of (index, case, formatted actual output, passed, execution error, evaluator logs)
+            """
+            async with semaphore:
+                # Prepare context (only the case entry differs between cases)
+                context = {
+                    **base_context,
+                    "case": {
+                        "user_input": case.user_input,
+                        "case_uid": case.case_uid,
+                        "description": case.description,
+                    },
+                }
+
+                # Render request template
+                rendered_request = render_request(context)
 
-            # When actual_output is None, it's an execution failure
-            if actual_output is None:
+                # Call LLM
+                actual_output = None
+                execution_error = None
+                try:
+                    actual_output = await llm_client.call_llm(rendered_request)
+                except Exception as e:
+                    execution_error = str(e)
+
+                # Evaluate result
+                evaluator_logs = []
                 is_passed = False
-            else:
+
                 # Format JSON outputs for better comparison
                 formatted_expected = format_json_if_valid(case.expected_output or "")
-                formatted_actual = format_json_if_valid(actual_output)
-
-                # Get task evaluators with their LLM clients
-                task_evaluators = await self._get_task_evaluators_with_clients(task_id)
-
-                # If no evaluators configured, use default exact match
-                if not task_evaluators:
-                    task_evaluators = [(ExactMatchEvaluator(), None, "精确匹配")]
-
-                # Run all evaluators (any fail means overall fail)
-                is_passed = True
-                for evaluator, eval_llm_client, display_name in task_evaluators:
-                    if evaluator.name == "code_executor":
-                        # Code evaluator needs async evaluation
-                        eval_passed, eval_log = await evaluator.evaluate_async(
-                            formatted_expected,
-                            formatted_actual,
-                        )
-                    elif evaluator.name == "llm_judge":
-                        # LLM judge needs async evaluation
-                        # Use the evaluator's configured LLM client
-                        if not eval_llm_client:
-                            eval_passed = False
-                            eval_log = "LLM评估器未配置模型"
-                        else:
-                            # Render prompt
-                            prompt = evaluator.prompt_template.format(
-                                expected=formatted_expected,
-                                actual=formatted_actual,
+                formatted_actual = format_json_if_valid(actual_output or "")
+
+                # When actual_output is None, it's an execution failure
+                if actual_output is None:
+                    is_passed = False
+                else:
+                    # Run all evaluators (any fail means overall fail)
+                    is_passed = True
+                    for evaluator, eval_llm_client, display_name in task_evaluators:
+                        if evaluator.name == "code_executor":
+                            # Code evaluator needs async evaluation
+                            eval_passed, eval_log = await evaluator.evaluate_async(
+                                formatted_expected,
+                                formatted_actual,
                             )
-                            request = {
-                                "model": eval_llm_client.model_code,
-                                "messages": [
-                                    {"role": "system", "content": "你是一个专业的评估助手。请以JSON格式返回评估结果。"},
-                                    {"role": "user", "content": prompt},
-                                ],
-                                "temperature": 0.1,
-                            }
-                            try:
-                                response = await eval_llm_client.call_llm(request)
-                                import json
-                                import sys
-                                from app.utils.json_repair import JsonRepair
+                        elif evaluator.name == "llm_judge":
+                            # LLM judge needs async evaluation
+                            # Use the evaluator's configured LLM client
+                            if not eval_llm_client:
+                                eval_passed = False
+                                eval_log = "LLM评估器未配置模型"
+                            else:
+                                # Render prompt
+                                prompt = evaluator.prompt_template.format(
+                                    expected=formatted_expected,
+                                    actual=formatted_actual,
+                                )
+                                request = {
+                                    "model": eval_llm_client.model_code,
+                                    "messages": [
+                                        {"role": "system", "content": "你是一个专业的评估助手。请以JSON格式返回评估结果。"},
+                                        {"role": "user", "content": prompt},
+                                    ],
+                                    "temperature": 0.1,
+                                }
                                 try:
-                                    if response is None:
-                                        eval_passed = False
-                                        eval_log = "LLM 调用失败：未收到响应"
-                                        print(f"[ERROR] LLM评估器调用失败: 未收到响应", file=sys.stderr)
-                                    else:
-                                        result_data = json.loads(response)
-                                        result_value = result_data.get("result", "failed").lower()
-                                        eval_log = result_data.get("reason", "")
-                                        eval_passed = result_value == "passed"
-                                except json.JSONDecodeError as json_err:
-                                    # Try to repair JSON
+                                    response = await eval_llm_client.call_llm(request)
                                     try:
-                                        print(f"[ERROR] LLM评估器返回无效JSON: {json_err}", file=sys.stderr)
-                                        print(f"[ERROR] 原始响应: {response[:500]}", file=sys.stderr)
-                                        repaired = JsonRepair.repair(response)
-                                        result_data = json.loads(repaired)
-                                        result_value = result_data.get("result", "failed").lower()
-                                        eval_log = result_data.get("reason", "")
-                                        eval_passed = result_value == "passed"
-                                        eval_log += " (JSON已自动修复)"
-                                    except Exception as repair_err:
-                                        eval_passed = False
-                                        eval_log = f"LLM返回无效JSON，修复失败: {response[:200]}"
-                                        print(f"[ERROR] JSON修复失败: {repair_err}", file=sys.stderr)
-                                        print(f"[ERROR] 原始响应: {response[:500]}", file=sys.stderr)
-                            except Exception as e:
-                                eval_passed = False
-                                eval_log = f"LLM调用失败: {str(e)}"
-                                import sys
-                                print(f"[ERROR] LLM评估器异常: {type(e).__name__}: {e}", file=sys.stderr)
-                    else:
-                        # Sync evaluator
-                        eval_passed, eval_log = evaluator.evaluate(
-                            formatted_expected,
-                            formatted_actual,
-                        )
-
-                    evaluator_logs.append({
-                        "evaluator": display_name,
-                        "passed": eval_passed,
-                        "reason": eval_log,
-                    })
+                                        if response is None:
+                                            eval_passed = False
+                                            eval_log = "LLM 调用失败：未收到响应"
+                                            logger.error("LLM评估器调用失败: 未收到响应")
+                                        else:
+                                            result_data = json.loads(response)
+                                            result_value = result_data.get("result", "failed").lower()
+                                            eval_log = result_data.get("reason", "")
+                                            eval_passed = result_value == "passed"
+                                    except json.JSONDecodeError as json_err:
+                                        # Try to repair JSON
+                                        try:
+                                            logger.error("LLM评估器返回无效JSON: %s", json_err)
+                                            logger.error("原始响应: %s", response[:500])
+                                            repaired = JsonRepair.repair(response)
+                                            result_data = json.loads(repaired)
+                                            result_value = result_data.get("result", "failed").lower()
+                                            eval_log = result_data.get("reason", "")
+                                            eval_passed = result_value == "passed"
+                                            eval_log += " (JSON已自动修复)"
+                                        except Exception as repair_err:
+                                            eval_passed = False
+                                            eval_log = f"LLM返回无效JSON，修复失败: {response[:200]}"
+                                            logger.error("JSON修复失败: %s", repair_err)
+                                            logger.error("原始响应: %s", response[:500])
+                                except Exception as e:
+                                    eval_passed = False
+                                    eval_log = f"LLM调用失败: {str(e)}"
+                                    logger.error("LLM评估器异常: %s: %s", type(e).__name__, e)
+                        else:
+                            # Sync evaluator
+                            eval_passed, eval_log = evaluator.evaluate(
+                                formatted_expected,
+                                formatted_actual,
+                            )
 
-                    # Any evaluator failing means overall failure
-                    if not eval_passed:
-                        is_passed = False
+                        evaluator_logs.append({
+                            "evaluator": display_name,
+                            "passed": eval_passed,
+                            "reason": eval_log,
+                        })
 
-            # Create result (use formatted output for display)
-            result = EvalResult(
-                run_id=run.id,
-                task_id=task_id,
-                case_id=case.id,
-                actual_output=formatted_actual,  # Save formatted version
-                is_passed=is_passed,
-                execution_error=execution_error,
-                evaluator_logs=json.dumps(evaluator_logs),
-            )
-            self.session.add(result)
-            await self.session.flush()
+                        # Any evaluator failing means overall failure
+                        if not eval_passed:
+                            is_passed = False
 
-            # Call progress callback if provided
-            if progress_callback:
-                await progress_callback({
+            return index, case, formatted_actual, is_passed, execution_error, evaluator_logs
+
+        eval_tasks: List[asyncio.Task] = []
+        try:
+            # Evaluate cases concurrently, bounded by the task concurrency;
+            # each case starts as soon as it arrives from the stream
+            async for case in CaseService(self.session).iter_test_cases(case_set.id):
+                eval_tasks.append(asyncio.create_task(_eval_one(len(eval_tasks) + 1, case)))
+
+            # The set may have changed since it was counted
+            total = len(eval_tasks)
+
+            # Insert results while later cases are still waiting on the LLM;
+            # rows are sent in batches and carry ids assigned up front, so
+            # progress events need no read-back
+            pending_rows: List[Dict[str, Any]] = []
+            for next_done in asyncio.as_completed(eval_tasks):
+                index, case, actual_output, is_passed, execution_error, evaluator_logs = await next_done
+
+                # Use formatted output for display
+                row = {
+                    "id": new_id(),
                     "run_id": run.id,
                     "task_id": task_id,
-                    "index": index,
-                    "total": total,
                     "case_id": case.id,
-                    "case_uid": case.case_uid,
-                    "result_id": result.id,
                     "actual_output": actual_output,
                     "is_passed": is_passed,
-                    "evaluator_logs": evaluator_logs,
-                })
+                    "execution_error": execution_error,
+                    "evaluator_logs": orjson.dumps(evaluator_logs).decode(),
+                }
+                pending_rows.append(row)
+                if len(pending_rows) >= _RESULT_INSERT_BATCH_SIZE:
+                    await self.session.execute(insert(EvalResult), pending_rows)
+                    pending_rows.clear()
+
+                # Call progress callback if provided
+                if progress_callback:
+                    await progress_callback({
+                        "run_id": run.id,
+                        "task_id": task_id,
+                        "index": index,
+                        "total": total,
+                        "case_id": case.id,
+                        "case_uid": case.case_uid,
+                        "result_id": row["id"],
+                        "actual_output": actual_output,
+                        "is_passed": is_passed,
+                        "evaluator_logs": evaluator_logs,
+                    })
 
-            if is_passed:
-                passed += 1
-            else:
-                failed += 1
+                if is_passed:
+                    passed += 1
+                else:
+                    failed += 1
+
+            if pending_rows:
+                await self.session.execute(insert(EvalResult), pending_rows)
+        finally:
+            await self._cancel_pending(eval_tasks)
+            await self._close_llm_clients(llm_client, task_evaluators)
 
         # Update run status
         run.status = "COMPLETED"
         run.completed_at = datetime.utcnow()
         pass_rate = (passed / total * 100) if total > 0 else 0.0
-        run.summary = json.dumps({
+        run.summary = orjson.dumps({
             "total": total,
             "passed": passed,
             "failed": failed,
             "pass_rate": pass_rate,
-        })
+        }).decode()
 
-        # Update task summary
+        # Update task summary and status; results, run and task are committed together
         task.summary_dict = {
             "total": total,
             "passed": passed,
             "failed": failed,
             "pass_rate": pass_rate,
         }
+        task.status = "COMPLETED"
 
         await self.session.commit()
 
@@ -1234,99 +1401,62 @@ class EvalService:
         Yields:
             SSE event strings
         """
-        # Check if there's already a running or recently created run for this task
-        from sqlalchemy import select, and_
-        from datetime import datetime, timedelta
-
-        # Check for running runs first
+        # Check if there's already a running or recently created run for this
+        # task; runs created within the last 5 minutes prevent duplicates
+        five_minutes_ago = datetime.utcnow() - timedelta(minutes=5)
         result = await self.session.execute(
-            select(EvalRun)
-            .where(
-                and_(
-                    EvalRun.task_id == task_id,
-                    EvalRun.status.in_(["PENDING", "RUNNING"])
-                )
-            )
-            .order_by(EvalRun.started_at.desc())
-            .limit(1)
+            _REUSABLE_RUN, {"task_id": task_id, "cutoff": five_minutes_ago}
         )
-        existing_run = result.scalar_one_or_none()
-
-        if existing_run:
-            # Use existing running run
-            run = existing_run
+        existing = result.first()
+
+        if existing is None:
+            # Create a new run
+            run = await self.create_eval_run(task_id)
+            run_id, run_number = run.id, run.run_number
+        elif existing.status == "COMPLETED":
+            # Recent run already completed - send completion without re-running
+            summary = orjson.loads(existing.summary) if existing.summary else {}
+            yield _sse({"type": "run_created", "run_id": existing.id, "run_number": existing.run_number})
+            yield _sse({"type": "complete", "status": "completed", "summary": summary})
+            return
         else:
-            # Check for any run created within last 5 minutes to prevent duplicates
-            five_minutes_ago = datetime.utcnow() - timedelta(minutes=5)
-            result = await self.session.execute(
-                select(EvalRun)
-                .where(
-                    and_(
-                        EvalRun.task_id == task_id,
-                        EvalRun.started_at >= five_minutes_ago
-                    )
-                )
-                .order_by(EvalRun.started_at.desc())
-                .limit(1)
-            )
-            recent_run = result.scalar_one_or_none()
-
-            if recent_run:
-                # Use the recent run
-                run = recent_run
-                if run.status == "COMPLETED":
-                    # Already completed - send completion without re-running
-                    summary = json.loads(run.summary) if run.summary else {}
-                    yield f"data: {json.dumps({'type': 'run_created', 'run_id': run.id, 'run_number': run.run_number})}\n\n"
-                    yield f"data: {json.dumps({'type': 'complete', 'status': 'completed', 'summary': summary})}\n\n"
-                    return
-                # If PENDING or RUNNING, continue with it
-            else:
-                # Create a new run
-                run = await self.create_eval_run(task_id)
+            # Continue with the running or recent run
+            run_id, run_number = existing.id, existing.run_number
 
         # Update task status
         task = await self.get_eval_task(task_id)
         if task is None:
-            yield f"data: {json.dumps({'type': 'error', 'message': '任务不存在'})}\n\n"
+            yield _sse({"type": "error", "message": "任务不存在"})
             return
 
+        # One commit covers the new run and the RUNNING status. It is not
+        # deferred to a flush: the transaction would then stay open for the
+        # whole evaluation, holding SQLite's write lock and hiding the status
+        # from other sessions until the run finished.
         task.status = "RUNNING"
         await self.session.commit()
 
         # Send run created event (or existing run info)
-        yield f"data: {json.dumps({'type': 'run_created', 'run_id': run.id, 'run_number': run.run_number})}\n\n"
-
-        # Store run_id to avoid accessing run object during evaluation
-        run_id = run.id
+        yield _sse({"type": "run_created", "run_id": run_id, "run_number": run_number})
 
         # Run evaluation directly in the same coroutine
         try:
             await self._run_evaluation(run_id, None)
         except Exception as e:
-            # Update run status on error
-            await self.session.refresh(run)
-            run.status = "FAILED"
-            run.error = str(e)
+            # Mark the run failed without re-reading it; the task row fetched
+            # above is reused rather than selected again
+            await self.session.execute(
+                update(EvalRun)
+                .where(EvalRun.id == run_id)
+                .values(status="FAILED", error=str(e))
+            )
+            task.status = "FAILED"
             await self.session.commit()
-            yield f"data: {json.dumps({'type': 'error', 'status': 'failed', 'error': str(e)})}\n\n"
-
-            # Update task status
-            task = await self.get_eval_task(task_id)
-            if task:
-                task.status = "FAILED"
-                await self.session.commit()
+            yield _sse({"type": "error", "status": "failed", "error": str(e)})
             return
 
-        # Refresh run to get final status
-        await self.session.refresh(run)
-
-        # Get final summary
-        summary = json.loads(run.summary) if run.summary else {}
-        yield f"data: {json.dumps({'type': 'complete', 'status': 'completed', 'summary': summary})}\n\n"
-
-        # Update task status
-        task = await self.get_eval_task(task_id)
-        if task:
-            task.status = "COMPLETED"
-            await self.session.commit()
\ No newline at end of file
+        # _run_evaluation updated this run and the task status in its final
+        # commit; the run it loaded is still in the identity map
+        run = await self.session.get(EvalRun, run_id)
+        summary = orjson.loads(run.summary) if run and run.summary else {}
+        yield _sse({"type": "complete", "status": "completed", "summary": summary})
\ No newline at end of file
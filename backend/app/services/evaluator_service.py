@@ -1,15 +1,13 @@
 """Service for evaluator management."""
 
-import json
 from typing import List, Optional, Dict, Any
 try:
     from typing import Self
 except ImportError:
     from typing_extensions import Self
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import bindparam, delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.evaluator import Evaluator
 from app.models.task_evaluator import TaskEvaluator
@@ -20,6 +18,29 @@ from app.schemas.evaluator import (
     EvaluatorResponse,
 )
 
+# Hot lookups are built once with bound parameters instead of per call
+_EVALUATOR_BY_ID = select(Evaluator).where(Evaluator.id == bindparam("evaluator_id"))
+_EVALUATOR_BY_NAME = select(Evaluator).where(Evaluator.name == bindparam("name"))
+_EVALUATORS_BY_NAMES = select(Evaluator).where(
+    Evaluator.name.in_(bindparam("names", expanding=True))
+)
+# Plain columns rather than entities: the rows are only read, so there is no
+# need to build ORM instances and add them to the identity map
+_TASK_EVALUATORS = (
+    select(
+        Evaluator.id,
+        Evaluator.name,
+        Evaluator.description,
+        Evaluator.type,
+        Evaluator.config,
+        Evaluator.is_system,
+        TaskEvaluator.order_index,
+    )
+    .join(TaskEvaluator, TaskEvaluator.evaluator_id == Evaluator.id)
+    .where(TaskEvaluator.task_id == bindparam("task_id"))
+    .order_by(TaskEvaluator.order_index)
+)
+
 
 class EvaluatorService:
     """Service for managing evaluators."""
@@ -72,7 +93,7 @@ class EvaluatorService:
             Evaluator or None if not found
         """
         result = await self.session.execute(
-            select(Evaluator).where(Evaluator.id == evaluator_id)
+            _EVALUATOR_BY_ID, {"evaluator_id": evaluator_id}
         )
         return result.scalar_one_or_none()
 
@@ -85,9 +106,7 @@ class EvaluatorService:
         Returns:
             Evaluator or None if not found
         """
-        result = await self.session.execute(
-            select(Evaluator).where(Evaluator.name == name)
-        )
+        result = await self.session.execute(_EVALUATOR_BY_NAME, {"name": name})
         return result.scalar_one_or_none()
 
     async def create_evaluator(self, data: EvaluatorCreate) -> Evaluator:
@@ -119,7 +138,7 @@ class EvaluatorService:
             name=data.name,
             description=data.description,
             type=data.type,
-            config=json.dumps(data.config, ensure_ascii=False),
+            config=data.config,
             is_system=0,
         )
         self.session.add(evaluator)
@@ -168,7 +187,7 @@ class EvaluatorService:
             elif evaluator.type == "code":
                 if "code" not in data.config:
                     raise ValueError("代码评估器必须配置 code")
-            evaluator.config_dict = data.config
+            evaluator.config = data.config
 
         await self.session.flush()
         await self.session.refresh(evaluator)
@@ -207,24 +226,11 @@ class EvaluatorService:
         Returns:
             List of evaluator info with order
         """
-        result = await self.session.execute(
-            select(TaskEvaluator, Evaluator)
-            .join(Evaluator, TaskEvaluator.evaluator_id == Evaluator.id)
-            .where(TaskEvaluator.task_id == task_id)
-            .order_by(TaskEvaluator.order_index)
-        )
-        evaluators = []
-        for task_eval, evaluator in result.all():
-            evaluators.append({
-                "id": evaluator.id,
-                "name": evaluator.name,
-                "description": evaluator.description,
-                "type": evaluator.type,
-                "config": evaluator.config_dict,
-                "is_system": bool(evaluator.is_system),
-                "order_index": task_eval.order_index,
-            })
-        return evaluators
+        result = await self.session.execute(_TASK_EVALUATORS, {"task_id": task_id})
+        return [
+            {**row, "is_system": bool(row["is_system"])}
+            for row in result.mappings().all()
+        ]
 
     async def set_task_evaluators(
         self,
@@ -241,35 +247,39 @@ class EvaluatorService:
             ValueError: If task or evaluator not found
         """
         # Verify task exists
-        task_result = await self.session.execute(
-            select(EvalTask).where(EvalTask.id == task_id)
+        task_exists = await self.session.scalar(
+            select(EvalTask.id).where(EvalTask.id == task_id)
         )
-        task = task_result.scalar_one_or_none()
-        if task is None:
+        if task_exists is None:
             raise ValueError(f"任务不存在: {task_id}")
 
-        # Verify all evaluators exist
-        for eval_id in evaluator_ids:
-            eval_result = await self.session.execute(
-                select(Evaluator).where(Evaluator.id == eval_id)
+        if len(set(evaluator_ids)) != len(evaluator_ids):
+            raise ValueError("评估器不能重复配置")
+
+        # Verify all evaluators exist with one query
+        if evaluator_ids:
+            found = await self.session.scalars(
+                select(Evaluator.id).where(Evaluator.id.in_(evaluator_ids))
             )
-            evaluator = eval_result.scalar_one_or_none()
-            if evaluator is None:
-                raise ValueError(f"评估器不存在: {eval_id}")
+            found_ids = set(found.all())
+            for eval_id in evaluator_ids:
+                if eval_id not in found_ids:
+                    raise ValueError(f"评估器不存在: {eval_id}")
 
         # Delete existing task evaluators
         await self.session.execute(
             delete(TaskEvaluator).where(TaskEvaluator.task_id == task_id)
         )
 
-        # Add new task evaluators
-        for index, eval_id in enumerate(evaluator_ids):
-            task_eval = TaskEvaluator(
-                task_id=task_id,
-                evaluator_id=eval_id,
-                order_index=index,
+        # Add new task evaluators in one bulk insert
+        if evaluator_ids:
+            await self.session.execute(
+                insert(TaskEvaluator),
+                [
+                    {"task_id": task_id, "evaluator_id": eval_id, "order_index": index}
+                    for index, eval_id in enumerate(evaluator_ids)
+                ],
             )
-            self.session.add(task_eval)
 
     async def get_default_evaluators(self) -> List[Evaluator]:
         """Get default evaluators for tasks without explicit configuration.
@@ -278,8 +288,6 @@ class EvaluatorService:
             List of default evaluators (exact_match, json_compare)
         """
         result = await self.session.execute(
-            select(Evaluator).where(
-                Evaluator.name.in_(["exact_match", "json_compare"])
-            )
+            _EVALUATORS_BY_NAMES, {"names": ["exact_match", "json_compare"]}
         )
         return list(result.scalars().all())
@@ -1,13 +1,17 @@
 """Service for Excel import/export operations."""
 
+import asyncio
 import io
-from typing import Optional, List, Tuple
+import itertools
+from collections.abc import Iterable
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 try:
     from typing import Self
 except ImportError:
     from typing_extensions import Self
 
 import pandas as pd
+from openpyxl import Workbook, load_workbook
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.case_set import CaseSet
@@ -16,7 +20,7 @@ from app.schemas.cases import CaseSetCreate, ExcelRowData, TestCaseCreate
 from app.services.case_service import CaseService
 
 
-class ExcelParseError(Exception):
+class ExcelParseError(ValueError):
     """Exception raised when Excel parsing fails."""
 
     def __init__(self, message: str, row: Optional[int] = None) -> None:
@@ -45,6 +49,28 @@ class ExcelService:
     # Required columns for test cases
     REQUIRED_CASE_COLUMNS = {COL_USER_INPUT}
 
+    # Accepted header spellings (lowercased) for each column
+    COLUMN_ALIASES = {
+        "用例编号": COL_CASE_UID,
+        "编号": COL_CASE_UID,
+        "id": COL_CASE_UID,
+        "case_uid": COL_CASE_UID,
+        "用例描述": COL_DESCRIPTION,
+        "描述": COL_DESCRIPTION,
+        "description": COL_DESCRIPTION,
+        "用户输入": COL_USER_INPUT,
+        "输入": COL_USER_INPUT,
+        "user_input": COL_USER_INPUT,
+        "预期输出": COL_EXPECTED_OUTPUT,
+        "expected": COL_EXPECTED_OUTPUT,
+        "expected_output": COL_EXPECTED_OUTPUT,
+        "用例集名称": COL_SET_NAME,
+        "用例集": COL_SET_NAME,
+        "set_name": COL_SET_NAME,
+        "系统提示词": COL_SYSTEM_PROMPT,
+        "system_prompt": COL_SYSTEM_PROMPT,
+    }
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize service with database session.
 
@@ -65,7 +91,7 @@ class ExcelService:
             ExcelService instance
         """
         service = cls(session)
-        service.case_service = await CaseService.create(session)
+        service.case_service = CaseService(session)
         return service
 
     def _normalize_column_name(self, col: str) -> str:
@@ -78,27 +104,7 @@ class ExcelService:
             Normalized column name
         """
         col = str(col).strip()
-        mapping = {
-            "用例编号": self.COL_CASE_UID,
-            "编号": self.COL_CASE_UID,
-            "id": self.COL_CASE_UID,
-            "case_uid": self.COL_CASE_UID,
-            "用例描述": self.COL_DESCRIPTION,
-            "描述": self.COL_DESCRIPTION,
-            "description": self.COL_DESCRIPTION,
-            "用户输入": self.COL_USER_INPUT,
-            "输入": self.COL_USER_INPUT,
-            "user_input": self.COL_USER_INPUT,
-            "预期输出": self.COL_EXPECTED_OUTPUT,
-            "expected": self.COL_EXPECTED_OUTPUT,
-            "expected_output": self.COL_EXPECTED_OUTPUT,
-            "用例集名称": self.COL_SET_NAME,
-            "用例集": self.COL_SET_NAME,
-            "set_name": self.COL_SET_NAME,
-            "系统提示词": self.COL_SYSTEM_PROMPT,
-            "system_prompt": self.COL_SYSTEM_PROMPT,
-        }
-        return mapping.get(col.lower(), col)
+        return self.COLUMN_ALIASES.get(col.lower(), col)
 
     def _find_column_index(self, df: pd.DataFrame, target_col: str) -> Optional[int]:
         """Find the index of a column by normalized name.
@@ -110,11 +116,66 @@ class ExcelService:
         Returns:
             Column index or None if not found
         """
-        normalized_cols = [self._normalize_column_name(col) for col in df.columns]
-        try:
-            return normalized_cols.index(target_col)
-        except ValueError:
+        return self._column_indices(df.columns).get(target_col)
+
+    def _column_indices(self, header: Iterable[Any]) -> Dict[str, int]:
+        """Map normalized column names to their indices.
+
+        Args:
+            header: Header row values
+
+        Returns:
+            Dict of normalized column name to index, first occurrence wins
+        """
+        indices: Dict[str, int] = {}
+        for idx, col in enumerate(header):
+            indices.setdefault(self._normalize_column_name(col), idx)
+        return indices
+
+    @staticmethod
+    def _cell_text(value: Any) -> Optional[str]:
+        """Convert a cell value to stripped text.
+
+        Args:
+            value: Raw cell value
+
+        Returns:
+            Stripped text, or None for empty cells
+        """
+        if value is None or pd.isna(value):
             return None
+        return str(value).strip() or None
+
+    def _read_rows(self, file_content: bytes) -> List[Sequence[Any]]:
+        """Read the values of every row on the first sheet of a workbook.
+
+        The workbook is read in openpyxl's read-only mode, which parses rows
+        as they are iterated instead of building every styled cell up front.
+        Legacy .xls files, which openpyxl cannot read, go through pandas.
+        This is blocking, CPU-bound work; async callers run it in a thread.
+
+        Args:
+            file_content: Excel file content as bytes
+
+        Returns:
+            Row value tuples, header row first
+
+        Raises:
+            ExcelParseError: If the file cannot be read
+        """
+        try:
+            workbook = load_workbook(io.BytesIO(file_content), read_only=True, data_only=True)
+        except Exception:
+            try:
+                df = pd.read_excel(io.BytesIO(file_content), header=None)
+            except Exception as e:
+                raise ExcelParseError(f"无法读取Excel文件: {e!s}")
+            return list(df.itertuples(index=False, name=None))
+
+        try:
+            return list(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
 
     def _parse_case_set_info(self, df: pd.DataFrame) -> str:
         """Parse case set information from first row.
@@ -128,19 +189,32 @@ class ExcelService:
         Raises:
             ExcelParseError: If case set name is not found
         """
-        first_row = df.iloc[0]
+        return self._parse_case_set_name(list(df.columns), tuple(df.iloc[0]))
 
+    def _parse_case_set_name(self, header: Sequence[Any], first_row: Sequence[Any]) -> str:
+        """Parse the case set name from the first data row.
+
+        Args:
+            header: Header row values
+            first_row: First row after the header
+
+        Returns:
+            Case set name
+
+        Raises:
+            ExcelParseError: If case set name is not found
+        """
         # Try to find set name column
         set_name = None
 
-        for col in df.columns:
+        for idx, col in enumerate(header):
             normalized = self._normalize_column_name(col)
-            if normalized == self.COL_SET_NAME:
-                set_name = str(first_row[col]).strip()
+            if normalized == self.COL_SET_NAME and idx < len(first_row):
+                set_name = str(first_row[idx]).strip()
 
         # If no explicit columns, try to infer from first column
         if set_name is None or set_name == "" or set_name.lower() in ["nan", "none"]:
-            first_col_value = str(first_row.iloc[0]).strip()
+            first_col_value = str(first_row[0]).strip() if first_row else ""
             if first_col_value and first_col_value.lower() not in ["nan", "none", "用例编号", "id"]:
                 set_name = first_col_value
 
@@ -159,53 +233,77 @@ class ExcelService:
         Returns:
             List of parsed test cases
 
+        Raises:
+            ExcelParseError: If required columns are missing or data is invalid
+        """
+        return self._parse_test_cases_stream(
+            df.itertuples(index=False, name=None),
+            self._column_indices(df.columns),
+            set_id,
+        )
+
+    def _parse_test_cases_stream(
+        self,
+        rows: Iterable[Sequence[Any]],
+        col_idx: Dict[str, int],
+        set_id: str,
+        first_row: int = 2,
+        unique_uids: bool = False,
+    ) -> List[TestCaseCreate]:
+        """Parse test cases from row values in one pass.
+
+        Args:
+            rows: Data rows (without the header row)
+            col_idx: Normalized column name to index, see _column_indices
+            set_id: Case set ID for the test cases
+            first_row: Sheet row number (1-indexed) of the first data row, for errors
+            unique_uids: Reject a case_uid that appears on more than one row
+
+        Returns:
+            List of parsed test cases
+
         Raises:
             ExcelParseError: If required columns are missing or data is invalid
         """
         # Find column indices
-        user_input_idx = self._find_column_index(df, self.COL_USER_INPUT)
-        case_uid_idx = self._find_column_index(df, self.COL_CASE_UID)
-        description_idx = self._find_column_index(df, self.COL_DESCRIPTION)
-        expected_idx = self._find_column_index(df, self.COL_EXPECTED_OUTPUT)
+        user_input_idx = col_idx.get(self.COL_USER_INPUT)
+        case_uid_idx = col_idx.get(self.COL_CASE_UID)
+        description_idx = col_idx.get(self.COL_DESCRIPTION)
+        expected_idx = col_idx.get(self.COL_EXPECTED_OUTPUT)
 
         if user_input_idx is None:
             raise ExcelParseError(f"缺少必需列: {self.COL_USER_INPUT}")
 
+        def cell(row: Sequence[Any], idx: Optional[int]) -> Optional[str]:
+            # Read-only sheets may return short rows when trailing cells are empty
+            if idx is None or idx >= len(row):
+                return None
+            return self._cell_text(row[idx])
+
         test_cases = []
-        for idx, row in df.iterrows():
-            row_num = idx + 2  # 1-indexed, +1 for header row
-            user_input = row.iloc[user_input_idx]
+        uid_rows: Dict[str, int] = {}
+        for row_number, row in enumerate(rows, start=first_row):
+            user_input = cell(row, user_input_idx)
 
             # Skip empty rows
-            if pd.isna(user_input) or str(user_input).strip() == "":
+            if user_input is None:
                 continue
 
-            # Extract case data
-            case_uid = None
-            if case_uid_idx is not None:
-                case_uid_val = row.iloc[case_uid_idx]
-                if pd.notna(case_uid_val) and str(case_uid_val).strip():
-                    case_uid = str(case_uid_val).strip()
-
-            description = None
-            if description_idx is not None:
-                desc_val = row.iloc[description_idx]
-                if pd.notna(desc_val) and str(desc_val).strip():
-                    description = str(desc_val).strip()
-
-            expected_output = None
-            if expected_idx is not None:
-                expected_val = row.iloc[expected_idx]
-                if pd.notna(expected_val) and str(expected_val).strip():
-                    expected_output = str(expected_val).strip()
+            case_uid = cell(row, case_uid_idx)
+            if unique_uids and case_uid is not None:
+                if case_uid in uid_rows:
+                    raise ExcelParseError(
+                        f"用例编号重复: {case_uid} (与第{uid_rows[case_uid]}行相同)", row=row_number
+                    )
+                uid_rows[case_uid] = row_number
 
             test_cases.append(
                 TestCaseCreate(
                     set_id=set_id,
                     case_uid=case_uid,
-                    description=description,
-                    user_input=str(user_input).strip(),
-                    expected_output=expected_output,
+                    description=cell(row, description_idx),
+                    user_input=user_input,
+                    expected_output=cell(row, expected_idx),
                 )
             )
 
@@ -214,7 +312,7 @@ class ExcelService:
 
         return test_cases
 
-    async def import_excel(self, file_content: bytes, filename: str) -> Tuple[CaseSet, List[TestCase]]:
+    async def import_excel(self, file_content: bytes, filename: str) -> Tuple[CaseSet, int]:
         """Import case set and test cases from Excel file.
 
         Args:
@@ -222,7 +320,7 @@ class ExcelService:
             filename: Original filename
 
         Returns:
-            Tuple of (created case set, created test cases)
+            Tuple of (created case set, number of created test cases)
 
         Raises:
             ExcelParseError: If Excel file is invalid
@@ -231,29 +329,31 @@ class ExcelService:
         if not filename.lower().endswith((".xlsx", ".xls")):
             raise ExcelParseError("仅支持 .xlsx 和 .xls 格式的文件")
 
-        try:
-            df = pd.read_excel(io.BytesIO(file_content))
-        except Exception as e:
-            raise ExcelParseError(f"无法读取Excel文件: {e!s}")
-
-        if df.empty:
+        # Parse the workbook off the event loop so other requests keep being served
+        rows = await asyncio.to_thread(self._read_rows, file_content)
+        if len(rows) < 2:
             raise ExcelParseError("Excel文件为空")
+        header, first_row = rows[0], rows[1]
 
         # Parse case set info from first row
-        set_name = self._parse_case_set_info(df)
+        set_name = self._parse_case_set_name(header, first_row)
 
         # Create case set
         case_set_data = CaseSetCreate(name=set_name)
         case_set = await self.case_service.create_case_set(case_set_data)
 
-        # Parse test cases (skip first row which contains case set info)
-        case_df = df.iloc[1:].reset_index(drop=True)
-        test_cases_data = self._parse_test_cases(case_df, case_set.id)
+        # Parse the remaining rows as test cases (first row holds case set info)
+        # case_uids must be unique within a set, so repeats in the sheet are rejected
+        test_cases_data = self._parse_test_cases_stream(
+            itertools.islice(rows, 2, None), self._column_indices(header), case_set.id,
+            first_row=3, unique_uids=True,
+        )
 
-        # Create test cases
-        test_cases = await self.case_service.create_test_cases_batch(test_cases_data)
+        # The set is new and the sheet's case_uids are distinct, so nothing can collide:
+        # load them with COPY / executemany instead of building ORM objects for each row
+        cases_created = await self.case_service.bulk_load_test_cases(case_set.id, test_cases_data)
 
-        return case_set, test_cases
+        return case_set, cases_created
 
     async def import_to_set(self, file_content: bytes, case_set: CaseSet) -> List[TestCase]:
         """Import test cases to an existing case set with deduplication by case_uid.
@@ -268,17 +368,15 @@ class ExcelService:
         Raises:
             ExcelParseError: If Excel file is invalid
         """
-        try:
-            df = pd.read_excel(io.BytesIO(file_content))
-        except Exception as e:
-            raise ExcelParseError(f"无法读取Excel文件: {e!s}")
-
-        if df.empty:
+        # Parse the workbook off the event loop so other requests keep being served
+        rows = await asyncio.to_thread(self._read_rows, file_content)
+        if len(rows) < 2:
             raise ExcelParseError("Excel文件为空")
 
-        # When importing to existing set, all rows are test cases
-        # (First row with case set name was consumed as header by pandas)
-        test_cases_data = self._parse_test_cases(df, case_set.id)
+        # When importing to existing set, all rows after the header are test cases
+        test_cases_data = self._parse_test_cases_stream(
+            itertools.islice(rows, 1, None), self._column_indices(rows[0]), case_set.id
+        )
 
         # Use upsert to create or update test cases (deduplicate by case_uid)
         test_cases = await self.case_service.upsert_test_cases_batch(test_cases_data)
@@ -302,27 +400,19 @@ class ExcelService:
         if case_set is None:
             raise ValueError(f"用例集不存在: {case_set_id}")
 
-        # Get test cases
-        test_cases = await self.case_service.get_test_cases(case_set_id)
-
-        # Create DataFrame with test cases only (no case set info row)
-        data = []
-        for tc in test_cases:
-            data.append(
-                {
-                    "用例编号": tc.case_uid or "",
-                    "用例描述": tc.description or "",
-                    "用户输入": tc.user_input,
-                    "预期输出": tc.expected_output or "",
-                }
-            )
-
-        df = pd.DataFrame(data)
+        # Write-only mode serializes each row as it is appended instead of
+        # keeping the whole sheet in memory (no case set info row)
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append([self.COL_CASE_UID, self.COL_DESCRIPTION, self.COL_USER_INPUT, self.COL_EXPECTED_OUTPUT])
+        async for tc in self.case_service.iter_test_cases(case_set_id):
+            sheet.append([
+                tc.case_uid or "",
+                tc.description or "",
+                tc.user_input,
+                tc.expected_output or "",
+            ])
 
-        # Write to Excel
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="Sheet1")
-        output.seek(0)
-
-        return output.read()
+        workbook.save(output)
+        return output.getvalue()
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
 from app.models.model import Model
 from app.models.model_provider import ModelProvider
@@ -95,6 +95,9 @@ class ModelService:
         """Get all models, optionally filtered by provider."""
         query = select(Model, ModelProvider).join(
             ModelProvider, Model.provider_id == ModelProvider.id
+        ).options(
+            # The listing never exposes the key, so don't fetch it
+            defer(ModelProvider.api_key, raiseload=True),
         ).order_by(ModelProvider.name, Model.display_name)
 
         if provider_id:
@@ -0,0 +1,62 @@
+"""Identifier generation utilities."""
+
+import os
+import time
+import uuid
+from typing import List
+
+_TIMESTAMP_MASK = (1 << 48) - 1
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def _build_uuid7(timestamp_ms: int, rand: int) -> uuid.UUID:
+    """Pack a millisecond timestamp and 80 random bits into a UUIDv7."""
+    value = (timestamp_ms & _TIMESTAMP_MASK) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # RFC 4122 variant
+    value |= rand & _RAND_B_MASK  # rand_b
+    return uuid.UUID(int=value)
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The top 48 bits hold the Unix timestamp in milliseconds, so ids created
+    later sort after earlier ones and inserts land at the end of key indexes.
+
+    Returns:
+        A new UUIDv7
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    return _build_uuid7(timestamp_ms, int.from_bytes(os.urandom(10), "big"))
+
+
+def new_id() -> str:
+    """Generate a new primary key value.
+
+    Returns:
+        UUIDv7 string in canonical 36-character form
+    """
+    return str(uuid7())
+
+
+def new_ids(count: int) -> List[str]:
+    """Generate a batch of primary key values.
+
+    Uses one timestamp and a single entropy draw for the whole batch. The ids
+    are returned in ascending order, so rows inserted in list order also sort
+    in that order by id.
+
+    Args:
+        count: Number of ids to generate
+
+    Returns:
+        List of UUIDv7 strings
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    entropy = os.urandom(10 * count)
+    return sorted(
+        str(_build_uuid7(timestamp_ms, int.from_bytes(entropy[i:i + 10], "big")))
+        for i in range(0, 10 * count, 10)
+    )
@@ -4,6 +4,38 @@ import json
 import re
 from typing import Any, Optional
 
+# Patterns are compiled once at import rather than looked up on every repair
+_RE_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_RE_COMMA_BEFORE_CLOSE = re.compile(r',\s*([}\]])')
+_RE_MISSING_COMMA = re.compile(r'([}\]])\s*([{[])')
+_RE_LINE_COMMENT = re.compile(r'//.*?\n')
+_RE_BLOCK_COMMENT = re.compile(r'/\*.*?\*/')
+_RE_UNQUOTED_KEY = re.compile(r'([{,]\s*)([a-zA-Z_][a-zA-Z0-9_]*)(\s*:)')
+_RE_NONE = re.compile(r'\bNone\b')
+_RE_TRUE = re.compile(r'\bTRUE\b')
+_RE_FALSE = re.compile(r'\bFALSE\b')
+_RE_UNQUOTED_VALUE = re.compile(r':\s*([a-zA-Z_][a-zA-Z0-9_]*)([,\s}])')
+_RE_SPLIT_STRING = re.compile(r'"\s*\n\s*"')
+_RE_MD_JSON = re.compile(r'```json\s*([\s\S]*?)\s*```', re.IGNORECASE)
+_RE_MD_ANY = re.compile(r'```\s*([\s\S]*?)\s*```')
+_RE_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]')
+
+# A double-quoted string (running to the end if unterminated; a quote after a
+# backslash does not open one) or a single-quoted string
+_RE_QUOTED_STRING = re.compile(r'(?<!\\)"(?:[^"\\]|\\.)*"?' + r"|'[^']*'")
+_RE_BARE_DOUBLE_QUOTE = re.compile(r'(?<!\\)"')
+
+# Bare words that are valid JSON values and must not be quoted
+_JSON_KEYWORDS = frozenset({'true', 'false', 'null'})
+
+
+def _single_to_double_quoted(match: re.Match) -> str:
+    """Rewrite a single-quoted string token as a JSON string; keep double-quoted ones."""
+    token = match.group(0)
+    if token[0] == '"':
+        return token
+    return '"' + _RE_BARE_DOUBLE_QUOTE.sub(r'\\"', token[1:-1]) + '"'
+
 
 class JsonRepair:
     """Utility class for repairing malformed JSON strings."""
@@ -65,17 +97,17 @@ class JsonRepair:
             Fixed JSON string
         """
         # Trailing commas in objects/arrays
-        json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+        json_str = _RE_TRAILING_COMMA.sub(r'\1', json_str)
 
         # Extra commas before end of object/array
-        json_str = re.sub(r',\s*([}\]])', r'\1', json_str)
+        json_str = _RE_COMMA_BEFORE_CLOSE.sub(r'\1', json_str)
 
         # Missing commas between objects
-        json_str = re.sub(r'([}\]])\s*([{[])', r'\1,\2', json_str)
+        json_str = _RE_MISSING_COMMA.sub(r'\1,\2', json_str)
 
         # Comments in JSON (// ...)
-        json_str = re.sub(r'//.*?\n', '', json_str)
-        json_str = re.sub(r'/\*.*?\*/', '', json_str)
+        json_str = _RE_LINE_COMMENT.sub('', json_str)
+        json_str = _RE_BLOCK_COMMENT.sub('', json_str)
 
         return json_str
 
@@ -91,7 +123,7 @@ class JsonRepair:
         """
         # Missing quotes around property names (simple keys)
         # But avoid keys that are already quoted
-        json_str = re.sub(r'([{,]\s*)([a-zA-Z_][a-zA-Z0-9_]*)(\s*:)', r'\1"\2"\3', json_str)
+        json_str = _RE_UNQUOTED_KEY.sub(r'\1"\2"\3', json_str)
 
         return json_str
 
@@ -106,47 +138,20 @@ class JsonRepair:
             Fixed JSON string
         """
         # Fix boolean and null keywords BEFORE quote handling
-        json_str = re.sub(r'\bNone\b', 'null', json_str)
-        json_str = re.sub(r'\bTRUE\b', 'true', json_str)
-        json_str = re.sub(r'\bFALSE\b', 'false', json_str)
-
-        # Now handle single quotes - but be careful not to quote already quoted content
-        # Only replace single quotes that are not part of double-quoted strings
-        in_string = False
-        result = []
-        i = 0
-        while i < len(json_str):
-            c = json_str[i]
-            if c == '"' and (i == 0 or json_str[i-1] != '\\'):
-                in_string = not in_string
-                result.append(c)
-            elif not in_string and c == "'":
-                # Check if this is a single-quoted string
-                # Find the matching single quote
-                j = i + 1
-                while j < len(json_str) and json_str[j] != "'":
-                    j += 1
-                if j < len(json_str):
-                    # Replace single quotes with double quotes
-                    result.append('"')
-                    result.append(json_str[i+1:j])
-                    result.append('"')
-                    i = j
-                else:
-                    result.append(c)
-            else:
-                result.append(c)
-            i += 1
-
-        json_str = ''.join(result)
+        json_str = _RE_NONE.sub('null', json_str)
+        json_str = _RE_TRUE.sub('true', json_str)
+        json_str = _RE_FALSE.sub('false', json_str)
+
+        # Now handle single quotes - but be careful not to quote already quoted content.
+        # One regex pass tokenizes double- and single-quoted strings together, so
+        # only single-quoted tokens outside double-quoted strings are rewritten
+        json_str = _RE_QUOTED_STRING.sub(_single_to_double_quoted, json_str)
 
         # Unquoted single-word string values (that aren't keywords or already fixed booleans)
         # This handles cases like: {name: John} -> {name: "John"}
         # But NOT: {active: true} -> should NOT become {active: "true"}
-        keywords = {'true', 'false', 'null'}
-        json_str = re.sub(
-            r':\s*([a-zA-Z_][a-zA-Z0-9_]*)([,\s}])',
-            lambda m: f': "{m.group(1)}"{m.group(2)}' if m.group(1).lower() not in keywords else f': {m.group(1)}{m.group(2)}',
+        json_str = _RE_UNQUOTED_VALUE.sub(
+            lambda m: f': "{m.group(1)}"{m.group(2)}' if m.group(1).lower() not in _JSON_KEYWORDS else f': {m.group(1)}{m.group(2)}',
             json_str
         )
 
@@ -163,7 +168,7 @@ class JsonRepair:
             Cleaned JSON string
         """
         # Newlines in strings (should be \n)
-        json_str = re.sub(r'"\s*\n\s*"', '', json_str)
+        json_str = _RE_SPLIT_STRING.sub('', json_str)
 
         return json_str
 
@@ -177,13 +182,17 @@ class JsonRepair:
         Returns:
             Extracted JSON or original text
         """
+        # Most responses have no fences at all; a substring check skips both scans
+        if '```' not in text:
+            return text
+
         # Try ```json...```
-        match = re.search(r'```json\s*([\s\S]*?)\s*```', text, re.IGNORECASE)
+        match = _RE_MD_JSON.search(text)
         if match:
             return match.group(1).strip()
 
         # Try ```...```
-        match = re.search(r'```\s*([\s\S]*?)\s*```', text)
+        match = _RE_MD_ANY.search(text)
         if match:
             return match.group(1).strip()
 
@@ -218,7 +227,7 @@ class JsonRepair:
             Repaired JSON string
         """
         # Remove all control characters except newlines and tabs
-        json_str = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]', '', json_str)
+        json_str = _RE_CONTROL_CHARS.sub('', json_str)
 
         # Try to balance brackets
         open_braces = json_str.count('{')
@@ -1,13 +1,14 @@
 """LLM API client for making asynchronous requests."""
 
 import json
-import sys
+import logging
 import time
-import traceback
 from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
+logger = logging.getLogger(__name__)
+
 
 class LlmCallResult:
     """Result of an LLM API call."""
@@ -41,7 +42,14 @@ class LlmCallResult:
 class LlmClient:
     """Client for making asynchronous LLM API requests."""
 
-    def __init__(self, base_url: str, api_key: str, endpoint: str = "", timeout: int = 60) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        endpoint: str = "",
+        timeout: int = 60,
+        max_connections: Optional[int] = None,
+    ) -> None:
         """Initialize LLM client.
 
         Args:
@@ -49,12 +57,58 @@ class LlmClient:
             api_key: API key for authentication
             endpoint: API endpoint path (e.g., "/chat/completions"), empty for default "/chat/completions"
             timeout: Request timeout in seconds
+            max_connections: Connection pool size, typically the evaluation concurrency
+                (None for the httpx default)
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.endpoint = endpoint or "/chat/completions"
         self.timeout = timeout
+        self.max_connections = max_connections
         self.model_code: str = ""  # Set when making a request
+        self._client: Optional[httpx.AsyncClient] = None
+        self._closed = False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use.
+
+        Connections are kept alive between calls, so requests after the first
+        skip the TCP and TLS handshakes.
+
+        Returns:
+            Shared httpx client
+
+        Raises:
+            RuntimeError: If the client has been closed
+        """
+        if self._closed:
+            # Reopening would create a pool that nothing is left to close
+            raise RuntimeError("LLM客户端已关闭")
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits()
+            if self.max_connections:
+                limits = httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                )
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its connections.
+
+        The client cannot be used for further calls afterwards.
+        """
+        self._closed = True
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "LlmClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
     async def call_llm(self, request_body: Dict[str, Any]) -> Optional[str]:
         """Call the LLM API with the given request body.
@@ -98,111 +152,109 @@ class LlmClient:
         url = f"{self.base_url}{self.endpoint}"
         start_time = time.time()
 
-        print(f"[DEBUG] LLM客户端请求, url={url}, model={self.model_code}", file=sys.stderr)
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(url, json=request_body, headers=headers)
-
-                if response.status_code == 200:
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    try:
-                        data = response.json()
-                    except Exception as e:
-                        # Failed to parse JSON response
-                        print(f"[ERROR] LLM客户端JSON解析失败: {type(e).__name__}: {e}", file=sys.stderr)
-                        print(f"[ERROR] 响应内容: {response.text[:500]}", file=sys.stderr)
-                        return LlmCallResult(
-                            content=f"[JSON_PARSE_ERROR] {response.text[:500]}",
-                            duration_ms=duration_ms,
-                        )
-
-                    # Extract token usage if available
-                    usage = data.get("usage", {})
-                    prompt_tokens = usage.get("prompt_tokens")
-                    completion_tokens = usage.get("completion_tokens")
-                    total_tokens = usage.get("total_tokens")
-
-                    # Try to extract response text from common response formats
-                    choices = data.get("choices")
-                    if choices and len(choices) > 0:
-                        message = choices[0].get("message") or {}
-                        content = message.get("content")
-                        if content:
-                            return LlmCallResult(
-                                content=str(content),
-                                duration_ms=duration_ms,
-                                prompt_tokens=prompt_tokens,
-                                completion_tokens=completion_tokens,
-                                total_tokens=total_tokens,
-                            )
-                    elif "output" in data:
-                        return LlmCallResult(
-                            content=str(data.get("output", "")),
-                            duration_ms=duration_ms,
-                            prompt_tokens=prompt_tokens,
-                            completion_tokens=completion_tokens,
-                            total_tokens=total_tokens,
-                        )
-                    elif "response" in data:
-                        return LlmCallResult(
-                            content=str(data.get("response", "")),
-                            duration_ms=duration_ms,
-                            prompt_tokens=prompt_tokens,
-                            completion_tokens=completion_tokens,
-                            total_tokens=total_tokens,
-                        )
-                    elif "text" in data:
-                        return LlmCallResult(
-                            content=str(data.get("text", "")),
-                            duration_ms=duration_ms,
-                            prompt_tokens=prompt_tokens,
-                            completion_tokens=completion_tokens,
-                            total_tokens=total_tokens,
-                        )
-                    elif "content" in data:
-                        return LlmCallResult(
-                            content=str(data.get("content", "")),
-                            duration_ms=duration_ms,
-                            prompt_tokens=prompt_tokens,
-                            completion_tokens=completion_tokens,
-                            total_tokens=total_tokens,
-                        )
-                    elif "message" in data:
-                        msg = data.get("message", {})
-                        if isinstance(msg, dict):
-                            return LlmCallResult(
-                                content=str(msg.get("content", str(msg))),
-                                duration_ms=duration_ms,
-                                prompt_tokens=prompt_tokens,
-                                completion_tokens=completion_tokens,
-                                total_tokens=total_tokens,
-                            )
+        logger.debug("LLM客户端请求, url=%s, model=%s", url, self.model_code)
+
+        client = self._get_client()
+        try:
+            response = await client.post(url, json=request_body, headers=headers)
+
+            if response.status_code == 200:
+                duration_ms = int((time.time() - start_time) * 1000)
+                try:
+                    data = response.json()
+                except Exception as e:
+                    # Failed to parse JSON response
+                    logger.error("LLM客户端JSON解析失败: %s: %s", type(e).__name__, e)
+                    logger.error("响应内容: %s", response.text[:500])
+                    return LlmCallResult(
+                        content=f"[JSON_PARSE_ERROR] {response.text[:500]}",
+                        duration_ms=duration_ms,
+                    )
+
+                # Extract token usage if available
+                usage = data.get("usage", {})
+                prompt_tokens = usage.get("prompt_tokens")
+                completion_tokens = usage.get("completion_tokens")
+                total_tokens = usage.get("total_tokens")
+
+                # Try to extract response text from common response formats
+                choices = data.get("choices")
+                if choices and len(choices) > 0:
+                    message = choices[0].get("message") or {}
+                    content = message.get("content")
+                    if content:
                         return LlmCallResult(
-                            content=str(msg),
+                            content=str(content),
                             duration_ms=duration_ms,
                             prompt_tokens=prompt_tokens,
                             completion_tokens=completion_tokens,
                             total_tokens=total_tokens,
                         )
-                    else:
-                        # Return raw JSON as fallback
+                elif "output" in data:
+                    return LlmCallResult(
+                        content=str(data.get("output", "")),
+                        duration_ms=duration_ms,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=total_tokens,
+                    )
+                elif "response" in data:
+                    return LlmCallResult(
+                        content=str(data.get("response", "")),
+                        duration_ms=duration_ms,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=total_tokens,
+                    )
+                elif "text" in data:
+                    return LlmCallResult(
+                        content=str(data.get("text", "")),
+                        duration_ms=duration_ms,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=total_tokens,
+                    )
+                elif "content" in data:
+                    return LlmCallResult(
+                        content=str(data.get("content", "")),
+                        duration_ms=duration_ms,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=total_tokens,
+                    )
+                elif "message" in data:
+                    msg = data.get("message", {})
+                    if isinstance(msg, dict):
                         return LlmCallResult(
-                            content=json.dumps(data, ensure_ascii=False),
+                            content=str(msg.get("content", str(msg))),
                             duration_ms=duration_ms,
                             prompt_tokens=prompt_tokens,
                             completion_tokens=completion_tokens,
                             total_tokens=total_tokens,
                         )
-            except httpx.HTTPError as e:
-                print(f"[ERROR] LLM客户端HTTP错误: {type(e).__name__}: {e}", file=sys.stderr)
-            except Exception as e:
-                print(f"[ERROR] LLM客户端异常: {type(e).__name__}: {e}", file=sys.stderr)
-                import traceback
-                print(f"[ERROR] 异常堆栈: {traceback.format_exc()}", file=sys.stderr)
+                    return LlmCallResult(
+                        content=str(msg),
+                        duration_ms=duration_ms,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=total_tokens,
+                    )
+                else:
+                    # Return raw JSON as fallback
+                    return LlmCallResult(
+                        content=json.dumps(data, ensure_ascii=False),
+                        duration_ms=duration_ms,
+                        prompt_tokens=prompt_tokens,
+                        completion_tokens=completion_tokens,
+                        total_tokens=total_tokens,
+                    )
+        except httpx.HTTPError as e:
+            logger.error("LLM客户端HTTP错误: %s: %s", type(e).__name__, e)
+        except Exception as e:
+            logger.exception("LLM客户端异常: %s: %s", type(e).__name__, e)
 
         # 请求失败，返回 None
-        print(f"[ERROR] LLM客户端请求失败，url={url}", file=sys.stderr)
+        logger.error("LLM客户端请求失败，url=%s", url)
         return None
 
 
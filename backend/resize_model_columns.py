@@ -0,0 +1,35 @@
+"""Shrink model_code and base_url column widths.
+
+Run this script to resize the columns on an existing PostgreSQL database.
+SQLite does not enforce VARCHAR lengths, so nothing is changed there.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+async def resize_model_columns():
+    """Resize models.model_code to 100 and model_providers.base_url to 255."""
+    if engine.dialect.name == "sqlite":
+        print("SQLite does not enforce VARCHAR lengths, nothing to do.")
+        return
+
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "ALTER TABLE models ALTER COLUMN model_code TYPE VARCHAR(100)"
+        ))
+        await conn.execute(text(
+            "ALTER TABLE model_providers ALTER COLUMN base_url TYPE VARCHAR(255)"
+        ))
+        print("Successfully resized model_code and base_url columns.")
+
+
+if __name__ == "__main__":
+    asyncio.run(resize_model_columns())
@@ -1,11 +1,14 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any, List, Tuple
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.config import get_settings
@@ -50,6 +53,33 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     await test_engine.dispose()
 
 
+@pytest.fixture
+def record_statements(
+    db_session: AsyncSession,
+) -> Callable[[], AbstractContextManager[List[Tuple[str, Any]]]]:
+    """Record the SQL the test session sends to the database.
+
+    Use as ``with record_statements() as statements:``; each entry is a
+    (statement, parameters) tuple.
+    """
+    sync_engine = db_session.bind.sync_engine
+
+    @contextmanager
+    def recording() -> Iterator[List[Tuple[str, Any]]]:
+        statements: List[Tuple[str, Any]] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", record)
+
+    return recording
+
+
 @pytest_asyncio.fixture(scope="function")
 async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create async HTTP client for testing."""
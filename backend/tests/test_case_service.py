@@ -0,0 +1,494 @@
+"""Tests for Case Service."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.case_service import CaseService
+from app.schemas.cases import (
+    CaseSetCreate,
+    CaseSetUpdate,
+    TestCaseCreate as CaseCreate,
+    TestCaseUpdate as CaseUpdate,
+)
+
+
+@pytest.fixture
+def case_service(db_session: AsyncSession) -> CaseService:
+    """Create case service fixture."""
+    return CaseService(db_session)
+
+
+@pytest.mark.asyncio
+async def test_upsert_test_cases_batch(case_service: CaseService):
+    """Test upsert inserts new cases and updates existing ones by case_uid."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="测试用例集"))
+    original = await case_service.create_test_case(CaseCreate(
+        set_id=case_set.id,
+        case_uid="CASE-001",
+        description="原始描述",
+        user_input="hello",
+        expected_output="world",
+    ))
+
+    results = await case_service.upsert_test_cases_batch([
+        CaseCreate(set_id=case_set.id, case_uid="CASE-001", user_input="hello again"),
+        CaseCreate(set_id=case_set.id, case_uid="CASE-002", user_input="new"),
+        CaseCreate(set_id=case_set.id, user_input="no uid"),
+        CaseCreate(set_id=case_set.id, case_uid="CASE-002", user_input="new", expected_output="ok"),
+    ])
+
+    assert len(results) == 4
+    assert results[0].id == original.id
+    assert results[0].user_input == "hello again"
+    # None fields keep their stored values
+    assert results[0].description == "原始描述"
+    assert results[0].expected_output == "world"
+    assert results[1] is results[3]
+    assert results[1].expected_output == "ok"
+    assert results[2].case_uid is None
+
+    cases = await case_service.get_test_cases(case_set.id)
+    assert len(cases) == 3
+
+
+@pytest.mark.asyncio
+async def test_upsert_test_cases_batch_empty(case_service: CaseService):
+    """Test upsert with no input."""
+    assert await case_service.upsert_test_cases_batch([]) == []
+
+
+@pytest.mark.asyncio
+async def test_duplicate_case_set(case_service: CaseService, record_statements):
+    """Test duplicating a case set copies its test cases in order."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="源用例集"))
+    await case_service.create_test_cases_batch([
+        CaseCreate(set_id=case_set.id, case_uid=f"CASE-{i:03d}", user_input=f"input {i}")
+        for i in range(5)
+    ])
+
+    with record_statements() as statements:
+        duplicated = await case_service.duplicate_case_set(case_set.id, "源用例集复制")
+
+    assert duplicated is not None
+    assert duplicated.id != case_set.id
+    source_cases = await case_service.get_test_cases(case_set.id)
+    copied_cases = await case_service.get_test_cases(duplicated.id)
+    assert [c.case_uid for c in copied_cases] == [c.case_uid for c in source_cases]
+    assert {c.id for c in copied_cases}.isdisjoint(c.id for c in source_cases)
+    assert await case_service.get_case_count(duplicated.id) == 5
+    # All test cases are copied by a single set-based statement
+    assert sum(statement.startswith("INSERT INTO test_cases") for statement, _ in statements) == 1
+
+    # Copies made back to back, including a copy of a copy, get distinct keys
+    again = await case_service.duplicate_case_set(case_set.id, "源用例集复制2")
+    nested = await case_service.duplicate_case_set(duplicated.id, "源用例集复制3")
+    ids = [c.id for s in (case_set, duplicated, again, nested) for c in await case_service.get_test_cases(s.id)]
+    assert len(set(ids)) == 20
+
+
+@pytest.mark.asyncio
+async def test_duplicate_case_set_not_found(case_service: CaseService):
+    """Test duplicating a missing case set."""
+    assert await case_service.duplicate_case_set("missing", "copy") is None
+
+
+@pytest.mark.asyncio
+async def test_update_test_case(case_service: CaseService):
+    """Test update only overwrites provided fields and reports missing cases."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    test_case = await case_service.create_test_case(CaseCreate(
+        set_id=case_set.id, case_uid="CASE-001", description="描述", user_input="hello",
+    ))
+
+    updated = await case_service.update_test_case(test_case.id, CaseUpdate(user_input="changed"))
+
+    assert updated is not None
+    assert updated.user_input == "changed"
+    assert updated.description == "描述"
+    assert await case_service.update_test_case("missing", CaseUpdate(user_input="x")) is None
+
+
+@pytest.mark.asyncio
+async def test_case_uid_must_be_unique_in_set(case_service: CaseService):
+    """Test create and update reject a case_uid already used in the same set."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    other_set = await case_service.create_case_set(CaseSetCreate(name="另一个用例集"))
+    first = await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="CASE-001", user_input="hi"))
+    second = await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="CASE-002", user_input="hi"))
+
+    with pytest.raises(ValueError, match="CASE-001"):
+        await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="CASE-001", user_input="hi"))
+    with pytest.raises(ValueError, match="CASE-001"):
+        await case_service.update_test_case(second.id, CaseUpdate(case_uid="CASE-001"))
+
+    # The same uid is fine in another set, and a case may keep its own uid
+    await case_service.create_test_case(CaseCreate(set_id=other_set.id, case_uid="CASE-001", user_input="hi"))
+    updated = await case_service.update_test_case(first.id, CaseUpdate(case_uid="CASE-001"))
+    assert updated is not None
+
+
+@pytest.mark.asyncio
+async def test_blank_case_uids_do_not_collide(case_service: CaseService):
+    """Test blank uids are stored as None and never count as duplicates."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+
+    first = await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="", user_input="a"))
+    await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="  ", user_input="b"))
+    upserted = await case_service.upsert_test_cases_batch([
+        CaseCreate(set_id=case_set.id, case_uid="", user_input=f"input {i}") for i in range(2)
+    ])
+
+    assert first.case_uid is None
+    assert [tc.case_uid for tc in upserted] == [None, None]
+    assert await case_service.get_case_count(case_set.id) == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_taken_case_uids(case_service: CaseService):
+    """Test a batch reports repeated or already used uids as ValueError."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="CASE-001", user_input="a"))
+
+    with pytest.raises(ValueError, match="用例编号重复: CASE-002"):
+        await case_service.create_test_cases_batch([
+            CaseCreate(set_id=case_set.id, case_uid="CASE-002", user_input=f"input {i}") for i in range(2)
+        ])
+    with pytest.raises(ValueError, match="用例编号已存在: CASE-001"):
+        await case_service.create_test_cases_batch([
+            CaseCreate(set_id=case_set.id, case_uid="CASE-001", user_input="b"),
+        ])
+
+
+@pytest.mark.asyncio
+async def test_update_case_set(case_service: CaseService):
+    """Test renaming a case set."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="旧名称"))
+
+    updated = await case_service.update_case_set(case_set.id, CaseSetUpdate(name="新名称"))
+
+    assert updated is not None
+    assert updated.name == "新名称"
+    assert (await case_service.update_case_set(case_set.id, CaseSetUpdate())).name == "新名称"
+    assert await case_service.update_case_set("missing", CaseSetUpdate(name="x")) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_case_set(case_service: CaseService):
+    """Test deleting a case set removes its test cases."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_case(CaseCreate(set_id=case_set.id, user_input="hello"))
+
+    assert await case_service.delete_case_set(case_set.id) is True
+    assert await case_service.get_case_set(case_set.id) is None
+    assert await case_service.get_case_count(case_set.id) == 0
+    assert await case_service.delete_case_set(case_set.id) is False
+
+
+@pytest.mark.asyncio
+async def test_case_count_maintained(case_service: CaseService):
+    """Test case_count follows inserts, upserts, duplicates and deletes."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    assert case_set.case_count == 0
+
+    first = await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="A", user_input="a"))
+    await case_service.create_test_cases_batch([
+        CaseCreate(set_id=case_set.id, user_input="b"),
+        CaseCreate(set_id=case_set.id, user_input="c"),
+    ])
+    await case_service.upsert_test_cases_batch([
+        CaseCreate(set_id=case_set.id, case_uid="A", user_input="a2"),
+        CaseCreate(set_id=case_set.id, case_uid="D", user_input="d"),
+    ])
+    assert await case_service.get_case_count(case_set.id) == 4
+    assert (await case_service.get_case_set(case_set.id)).case_count == 4
+
+    duplicated = await case_service.duplicate_case_set(case_set.id, "复制")
+    assert duplicated.case_count == 4
+
+    assert await case_service.delete_test_case(first.id) is True
+    assert await case_service.get_case_count(case_set.id) == 3
+    assert await case_service.get_case_count(duplicated.id) == 4
+
+
+@pytest.mark.asyncio
+async def test_get_case_counts(case_service: CaseService):
+    """Test grouped counts default requested sets without cases to 0."""
+    full = await case_service.create_case_set(CaseSetCreate(name="有用例"))
+    empty = await case_service.create_case_set(CaseSetCreate(name="无用例"))
+    await case_service.create_test_cases_batch([
+        CaseCreate(set_id=full.id, user_input="a"),
+        CaseCreate(set_id=full.id, user_input="b"),
+    ])
+
+    counts = await case_service.get_case_counts([full.id, empty.id, "missing"])
+
+    assert counts == {full.id: 2, empty.id: 0, "missing": 0}
+    assert await case_service.get_case_counts() == {full.id: 2}
+    assert await case_service.get_case_counts([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_test_case_by_uid_uses_index(
+    case_service: CaseService, db_session: AsyncSession, record_statements
+):
+    """Test the by-uid lookup is an index search rather than a table scan."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    created = await case_service.create_test_case(CaseCreate(set_id=case_set.id, case_uid="A", user_input="a"))
+
+    with record_statements() as statements:
+        found = await case_service.get_test_case_by_uid(case_set.id, "A")
+
+    assert found is created
+    statement, parameters = statements[0]
+    conn = await db_session.connection()
+    plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    detail = " ".join(row[-1] for row in plan.all())
+    assert "case_uid=?" in detail
+
+
+@pytest.mark.asyncio
+async def test_iter_test_cases(case_service: CaseService):
+    """Test streaming yields the same cases as the list variant."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_cases_batch([
+        CaseCreate(set_id=case_set.id, user_input=f"input {i}") for i in range(3)
+    ])
+
+    streamed = [tc async for tc in case_service.iter_test_cases(case_set.id)]
+
+    assert [tc.id for tc in streamed] == [tc.id for tc in await case_service.get_test_cases(case_set.id)]
+
+
+@pytest.mark.asyncio
+async def test_get_test_cases_page(case_service: CaseService):
+    """Test keyset pages walk all cases in order, including same-timestamp batches."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_cases_batch([
+        CaseCreate(set_id=case_set.id, user_input=f"input {i}") for i in range(5)
+    ])
+    expected = [tc.id for tc in await case_service.get_test_cases(case_set.id)]
+
+    seen = []
+    cursor = None
+    for _ in range(3):
+        page, cursor = await case_service.get_test_cases_page(case_set.id, limit=2, after=cursor)
+        seen.extend(tc.id for tc in page)
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_case_sets_page(case_service: CaseService):
+    """Test keyset pages of case sets, newest first."""
+    for i in range(3):
+        await case_service.create_case_set(CaseSetCreate(name=f"用例集{i}"))
+    expected = [cs.id for cs in await case_service.get_case_sets()]
+
+    first, cursor = await case_service.get_case_sets_page(limit=2)
+    second, last_cursor = await case_service.get_case_sets_page(limit=2, after=cursor)
+
+    assert [cs.id for cs in first + second] == expected
+    assert last_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_page_cursor_survives_deleted_row(case_service: CaseService):
+    """Test paging continues after the previous page's last row is deleted."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_cases_batch([
+        CaseCreate(set_id=case_set.id, user_input=f"input {i}") for i in range(5)
+    ])
+    expected = [tc.id for tc in await case_service.get_test_cases(case_set.id)]
+
+    first, cursor = await case_service.get_test_cases_page(case_set.id, limit=2)
+    await case_service.delete_test_case(first[-1].id)
+    second, _ = await case_service.get_test_cases_page(case_set.id, limit=2, after=cursor)
+
+    assert [tc.id for tc in second] == expected[2:4]
+
+
+@pytest.mark.asyncio
+async def test_page_rejects_malformed_cursor(case_service: CaseService):
+    """Test a cursor that cannot be decoded is reported instead of ending paging."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+
+    for cursor in ("garbage", "bm90LWEtY3Vyc29y"):
+        with pytest.raises(ValueError, match="无效的分页游标"):
+            await case_service.get_test_cases_page(case_set.id, limit=2, after=cursor)
+        with pytest.raises(ValueError, match="无效的分页游标"):
+            await case_service.get_case_sets_page(limit=2, after=cursor)
+
+
+@pytest.mark.asyncio
+async def test_get_case_sets_with_cases(
+    case_service: CaseService, db_session: AsyncSession, record_statements
+):
+    """Test case sets and their cases load in two statements."""
+    for i in range(3):
+        case_set = await case_service.create_case_set(CaseSetCreate(name=f"用例集{i}"))
+        await case_service.create_test_cases_batch([
+            CaseCreate(set_id=case_set.id, user_input=f"input {j}") for j in range(i)
+        ])
+
+    db_session.expunge_all()
+    with record_statements() as statements:
+        case_sets = await case_service.get_case_sets_with_cases()
+
+    assert len(statements) == 2
+    assert sorted(len(cs.cases) for cs in case_sets) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_read_queries_raise_on_lazy_load(case_service: CaseService, db_session: AsyncSession):
+    """Test relationships are never lazily loaded from read queries."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_case(CaseCreate(set_id=case_set.id, user_input="a"))
+    db_session.expunge_all()
+    service = CaseService(db_session)
+
+    test_case = (await service.get_test_cases(case_set.id))[0]
+    loaded_set = await service.get_case_set(case_set.id)
+
+    with pytest.raises(InvalidRequestError):
+        test_case.case_set
+    with pytest.raises(InvalidRequestError):
+        loaded_set.cases
+
+
+@pytest.mark.asyncio
+async def test_get_test_cases_summary(case_service: CaseService, db_session: AsyncSession):
+    """Test the summary listing skips the large text columns."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_case(CaseCreate(
+        set_id=case_set.id, case_uid="A", description="描述", user_input="x" * 1000,
+    ))
+    db_session.expunge_all()
+
+    summary = await case_service.get_test_cases_summary(case_set.id)
+
+    assert [(tc.case_uid, tc.description) for tc in summary] == [("A", "描述")]
+    with pytest.raises(InvalidRequestError):
+        summary[0].user_input
+
+
+@pytest.mark.asyncio
+async def test_get_case_set_uses_identity_map(
+    case_service: CaseService, db_session: AsyncSession, record_statements
+):
+    """Test primary key lookups of already loaded rows skip the database."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    service = CaseService(db_session)
+
+    with record_statements() as statements:
+        found = await service.get_case_set(case_set.id)
+
+    assert found is case_set
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_delete_test_case(case_service: CaseService):
+    """Test deleting a test case reports whether it existed."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    test_case = await case_service.create_test_case(CaseCreate(set_id=case_set.id, user_input="a"))
+
+    assert await case_service.delete_test_case(test_case.id) is True
+    assert await case_service.get_test_case(test_case.id) is None
+    assert await case_service.delete_test_case(test_case.id) is False
+    assert await case_service.get_case_count(case_set.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_writes_are_chunked(case_service: CaseService, monkeypatch):
+    """Test batch inserts and upserts split into chunks keep order and counts."""
+    monkeypatch.setattr("app.services.case_service._BATCH_CHUNK", 2)
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+
+    created = await case_service.create_test_cases_batch([
+        CaseCreate(set_id=case_set.id, case_uid=f"CASE-{i}", user_input=f"input {i}") for i in range(5)
+    ])
+    assert [tc.user_input for tc in created] == [f"input {i}" for i in range(5)]
+
+    upserted = await case_service.upsert_test_cases_batch([
+        CaseCreate(set_id=case_set.id, case_uid=f"CASE-{i}", user_input=f"updated {i}") for i in range(3, 8)
+    ])
+    assert [tc.user_input for tc in upserted] == [f"updated {i}" for i in range(3, 8)]
+    assert await case_service.get_case_count(case_set.id) == 8
+
+
+@pytest.mark.asyncio
+async def test_get_case_set_memoizes_miss(case_service: CaseService, record_statements):
+    """Test a repeated lookup of a missing case set only queries once."""
+    with record_statements() as statements:
+        assert await case_service.get_case_set("missing") is None
+        assert await case_service.get_case_set("missing") is None
+
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_variants_match_orm_queries(case_service: CaseService):
+    """Test the row-based read paths return the same data as the ORM paths."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+    await case_service.create_test_cases_batch([
+        CaseCreate(set_id=case_set.id, case_uid=f"CASE-{i}", user_input=f"input {i}") for i in range(3)
+    ])
+
+    case_sets = await case_service.get_case_sets_read()
+    test_cases = await case_service.get_test_cases_read(case_set.id)
+
+    assert [(cs.id, cs.name, cs.case_count) for cs in case_sets] == [(case_set.id, "用例集", 3)]
+    orm_cases = await case_service.get_test_cases(case_set.id)
+    assert [(tc.id, tc.case_uid, tc.user_input) for tc in test_cases] == [
+        (tc.id, tc.case_uid, tc.user_input) for tc in orm_cases
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_load_test_cases(case_service: CaseService):
+    """Test the bulk load path inserts rows and updates the counter."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+
+    loaded = await case_service.bulk_load_test_cases(case_set.id, [
+        CaseCreate(set_id=case_set.id, case_uid=f"CASE-{i}", user_input=f"input {i}") for i in range(5)
+    ])
+
+    assert loaded == 5
+    assert await case_service.get_case_count(case_set.id) == 5
+    cases = await case_service.get_test_cases(case_set.id)
+    assert [tc.case_uid for tc in cases] == [f"CASE-{i}" for i in range(5)]
+    assert await case_service.bulk_load_test_cases(case_set.id, []) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_load_copy_sends_created_at(
+    case_service: CaseService, db_session: AsyncSession, monkeypatch
+):
+    """Test the COPY path fills created_at itself instead of relying on a column default."""
+    case_set = await case_service.create_case_set(CaseSetCreate(name="用例集"))
+
+    copy = AsyncMock()
+    raw_conn = SimpleNamespace(driver_connection=SimpleNamespace(copy_records_to_table=copy))
+    conn = SimpleNamespace(get_raw_connection=AsyncMock(return_value=raw_conn))
+    monkeypatch.setattr(db_session, "get_bind", lambda: SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql", driver="asyncpg"),
+    ))
+    monkeypatch.setattr(db_session, "connection", AsyncMock(return_value=conn))
+
+    loaded = await case_service.bulk_load_test_cases(case_set.id, [
+        CaseCreate(set_id=case_set.id, user_input=f"input {i}") for i in range(3)
+    ])
+
+    assert loaded == 3
+    kwargs = copy.await_args.kwargs
+    assert kwargs["columns"][-1] == "created_at"
+    assert len({record[-1] for record in kwargs["records"]}) == 1
+    assert all(record[-1] is not None for record in kwargs["records"])
@@ -199,8 +199,15 @@ class TestConcurrentEvaluation:
         assert summary["passed"] >= 0  # Exact match may vary
         assert summary["failed"] >= 0
 
-        # Verify WebSocket was called for each case
-        assert ws_manager.broadcast_event.call_count >= 5
+        # Verify WebSocket delivered each case, alone or in a batch frame
+        delivered = 0
+        for call in ws_manager.broadcast_event.call_args_list:
+            _, event_type, data = call.args
+            if event_type == "result":
+                delivered += 1
+            elif event_type == "results_batch":
+                delivered += len(data["items"])
+        assert delivered == 5
 
         # Verify run status
         await db_session.refresh(run)
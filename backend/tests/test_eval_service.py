@@ -0,0 +1,455 @@
+"""Tests for Eval Service."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.case_set import CaseSet
+from app.models.eval_result import EvalResult
+from app.models.eval_run import EvalRun
+from app.models.eval_task import EvalTask
+from app.models.evaluator import Evaluator
+from app.models.model import Model
+from app.models.model_provider import ModelProvider
+from app.models.task_evaluator import TaskEvaluator
+from app.models.test_case import TestCase as CaseModel
+from app.schemas.cases import TestCaseCreate as CaseCreate
+from app.services.case_service import CaseService
+from app.services.eval_service import EvalService
+from app.utils.llm_client import LlmCallResult, LlmClient
+
+
+@pytest.fixture
+async def eval_task(db_session: AsyncSession) -> EvalTask:
+    """Create a task with its case set, model and provider."""
+    provider = ModelProvider(name="Test Provider", base_url="http://test.com", api_key="test-key")
+    case_set = CaseSet(name="Test Set")
+    db_session.add_all([provider, case_set])
+    await db_session.flush()
+
+    model = Model(provider_id=provider.id, model_code="test-model", display_name="Test Model")
+    db_session.add(model)
+    await db_session.flush()
+
+    task = EvalTask(
+        set_id=case_set.id,
+        model_id=model.id,
+        request_template=json.dumps({"model": "test"}),
+    )
+    db_session.add(task)
+    await db_session.flush()
+    return task
+
+
+@pytest.mark.asyncio
+class TestCreateEvalRun:
+    """Tests for run number allocation."""
+
+    async def test_run_numbers_follow_highest_existing(self, db_session, eval_task):
+        """Test that a deleted run's number is not handed out again."""
+        service = EvalService(db_session)
+        first = await service.create_eval_run(eval_task.id)
+        second = await service.create_eval_run(eval_task.id)
+        assert (first.run_number, second.run_number) == (1, 2)
+
+        await db_session.delete(first)
+        await db_session.flush()
+
+        third = await service.create_eval_run(eval_task.id)
+        assert third.run_number == 3
+
+    async def test_retries_once_on_run_number_conflict(self, db_session, eval_task, monkeypatch):
+        """Test that a run number taken concurrently is re-read and skipped."""
+        service = EvalService(db_session)
+        db_session.add(EvalRun(task_id=eval_task.id, run_number=1))
+        await db_session.flush()
+
+        # The first lookup misses the run added above, as a concurrent writer would
+        original_scalar = db_session.scalar
+        calls = []
+
+        async def stale_scalar(statement, *args, **kwargs):
+            calls.append(statement)
+            if len(calls) == 1:
+                return 0
+            return await original_scalar(statement, *args, **kwargs)
+
+        monkeypatch.setattr(db_session, "scalar", stale_scalar)
+        run = await service.create_eval_run(eval_task.id)
+
+        assert len(calls) == 2
+        assert run.run_number == 2
+
+
+@pytest.mark.asyncio
+class TestRunEvaluationWithWs:
+    """Tests for streamed WebSocket evaluation runs."""
+
+    async def test_streams_every_case_once(self, db_session, eval_task):
+        """Test that cases streamed in while results are flushed are each evaluated once."""
+        total = 120
+        db_session.add_all(
+            CaseModel(set_id=eval_task.set_id, user_input=f"Input {i}", expected_output="ok")
+            for i in range(total)
+        )
+        eval_task.concurrency = 4
+        run = EvalRun(task_id=eval_task.id, run_number=1, status="RUNNING")
+        db_session.add(run)
+        await db_session.commit()
+
+        async def fake_call(self, request):
+            return LlmCallResult(content="ok", duration_ms=1, total_tokens=3)
+
+        ws_manager = MagicMock()
+        ws_manager.broadcast_event = AsyncMock()
+        with patch.object(LlmClient, "call_llm_with_stats", fake_call):
+            summary = await EvalService(db_session).run_evaluation_with_ws(
+                run.id, eval_task.id, ws_manager
+            )
+
+        assert summary["total"] == total
+        assert summary["passed"] == total
+        assert summary["total_skill_tokens"] == 3 * total
+        payloads = []
+        for c in ws_manager.broadcast_event.await_args_list:
+            _, event_type, data = c.args
+            payloads.extend(data["items"] if event_type == "results_batch" else [data])
+        assert sorted(p["index"] for p in payloads) == list(range(1, total + 1))
+        assert [p["completed"] for p in payloads] == list(range(1, total + 1))
+        saved = await db_session.scalar(
+            select(func.count(EvalResult.id)).where(EvalResult.run_id == run.id)
+        )
+        assert saved == total
+
+    async def test_slow_broadcasts_hold_back_new_cases(self, db_session, eval_task):
+        """Test that finished but unprocessed cases stay within twice the concurrency."""
+        db_session.add_all(
+            CaseModel(set_id=eval_task.set_id, user_input=f"Input {i}", expected_output="ok")
+            for i in range(20)
+        )
+        eval_task.concurrency = 2
+        run = EvalRun(task_id=eval_task.id, run_number=1, status="RUNNING")
+        db_session.add(run)
+        await db_session.commit()
+
+        called = 0
+        broadcast = 0
+        max_backlog = 0
+
+        async def fake_call(self, request):
+            nonlocal called, max_backlog
+            called += 1
+            max_backlog = max(max_backlog, called - broadcast)
+            return LlmCallResult(content="ok", duration_ms=1)
+
+        async def slow_broadcast(task_id, event_type, data):
+            nonlocal broadcast
+            await asyncio.sleep(0.005)
+            broadcast += len(data["items"]) if event_type == "results_batch" else 1
+
+        ws_manager = MagicMock()
+        ws_manager.broadcast_event = AsyncMock(side_effect=slow_broadcast)
+        with patch.object(LlmClient, "call_llm_with_stats", fake_call):
+            summary = await EvalService(db_session).run_evaluation_with_ws(
+                run.id, eval_task.id, ws_manager
+            )
+
+        assert summary["total"] == 20
+        assert max_backlog <= 4
+
+    async def test_failed_broadcast_cancels_running_cases(self, db_session, eval_task):
+        """Test that cases still in flight stop calling the LLM once the run fails."""
+        db_session.add_all(
+            CaseModel(set_id=eval_task.set_id, user_input=f"Input {i}", expected_output="ok")
+            for i in range(20)
+        )
+        eval_task.concurrency = 4
+        run = EvalRun(task_id=eval_task.id, run_number=1, status="RUNNING")
+        db_session.add(run)
+        await db_session.commit()
+
+        called = 0
+
+        async def fake_call(self, request):
+            nonlocal called
+            called += 1
+            # The first case fails the run while the others are still waiting
+            if called > 1:
+                await asyncio.sleep(0.01)
+            return LlmCallResult(content="ok", duration_ms=1)
+
+        ws_manager = MagicMock()
+        ws_manager.broadcast_event = AsyncMock(side_effect=RuntimeError("socket gone"))
+        with patch.object(LlmClient, "call_llm_with_stats", fake_call):
+            with pytest.raises(RuntimeError, match="socket gone"):
+                await EvalService(db_session).run_evaluation_with_ws(
+                    run.id, eval_task.id, ws_manager
+                )
+            calls_at_failure = called
+            await asyncio.sleep(0.05)
+
+        assert called == calls_at_failure < 20
+
+    async def test_closed_client_does_not_reopen(self):
+        """Test that a closed LLM client refuses calls instead of opening a new pool."""
+        client = LlmClient(base_url="http://test.com", api_key="test-key")
+        client._get_client()
+        await client.aclose()
+
+        with pytest.raises(RuntimeError):
+            client._get_client()
+
+
+@pytest.mark.asyncio
+class TestResultOrdering:
+    """Tests for the case order of stored results."""
+
+    async def test_results_follow_case_order(self, db_session, eval_task):
+        """Test that results of cases created in one batch come back in case order."""
+        cases = await CaseService(db_session).create_test_cases_batch([
+            CaseCreate(set_id=eval_task.set_id, user_input=f"Input {i}") for i in range(8)
+        ])
+        run = EvalRun(task_id=eval_task.id, run_number=1)
+        db_session.add(run)
+        await db_session.flush()
+        # Results are written in completion order, here the reverse of case order
+        db_session.add_all(
+            EvalResult(run_id=run.id, task_id=eval_task.id, case_id=case.id)
+            for case in reversed(cases)
+        )
+        await db_session.commit()
+
+        service = EvalService(db_session)
+        expected = [case.id for case in cases]
+        assert [tc.id for _, tc in await service.get_run_results(run.id)] == expected
+        assert [tc.id for _, tc in await service.get_eval_results(eval_task.id)] == expected
+
+
+@pytest.mark.asyncio
+class TestDeleteEvalTask:
+    """Tests for task deletion."""
+
+    async def test_delete_removes_runs_and_results(self, db_session, eval_task):
+        """Test that deleting a task also removes its runs and results."""
+        case = CaseModel(set_id=eval_task.set_id, user_input="Input")
+        db_session.add(case)
+        await db_session.flush()
+        service = EvalService(db_session)
+        run = await service.create_eval_run(eval_task.id)
+        db_session.add(EvalResult(run_id=run.id, task_id=eval_task.id, case_id=case.id))
+        await db_session.flush()
+
+        assert await service.delete_eval_task(eval_task.id) is True
+
+        for model, column in ((EvalRun, EvalRun.task_id), (EvalResult, EvalResult.task_id)):
+            remaining = await db_session.scalar(
+                select(func.count()).select_from(model).where(column == eval_task.id)
+            )
+            assert remaining == 0
+
+    async def test_delete_missing_task(self, db_session):
+        """Test that deleting an unknown task reports not found."""
+        assert await EvalService(db_session).delete_eval_task("missing") is False
+
+
+@pytest.mark.asyncio
+class TestRunEvaluation:
+    """Tests for SSE evaluation runs."""
+
+    async def test_cases_run_concurrently(self, db_session, eval_task):
+        """Test that cases run up to the task concurrency and each reports progress."""
+        db_session.add_all(
+            CaseModel(set_id=eval_task.set_id, user_input=f"Input {i}", expected_output="ok")
+            for i in range(6)
+        )
+        eval_task.concurrency = 3
+        run = EvalRun(task_id=eval_task.id, run_number=1, status="RUNNING")
+        db_session.add(run)
+        await db_session.commit()
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_call(self, request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "ok"
+
+        events = []
+
+        async def on_progress(event):
+            events.append(event)
+
+        with patch.object(LlmClient, "call_llm", fake_call):
+            await EvalService(db_session)._run_evaluation(run.id, on_progress)
+
+        assert max_in_flight == 3
+        assert sorted(e["index"] for e in events) == list(range(1, 7))
+        assert all(e["is_passed"] and e["result_id"] for e in events)
+        await db_session.refresh(run)
+        assert run.status == "COMPLETED"
+        assert run.summary_dict["passed"] == 6
+        assert eval_task.status == "COMPLETED"
+
+    async def test_failed_progress_cancels_remaining_cases(self, db_session, eval_task):
+        """Test that the rest of the set stops calling the LLM once the run fails."""
+        db_session.add_all(
+            CaseModel(set_id=eval_task.set_id, user_input=f"Input {i}", expected_output="ok")
+            for i in range(20)
+        )
+        eval_task.concurrency = 2
+        run = EvalRun(task_id=eval_task.id, run_number=1, status="RUNNING")
+        db_session.add(run)
+        await db_session.commit()
+
+        called = 0
+
+        async def fake_call(self, request):
+            nonlocal called
+            called += 1
+            # The first case fails the run while the others are still waiting
+            if called > 1:
+                await asyncio.sleep(0.01)
+            return "ok"
+
+        async def on_progress(event):
+            raise RuntimeError("client gone")
+
+        with patch.object(LlmClient, "call_llm", fake_call):
+            with pytest.raises(RuntimeError, match="client gone"):
+                await EvalService(db_session)._run_evaluation(run.id, on_progress)
+            calls_at_failure = called
+            await asyncio.sleep(0.05)
+
+        assert called == calls_at_failure < 20
+
+    async def test_stream_reuses_completed_recent_run(self, db_session, eval_task):
+        """Test that a run completed moments ago is reported instead of re-run."""
+        run = EvalRun(task_id=eval_task.id, run_number=1, status="COMPLETED", summary='{"total": 0}')
+        db_session.add(run)
+        await db_session.commit()
+
+        events = [
+            json.loads(line[len("data: "):])
+            async for line in EvalService(db_session).stream_evaluation(eval_task.id)
+        ]
+
+        assert [e["type"] for e in events] == ["run_created", "complete"]
+        assert events[0]["run_id"] == run.id
+        runs = await db_session.scalar(
+            select(func.count(EvalRun.id)).where(EvalRun.task_id == eval_task.id)
+        )
+        assert runs == 1
+
+    async def test_stream_runs_new_evaluation(self, db_session, eval_task):
+        """Test that a stream without a reusable run evaluates and reports the summary."""
+        db_session.add_all(
+            CaseModel(set_id=eval_task.set_id, user_input=f"Input {i}", expected_output="ok")
+            for i in range(2)
+        )
+        await db_session.commit()
+
+        async def fake_call(self, request):
+            return "ok"
+
+        with patch.object(LlmClient, "call_llm", fake_call):
+            events = [
+                json.loads(line[len("data: "):])
+                async for line in EvalService(db_session).stream_evaluation(eval_task.id)
+            ]
+
+        assert events[0] == {"type": "run_created", "run_id": events[0]["run_id"], "run_number": 1}
+        assert events[-1]["type"] == "complete"
+        assert events[-1]["summary"]["passed"] == 2
+
+    async def test_stream_marks_run_and_task_failed(self, db_session, eval_task):
+        """Test that an evaluation error fails both the run and its task."""
+        await db_session.commit()
+        service = EvalService(db_session)
+
+        with patch.object(service, "_run_evaluation", AsyncMock(side_effect=RuntimeError("boom"))):
+            events = [
+                json.loads(line[len("data: "):])
+                async for line in service.stream_evaluation(eval_task.id)
+            ]
+
+        assert events[-1] == {"type": "error", "status": "failed", "error": "boom"}
+        run = await db_session.get(EvalRun, events[0]["run_id"])
+        assert (run.status, run.error) == ("FAILED", "boom")
+        assert eval_task.status == "FAILED"
+
+    async def test_stream_prefers_running_run(self, db_session, eval_task):
+        """Test that a running run wins over a newer completed one."""
+        running = EvalRun(
+            task_id=eval_task.id,
+            run_number=1,
+            status="RUNNING",
+            started_at=datetime.utcnow() - timedelta(hours=1),
+        )
+        db_session.add_all([
+            running,
+            EvalRun(task_id=eval_task.id, run_number=2, status="COMPLETED"),
+        ])
+        await db_session.commit()
+
+        stream = EvalService(db_session).stream_evaluation(eval_task.id)
+        first = json.loads((await stream.__anext__())[len("data: "):])
+        await stream.aclose()
+
+        assert first == {"type": "run_created", "run_id": running.id, "run_number": 1}
+
+
+@pytest.mark.asyncio
+class TestTaskContextLoading:
+    """Tests for eager loading of a run's task context."""
+
+    async def test_run_context_loads_in_one_query(self, db_session, eval_task, record_statements):
+        """Test that the run, task, case set, model and provider load together."""
+        run = EvalRun(task_id=eval_task.id, run_number=1)
+        db_session.add(run)
+        await db_session.commit()
+        db_session.expunge_all()
+
+        with record_statements() as statements:
+            loaded = await EvalService(db_session)._get_run_with_task(run.id)
+            row = EvalService._task_context_row(loaded.task)
+
+        assert len(statements) == 1
+        assert row is not None
+        task, case_set, model, provider = row
+        assert provider.id == model.provider_id
+        with pytest.raises(InvalidRequestError):
+            case_set.cases
+
+    async def test_judge_models_load_in_one_query(self, db_session, eval_task, record_statements):
+        """Test that LLM judges share one model lookup however many are configured."""
+        judges = [
+            Evaluator(name=f"judge {i}", type="llm_judge", config={"model_id": eval_task.model_id})
+            for i in range(3)
+        ]
+        judges.append(Evaluator(name="orphan judge", type="llm_judge", config={"model_id": "missing"}))
+        db_session.add_all(judges)
+        await db_session.flush()
+        db_session.add_all(
+            TaskEvaluator(task_id=eval_task.id, evaluator_id=judge.id, order_index=i)
+            for i, judge in enumerate(judges)
+        )
+        await db_session.commit()
+
+        service = EvalService(db_session)
+        with record_statements() as statements:
+            loaded = await service._get_task_evaluators_with_clients(eval_task.id)
+
+        assert len(statements) == 2
+        assert [name for _, _, name in loaded] == ["judge 0", "judge 1", "judge 2"]
+        # Judges on the same model share one client
+        assert len({id(client) for _, client, _ in loaded}) == 1
@@ -76,7 +76,7 @@ class TestEvaluatorService:
         assert evaluator.name == "test_llm_judge"
         assert evaluator.type == "llm_judge"
         assert evaluator.is_system == 0
-        assert "prompt_template" in evaluator.config_dict
+        assert "prompt_template" in evaluator.config
 
     @pytest.mark.asyncio
     async def test_create_code_evaluator(
@@ -91,7 +91,7 @@ class TestEvaluatorService:
         assert evaluator.name == "test_code_evaluator"
         assert evaluator.type == "code"
         assert evaluator.is_system == 0
-        assert "code" in evaluator.config_dict
+        assert "code" in evaluator.config
 
     @pytest.mark.asyncio
     async def test_create_evaluator_missing_prompt_template(self, evaluator_service):
@@ -176,7 +176,7 @@ class TestEvaluatorService:
         )
 
         assert updated.description == "Updated description"
-        assert "New template" in updated.config_dict["prompt_template"]
+        assert "New template" in updated.config["prompt_template"]
 
     @pytest.mark.asyncio
     async def test_update_system_evaluator_fails(
@@ -191,7 +191,7 @@ class TestEvaluatorService:
             name="system_test_eval",
             description="System evaluator for testing",
             type="code",
-            config='{"code": "def evaluate(e,a): return {\\\"result\\\": \\\"passed\\\", \\\"reason\\\": \\\"\\\"}"}',
+            config={"code": 'def evaluate(e,a): return {"result": "passed", "reason": ""}'},
             is_system=1,
         )
         db_session.add(system_eval)
@@ -230,7 +230,7 @@ class TestEvaluatorService:
             name="system_test_eval2",
             description="System evaluator for testing",
             type="code",
-            config='{"code": "def evaluate(e,a): return {\\\"result\\\": \\\"passed\\\"}"}',
+            config={"code": 'def evaluate(e,a): return {"result": "passed"}'},
             is_system=1,
         )
         db_session.add(system_eval)
@@ -264,6 +264,7 @@ class TestEvaluatorService:
         db_session: AsyncSession,
         sample_llm_judge_create,
         sample_code_evaluator_create,
+        record_statements,
     ):
         """Test setting evaluators for a task."""
         from app.models.eval_task import EvalTask
@@ -321,6 +322,16 @@ class TestEvaluatorService:
         assert task_evaluators[0]["order_index"] == 0
         assert task_evaluators[1]["order_index"] == 1
 
+        # Evaluators are loaded with the task evaluators, not one query per row
+        db_session.expunge_all()
+        with record_statements() as statements:
+            await evaluator_service.get_task_evaluators(task.id)
+        assert len(statements) == 1
+
+        # Unknown evaluator ids are reported by id
+        with pytest.raises(ValueError, match="评估器不存在: missing-id"):
+            await evaluator_service.set_task_evaluators(task.id, [llm_eval.id, "missing-id"])
+
     @pytest.mark.asyncio
     async def test_get_default_evaluators(
         self,
@@ -333,14 +344,14 @@ class TestEvaluatorService:
             name="exact_match",
             description="Exact match evaluator",
             type="code",
-            config='{"code": "def evaluate(e,a): return {\\\"result\\\": \\\"passed\\\"}"}',
+            config={"code": 'def evaluate(e,a): return {"result": "passed"}'},
             is_system=1,
         )
         json_compare = Evaluator(
             name="json_compare",
             description="JSON compare evaluator",
             type="code",
-            config='{"code": "def evaluate(e,a): return {\\\"result\\\": \\\"passed\\\"}"}',
+            config={"code": 'def evaluate(e,a): return {"result": "passed"}'},
             is_system=1,
         )
         db_session.add(exact_match)
@@ -86,6 +86,14 @@ class TestJsonCompareEvaluator:
         passed, reason = evaluator.evaluate(expected, actual)
         assert passed is True
 
+    def test_json_match_key_order(self, evaluator):
+        """Test JSON match ignores key order."""
+        expected = '{"a": 1, "b": {"c": [1, 2], "d": null}}'
+        actual = '{"b": {"d": null, "c": [1, 2]}, "a": 1}'
+        passed, reason = evaluator.evaluate(expected, actual)
+        assert passed is True
+        assert reason == "JSON structures match"
+
     def test_json_value_mismatch(self, evaluator):
         """Test JSON value mismatch."""
         expected = '{"key": "value1"}'
@@ -126,6 +134,15 @@ class TestJsonCompareEvaluator:
         assert passed is False
         assert "Length mismatch" in reason
 
+    def test_nan_does_not_match_null(self, evaluator):
+        """Test that non-finite numbers are not mistaken for null."""
+        passed, reason = evaluator.evaluate('{"a": NaN}', '{"a": null}')
+        assert passed is False
+        assert "Type mismatch" in reason
+
+        passed, _ = evaluator.evaluate('{"a": null}', '{"a": Infinity}')
+        assert passed is False
+
     def test_parse_json_from_code_block(self, evaluator):
         """Test parsing JSON from markdown code block."""
         expected = '{"key": "value"}'
@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 
 from app.services.excel_service import ExcelParseError, ExcelService
-from app.schemas.cases import CaseSetCreate
+from app.schemas.cases import CaseSetCreate, TestCaseCreate as CaseCreate
 
 
 class TestExcelService:
@@ -84,6 +84,19 @@ class TestExcelService:
         assert cases[0].user_input == "input1"
         assert cases[1].user_input == "input3"
 
+    def test_parse_test_cases_strips_and_converts_cells(self, excel_service):
+        """Test that cells are stripped, stringified and blanks become None."""
+        df = pd.DataFrame({
+            "用例编号": [1, 2],
+            "用户输入": ["  input1 ", "   "],
+            "预期输出": ["   ", "output2"],
+        })
+        cases = excel_service._parse_test_cases(df, "test-set-id")
+        assert len(cases) == 1
+        assert cases[0].case_uid == "1"
+        assert cases[0].user_input == "input1"
+        assert cases[0].expected_output is None
+
     def test_parse_test_cases_missing_required_column(self, excel_service):
         """Test parsing with missing required column."""
         df = pd.DataFrame({
@@ -122,11 +135,75 @@ class TestExcelService:
         output.seek(0)
         content = output.read()
 
-        case_set, cases = await excel_service.import_excel(content, "test.xlsx")
+        case_set, cases_created = await excel_service.import_excel(content, "test.xlsx")
         assert case_set.name == "测试集"
-        assert case_set.system_prompt == "You are helpful"
-        assert len(cases) == 2
-        assert cases[0].case_uid == "CASE-001"
+        assert cases_created == 2
+        cases = await excel_service.case_service.get_test_cases(case_set.id)
+        assert sorted(c.case_uid for c in cases) == ["CASE-001", "CASE-002"]
+
+    @pytest.mark.asyncio
+    async def test_import_excel_rejects_repeated_case_uid(self, excel_service):
+        """Test that a new set import reports the row of a repeated case_uid."""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["用例集名称", "用例编号", "用户输入"])
+        sheet.append(["测试集", None, "测试集名称"])
+        sheet.append([None, "CASE-001", "input1"])
+        sheet.append([None, "CASE-002", "input2"])
+        sheet.append([None, "CASE-001", "input3"])
+        output = io.BytesIO()
+        workbook.save(output)
+
+        with pytest.raises(ExcelParseError) as exc_info:
+            await excel_service.import_excel(output.getvalue(), "test.xlsx")
+        assert exc_info.value.row == 5
+        assert "CASE-001" in str(exc_info.value)
+        assert isinstance(exc_info.value, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_import_to_set_reads_all_rows(self, excel_service):
+        """Test that importing into a set reads every row after the header."""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["用例编号", "用户输入", "预期输出"])
+        sheet.append([1, " input1 ", "output1"])
+        sheet.append([None, None, None])
+        sheet.append([2, "input2"])
+        output = io.BytesIO()
+        workbook.save(output)
+
+        case_set = await excel_service.case_service.create_case_set(CaseSetCreate(name="测试集"))
+        cases = await excel_service.import_to_set(output.getvalue(), case_set)
+
+        assert [(c.case_uid, c.user_input, c.expected_output) for c in cases] == [
+            ("1", "input1", "output1"),
+            ("2", "input2", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_export_round_trips_through_import(self, excel_service):
+        """Test that an exported workbook imports back into the same cases."""
+        source = await excel_service.case_service.create_case_set(CaseSetCreate(name="源用例集"))
+        await excel_service.case_service.create_test_cases_batch([
+            CaseCreate(set_id=source.id, case_uid="CASE-001", user_input="input1", expected_output="output1"),
+            CaseCreate(set_id=source.id, user_input="input2", description="测试2"),
+        ])
+
+        content = await excel_service.export_excel(source.id)
+        target = await excel_service.case_service.create_case_set(CaseSetCreate(name="目标用例集"))
+        cases = await excel_service.import_to_set(content, target)
+
+        assert sorted(
+            ((c.case_uid, c.description, c.user_input, c.expected_output) for c in cases),
+            key=lambda row: row[2],
+        ) == [
+            ("CASE-001", None, "input1", "output1"),
+            (None, "测试2", "input2", None),
+        ]
 
     @pytest.mark.asyncio
     async def test_import_excel_invalid_extension(self, excel_service):
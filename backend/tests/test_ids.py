@@ -0,0 +1,52 @@
+"""Tests for identifier generation."""
+
+import time
+import uuid
+
+from app.utils.ids import new_id, new_ids, uuid7
+
+
+class TestUuid7:
+    """Tests for uuid7 and new_id."""
+
+    def test_version_and_variant(self):
+        """Test generated ids are RFC 4122 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_timestamp(self):
+        """Test the top 48 bits carry the current time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_time_ordered(self):
+        """Test ids from different milliseconds sort by creation time."""
+        first = new_id()
+        time.sleep(0.002)
+        second = new_id()
+        assert first < second
+
+    def test_new_id_format(self):
+        """Test new_id returns a canonical UUID string."""
+        value = new_id()
+        assert len(value) == 36
+        assert str(uuid.UUID(value)) == value
+
+    def test_unique(self):
+        """Test ids are unique."""
+        assert len({new_id() for _ in range(1000)}) == 1000
+
+    def test_new_ids_batch(self):
+        """Test batch generation returns unique version 7 ids."""
+        values = new_ids(500)
+        assert len(values) == 500
+        assert len(set(values)) == 500
+        assert all(uuid.UUID(v).version == 7 for v in values)
+        assert values == sorted(values)
+
+    def test_new_ids_empty(self):
+        """Test batch generation with zero count."""
+        assert new_ids(0) == []
@@ -38,6 +38,12 @@ class TestJsonRepair:
         assert '"name"' in result
         assert '"test"' in result
 
+    def test_repair_single_quotes_with_inner_double_quotes(self):
+        """Double quotes inside single-quoted strings are escaped; double-quoted strings are kept."""
+        json_str = """{'quote': 'say "hi"', "text": "it's"}"""
+        result = JsonRepair.repair_and_parse(json_str)
+        assert result == {"quote": 'say "hi"', "text": "it's"}
+
     def test_repair_unquoted_keys(self):
         """Repair unquoted property names."""
         json_str = '{name: "test", value: 123}'
@@ -135,3 +135,28 @@ class TestTemplateRenderer:
         context = {"name": "World"}
         result = renderer.render_template_string("Hello ${name}", context)
         assert result == "Hello World"
+
+    def test_compile_request_template_matches_render(self, renderer):
+        """Test a compiled template renders like render_request_template for each context."""
+        template = {
+            "model": "${model_name}",
+            "temperature": 0.1,
+            "messages": [
+                {"role": "system", "content": "${system_prompt}"},
+                {"role": "user", "content": "Q: ${case.user_input} (${case.case_uid})"},
+            ],
+        }
+        compiled = renderer.compile_request_template(template)
+
+        for user_input in ["Hello", 'Say "Hi"', "Line1\nLine2", ""]:
+            context = {
+                "model_name": "gpt-4",
+                "system_prompt": "You are helpful",
+                "case": {"user_input": user_input, "case_uid": None},
+            }
+            assert compiled(context) == renderer.render_request_template(template, context)
+
+    def test_compile_request_template_invalid_input(self, renderer):
+        """Test compiling an invalid template input."""
+        with pytest.raises(ValueError):
+            renderer.compile_request_template("not a dict")
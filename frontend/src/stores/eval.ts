@@ -189,6 +189,38 @@ export const useEvalStore = defineStore('eval', () => {
     // Track the current run ID for this evaluation
     let currentRunId: string | null = null
 
+    // Apply one case result from a 'result' or 'results_batch' frame; returns its run_id
+    const applyResult = (item: any): string => {
+      progress.value = {
+        // Results arrive as cases finish, so progress follows the completed count
+        current: item.completed || item.index || 0,
+        total: item.total || 0,
+      }
+      // Store result by run_id, so results are accumulated even if user switches to another run
+      const runId = item.run_id
+      if (!resultsByRunId.value[runId]) {
+        resultsByRunId.value[runId] = []
+      }
+      const result: EvalResult = {
+        id: item.case_id,
+        run_id: runId,
+        task_id: taskId,
+        case_id: item.case_id,
+        case_uid: item.case_uid || null,
+        actual_output: item.actual_output,
+        is_passed: item.is_passed,
+        execution_error: item.execution_error || null,
+        evaluator_logs: item.evaluator_logs || [],
+        execution_duration: item.execution_duration || null,
+        skill_tokens: item.skill_tokens || null,
+        evaluator_tokens: item.evaluator_tokens || null,
+        created_at: new Date().toISOString(),
+      }
+      resultsByRunId.value[runId].push(result)
+      console.log('[WS] Result added for run:', runId, 'currentRun:', currentRun.value?.id, 'results count:', resultsByRunId.value[runId].length)
+      return runId
+    }
+
     // First, connect to WebSocket
     const ws = evalApi.connectEvaluationWebSocket(
       taskId,
@@ -220,35 +252,15 @@ export const useEvalStore = defineStore('eval', () => {
             // Fetch the new run's full info (including status)
             fetchEvalRun(runId)
           })
-        } else if (data.type === 'result') {
-          progress.value = {
-            current: data.data.index || 0,
-            total: data.data.total || 0,
-          }
-          // Store result by run_id, so results are accumulated even if user switches to another run
-          const runId = data.data.run_id
-          if (!resultsByRunId.value[runId]) {
-            resultsByRunId.value[runId] = []
-          }
-          const result: EvalResult = {
-            id: data.data.case_id,
-            run_id: runId,
-            task_id: taskId,
-            case_id: data.data.case_id,
-            case_uid: data.data.case_uid || null,
-            actual_output: data.data.actual_output,
-            is_passed: data.data.is_passed,
-            execution_error: data.data.execution_error || null,
-            evaluator_logs: data.data.evaluator_logs || [],
-            execution_duration: data.data.execution_duration || null,
-            skill_tokens: data.data.skill_tokens || null,
-            evaluator_tokens: data.data.evaluator_tokens || null,
-            created_at: new Date().toISOString(),
+        } else if (data.type === 'result' || data.type === 'results_batch') {
+          // Concurrent cases that finish together arrive as one batch frame
+          const items = data.type === 'result' ? [data.data] : data.data.items
+          let runId = ''
+          for (const item of items) {
+            runId = applyResult(item)
           }
-          resultsByRunId.value[runId].push(result)
-          console.log('[WS] Result added for run:', runId, 'currentRun:', currentRun.value?.id, 'results count:', resultsByRunId.value[runId].length)
           // If this is the currently selected run, update displayed results
-          if (runId === currentRun.value?.id) {
+          if (runId && runId === currentRun.value?.id) {
             console.log('[WS] Updating evalResults for current run, count:', resultsByRunId.value[runId].length)
             evalResults.value = [...resultsByRunId.value[runId]]
           }